@@ -0,0 +1,83 @@
+"""
+Compares the cost of computing the attributes drawn for classes whose instance attributes shadow static ones:
+- by copying the attributes, sorting them and removing the duplicated ones from the copy (former implementation: the
+  exporter modified the classes, the generator gave it copies of the attribute lists)
+- by computing a de-duplicated and sorted view of the attributes, leaving the class unchanged (current implementation)
+
+.. code-block:: sh
+
+    python -m benchmarks.attributes_deduplication
+"""
+
+from copy import copy
+from dataclasses import replace
+from timeit import timeit
+from typing import List
+
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.export.puml import get_puml_attributes
+
+CLASSES_COUNT = 200
+ATTRIBUTES_PER_CLASS = (10, 100, 1_000)
+REPETITIONS = 5
+
+
+def remove_duplicated_attrs_with_list_remove(uml_class: UmlClass):
+    static_attrs = [attr.name for attr in uml_class.attributes if attr.static]
+    for attr in copy(uml_class.attributes):
+        if not attr.static and attr.name in static_attrs:
+            uml_class.attributes.remove(attr)
+
+
+def get_puml_attributes_from_a_copy(uml_class: UmlClass, sort_members: bool) -> List[UmlAttribute]:
+    uml_class = replace(uml_class, attributes=list(uml_class.attributes))
+    if sort_members:
+        uml_class.attributes.sort(key=lambda attr: attr.name.lower())
+    remove_duplicated_attrs_with_list_remove(uml_class)
+    return uml_class.attributes
+
+
+def build_classes(attributes_count: int) -> List[UmlClass]:
+    # one attribute out of ten is static, and shadowed by an instance attribute of the same name
+    return [
+        UmlClass(
+            f'Class{class_index}',
+            f'synthetic.Class{class_index}',
+            [
+                UmlAttribute(f'attribute_{attribute_index // 2}', 'str', attribute_index % 20 == 0)
+                if attribute_index % 20 < 2
+                else UmlAttribute(f'attribute_{attribute_index}', 'str', False)
+                for attribute_index in range(attributes_count)
+            ],
+        )
+        for class_index in range(CLASSES_COUNT)
+    ]
+
+
+if __name__ == '__main__':
+    print(f'attributes drawn for {CLASSES_COUNT} classes, computed {REPETITIONS} times')
+    for attributes_count in ATTRIBUTES_PER_CLASS:
+        uml_classes = build_classes(attributes_count)
+        for sort_members in (False, True):
+            assert all(
+                get_puml_attributes(uml_class, sort_members) == get_puml_attributes_from_a_copy(uml_class, sort_members)
+                for uml_class in uml_classes
+            ), 'both implementations must draw the same attributes'
+
+            copy_duration = timeit(
+                lambda sort_members=sort_members, uml_classes=uml_classes: [
+                    get_puml_attributes_from_a_copy(uml_class, sort_members) for uml_class in uml_classes
+                ],
+                number=REPETITIONS,
+            )
+            view_duration = timeit(
+                lambda sort_members=sort_members, uml_classes=uml_classes: [
+                    get_puml_attributes(uml_class, sort_members) for uml_class in uml_classes
+                ],
+                number=REPETITIONS,
+            )
+            print(
+                f'- {attributes_count} attributes per class{", sorted" if sort_members else ""}: '
+                f'copy and list.remove {copy_duration:.3f}s, view {view_duration:.3f}s '
+                f'(x{copy_duration / view_duration:.1f})'
+            )
@@ -0,0 +1,66 @@
+"""
+Measures the import time of the modules loaded by the CLI once the interpreter has started, with the
+-X importtime option of Python:
+- when displaying the version or the help (the inspection modules must not be imported)
+- when inspecting the pyaas2puml domain
+- when loading the pyaas2puml domain from an up-to-date snapshot (the inspection modules must not be imported)
+
+The import regressions are checked by the tests of the CLI (tests/py2puml/test_cli.py).
+
+.. code-block:: sh
+
+    python -m benchmarks.cli_import_time
+"""
+
+from statistics import median
+from subprocess import PIPE, run
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Tuple
+
+REPETITIONS = 10
+
+
+def measure_cli_imports(cli_arguments: List[str]) -> Tuple[int, Dict[str, int]]:
+    """
+    Returns the total import time (in microseconds) of the modules imported by the CLI after the interpreter startup,
+    and the self import time of each of these modules
+    """
+    command = [executable, '-X', 'importtime', '-m', 'pyaas2puml'] + cli_arguments
+    import_time_report = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stderr.splitlines()
+    self_times_by_module: Dict[str, int] = {}
+    top_level_total = 0
+    is_after_site = False
+    for report_line in import_time_report:
+        if not report_line.startswith('import time:') or report_line.endswith('imported package'):
+            continue
+        self_time, cumulative_time, module = report_line.removeprefix('import time:').split('|')
+        if is_after_site:
+            self_times_by_module[module.strip()] = int(self_time)
+            # the top-level modules (not indented) cumulate the import times of their dependencies
+            if not module.startswith('  '):
+                top_level_total += int(cumulative_time)
+        is_after_site = is_after_site or module.strip() == 'site'
+
+    return top_level_total, self_times_by_module
+
+
+def benchmark(label: str, cli_arguments: List[str]):
+    measures = [measure_cli_imports(cli_arguments) for _ in range(REPETITIONS)]
+    total_import_time = median(total for total, _ in measures)
+    _, self_times_by_module = measures[-1]
+    slowest_modules = sorted(self_times_by_module.items(), key=lambda module_time: module_time[1], reverse=True)[:5]
+    print(f'- {label}: {total_import_time / 1000:.1f}ms, {len(self_times_by_module)} modules imported')
+    print('  slowest: ' + ', '.join(f'{module} ({self_time / 1000:.1f}ms)' for module, self_time in slowest_modules))
+
+
+if __name__ == '__main__':
+    print(f'median import times of the CLI over {REPETITIONS} runs (after the interpreter startup)')
+    benchmark('--version', ['--version'])
+    benchmark('--help', ['--help'])
+    with TemporaryDirectory() as snapshot_folder:
+        domain_arguments = ['pyaas2puml/domain', 'pyaas2puml.domain']
+        benchmark('domain inspection', domain_arguments)
+        snapshot_arguments = domain_arguments + ['--snapshot', f'{snapshot_folder}/domain.snapshot']
+        measure_cli_imports(snapshot_arguments)
+        benchmark('domain snapshot', snapshot_arguments)
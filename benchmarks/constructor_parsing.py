@@ -0,0 +1,165 @@
+"""
+Compares the cost of parsing synthetic constructors of hundreds of statements with the ConstructorVisitor:
+- with the variables namespace as a dictionary, the expressions and nested definitions left unbrowsed and the source
+  lines split once for all the annotations (current implementation)
+- with the variables namespace as a list scanned antichronologically, an AssignedVariablesCollector visiting each
+  assignment target and ast.get_source_segment splitting the source for each annotation (former implementation)
+
+The types are resolved in a module defining only the types used by the constructors, so that the durations measure
+the visit of the constructors rather than the resolution of the types.
+
+.. code-block:: sh
+
+    python -m benchmarks.constructor_parsing
+"""
+
+from ast import AnnAssign, Assign, FunctionDef, Name, NodeVisitor, expr, get_source_segment, parse
+from timeit import timeit
+from types import ModuleType
+from typing import Dict, List
+
+from pyaas2puml.domain.umlclass import UmlAttribute
+from pyaas2puml.parsing.astvisitors import (
+    AssignedVariablesCollector,
+    ConstructorVisitor,
+    SignatureVariablesCollector,
+    Variable,
+)
+from pyaas2puml.parsing.moduleresolver import ModuleResolver
+
+STATEMENTS_BLOCKS_COUNTS = (25, 100, 400)
+REPETITIONS = 5
+
+
+class ListNamespaceConstructorVisitor(ConstructorVisitor):
+    def get_source_segment(self, node: expr) -> str:
+        return get_source_segment(self.constructor_source, node)
+
+    def get_from_namespace(self, variable_id: str) -> Variable:
+        return next(
+            (variable for variable in self.variables_namespace[::-1] if variable.id == variable_id),
+            None,
+        )
+
+    def generic_visit(self, node):
+        NodeVisitor.generic_visit(self, node)
+
+    def visit_FunctionDef(self, node: FunctionDef):
+        if node.name == '__init__':
+            variables_collector = SignatureVariablesCollector(self.constructor_source)
+            variables_collector.visit(node)
+            self.class_self_id: str = variables_collector.class_self_id
+            self.variables_namespace = variables_collector.variables
+
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node):
+        self.generic_visit(node)
+
+    def visit_Lambda(self, node):
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node):
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: AnnAssign):
+        variables_collector = AssignedVariablesCollector(self.class_self_id, node.annotation)
+        variables_collector.visit(node.target)
+
+        short_type, full_namespaced_definitions = self.derive_type_annotation_details(node.annotation)
+        for variable in variables_collector.self_attributes:
+            self.uml_attributes.append(UmlAttribute(variable.id, short_type, static=False))
+            self.extend_relations(full_namespaced_definitions)
+
+        self.variables_namespace.extend(variables_collector.variables)
+
+    def visit_Assign(self, node: Assign):
+        for assigned_target in node.targets:
+            variables_collector = AssignedVariablesCollector(self.class_self_id, None)
+            variables_collector.visit(assigned_target)
+
+            if (len(variables_collector.self_attributes) == 1) and (isinstance(node.value, Name)):
+                assigned_variable = self.get_from_namespace(node.value.id)
+                if assigned_variable is not None:
+                    short_type, full_namespaced_definitions = self.derive_type_annotation_details(
+                        assigned_variable.type_expr
+                    )
+                    self.uml_attributes.append(
+                        UmlAttribute(variables_collector.self_attributes[0].id, short_type, False)
+                    )
+                    self.extend_relations(full_namespaced_definitions)
+
+            else:
+                for variable in variables_collector.self_attributes:
+                    short_type, full_namespaced_definitions = self.derive_type_annotation_details(variable.type_expr)
+                    self.uml_attributes.append(UmlAttribute(variable.id, short_type, static=False))
+                    self.extend_relations(full_namespaced_definitions)
+
+            self.variables_namespace.extend(variables_collector.variables)
+
+
+def build_constructor_source(blocks_count: int) -> str:
+    """
+    Builds a constructor whose blocks of statements declare typed variables, assign them to attributes of self, call
+    functions and branch on conditions (about 8 statements per block)
+    """
+    constructor_lines = ['def __init__(self, size: int, names: List[str], weights: Dict[str, float]):']
+    for block_index in range(blocks_count):
+        constructor_lines.extend(
+            [
+                f'    count_{block_index}: int = len(names) + {block_index}',
+                f'    self.count_{block_index} = count_{block_index}',
+                f'    label_{block_index}, ratio_{block_index} = names[0], weights.get(names[0], 1.0) * size',
+                f'    self.label_{block_index}: str = label_{block_index}.upper()',
+                f'    print(sorted(weights.items(), key=lambda item: (item[1], item[0]))[{block_index} % size])',
+                f'    if ratio_{block_index} > {block_index}:',
+                f'        self.ratios_{block_index}: List[float] = [ratio_{block_index}, size / (1 + {block_index})]',
+                '        self.size = size',
+            ]
+        )
+
+    return '\n'.join(constructor_lines) + '\n'
+
+
+def build_types_module() -> ModuleType:
+    types_module = ModuleType('synthetic')
+    for type_name, type_definition in (('int', int), ('str', str), ('float', float), ('List', List), ('Dict', Dict)):
+        setattr(types_module, type_name, type_definition)
+
+    return types_module
+
+
+def parse_constructor(constructor_source: str, visitor_class) -> List[UmlAttribute]:
+    visitor = visitor_class(constructor_source, 'Synthetic', 'benchmarks', ModuleResolver(TYPES_MODULE))
+    visitor.visit(parse(constructor_source))
+    return visitor.uml_attributes
+
+
+TYPES_MODULE = build_types_module()
+
+
+if __name__ == '__main__':
+    for statements_blocks_count in STATEMENTS_BLOCKS_COUNTS:
+        synthetic_constructor_source = build_constructor_source(statements_blocks_count)
+        assert parse_constructor(synthetic_constructor_source, ConstructorVisitor) == parse_constructor(
+            synthetic_constructor_source, ListNamespaceConstructorVisitor
+        ), 'both implementations must detect the same attributes'
+
+        list_namespace_duration = timeit(
+            lambda synthetic_constructor_source=synthetic_constructor_source: parse_constructor(
+                synthetic_constructor_source, ListNamespaceConstructorVisitor
+            ),
+            number=REPETITIONS,
+        )
+        dict_namespace_duration = timeit(
+            lambda synthetic_constructor_source=synthetic_constructor_source: parse_constructor(
+                synthetic_constructor_source, ConstructorVisitor
+            ),
+            number=REPETITIONS,
+        )
+
+        statements_count = synthetic_constructor_source.count('\n') - 1
+        print(f'constructor of {statements_count} statements parsed {REPETITIONS} times')
+        print(f'- with a list namespace: {list_namespace_duration:.3f}s')
+        print(f'- with a dict namespace: {dict_namespace_duration:.3f}s')
+        print(f'speedup: x{list_namespace_duration / dict_namespace_duration:.1f}')
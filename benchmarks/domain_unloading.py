@@ -0,0 +1,78 @@
+"""
+Reports the memory retained (traced with tracemalloc) by the generator of the aas-core-meta diagrams:
+- when the domain modules stay imported once the domain is inspected (the default)
+- when the generator unloads the domain modules and releases their parsed sources, with the class types of the
+  inspected classes
+
+Each measure runs in its own interpreter, so that the domain modules are imported by the measured inspection.
+Requires the aas-core-meta package:
+
+.. code-block:: sh
+
+    python -m benchmarks.domain_unloading
+"""
+
+from gc import collect
+from hashlib import sha256
+from importlib.util import find_spec
+from subprocess import PIPE, run
+from sys import argv, executable
+from tracemalloc import get_traced_memory, start
+from typing import Dict, List, Tuple
+
+DOMAIN_MODULE = 'aas_core_meta'
+DOMAIN_SUBMODULES = ['v3_1']
+
+SCENARIOS: Dict[str, str] = {
+    'imported': 'domain modules kept imported',
+    'unloaded': 'domain modules unloaded',
+}
+
+
+def measure_retained_memory(scenario: str) -> Tuple[int, str]:
+    """
+    Returns the memory retained by the generator of the given scenario (in bytes), with the hash of the diagram drawing
+    all the classes
+    """
+    domain_path = find_spec(DOMAIN_MODULE).submodule_search_locations[0]
+    start()
+    # the modules of pyaas2puml are imported before the measure
+    from pyaas2puml.inspection.inspectpackage import inspect_package  # noqa: F401
+    from pyaas2puml.pyaas2puml import AasPumlGenerator
+
+    collect()
+    memory_before, _ = get_traced_memory()
+    generator = AasPumlGenerator(
+        domain_path, DOMAIN_MODULE, DOMAIN_SUBMODULES, unload_domain_modules=scenario == 'unloaded'
+    )
+    puml_hash = sha256(generator.generate_puml().encode('utf8')).hexdigest()
+    # the fragments and indexes of the rendered diagram are not part of the model
+    generator.invalidate()
+
+    collect()
+    memory_after, _ = get_traced_memory()
+
+    return memory_after - memory_before, puml_hash
+
+
+def run_scenario(scenario: str) -> Tuple[int, str]:
+    command = [executable, '-m', 'benchmarks.domain_unloading', scenario]
+    retained_memory, puml_hash = run(command, stdout=PIPE, text=True, check=True).stdout.split()
+    return int(retained_memory), puml_hash
+
+
+if __name__ == '__main__':
+    if len(argv) > 1:
+        retained_memory, puml_hash = measure_retained_memory(argv[1])
+        print(retained_memory, puml_hash)
+    else:
+        print('memory retained by the generator of the aas-core-meta diagrams')
+        measures: List[Tuple[str, int, str]] = [
+            (label, *run_scenario(scenario)) for scenario, label in SCENARIOS.items()
+        ]
+        reference_memory = measures[0][1]
+        for label, retained_memory, _ in measures:
+            print(f'- {label}: {retained_memory / 1024 / 1024:.1f}MiB ({retained_memory / reference_memory:.0%})')
+
+        puml_hashes = {puml_hash for _, _, puml_hash in measures}
+        assert len(puml_hashes) == 1, 'unloading the domain modules must not change the diagrams'
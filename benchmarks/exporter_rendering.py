@@ -0,0 +1,123 @@
+"""
+Compares the cost of exporting a synthetic model of 10k classes and enums to PlantUML contents:
+- with the str.format templates rendering each line (former implementation)
+- with the blocks of lines rendered per item (current implementation)
+
+.. code-block:: sh
+
+    python -m benchmarks.exporter_rendering
+"""
+
+from timeit import timeit
+from typing import Iterable, List, Tuple
+
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.domain.umlenum import Member, UmlEnum
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.export.puml import (
+    FEATURE_INSTANCE,
+    FEATURE_STATIC,
+    PUML_FILE_END,
+    PUML_FILE_START,
+    PUML_ITEM_END,
+    remove_duplicated_attrs,
+    to_puml_content,
+)
+
+CLASSES_COUNT = 9_000
+ENUMS_COUNT = 1_000
+ATTRIBUTES_PER_CLASS = 8
+REPETITIONS = 5
+
+PUML_ITEM_START_TPL = """{item_type} {item_fqn}{generics} {{
+"""
+PUML_ATTR_TPL = """  {visibility}{attr_name}: {attr_type}{staticity}
+"""
+PUML_RELATION_TPL = """{source_fqn} {source_cardinality}{rel_type}{target_cardinality} {target_fqn}{label}
+"""
+
+
+def templated_to_puml_content(
+    diagram_name: str, uml_items: List[UmlItem], uml_relations: List[UmlRelation], sort_members: bool = False
+) -> Iterable[str]:
+    yield PUML_FILE_START.format(diagram_name=diagram_name)
+    for uml_item in uml_items:
+        if isinstance(uml_item, UmlEnum):
+            yield PUML_ITEM_START_TPL.format(
+                item_type='enum', item_fqn=uml_item.fqn, generics=f'<{uml_item.generics}>' if uml_item.generics else ''
+            )
+            for member in uml_item.members:
+                yield PUML_ATTR_TPL.format(
+                    visibility='', attr_name=member.name, attr_type=member.value, staticity=FEATURE_STATIC
+                )
+            yield PUML_ITEM_END
+        else:
+            yield PUML_ITEM_START_TPL.format(
+                item_type='abstract class' if uml_item.is_abstract else 'class',
+                item_fqn=uml_item.fqn,
+                generics=f'<{uml_item.generics}>' if uml_item.generics else '',
+            )
+            remove_duplicated_attrs(uml_item)
+            for uml_attr in uml_item.attributes:
+                yield PUML_ATTR_TPL.format(
+                    visibility=uml_attr.visibility,
+                    attr_name=uml_attr.name,
+                    attr_type=uml_attr.type,
+                    staticity=FEATURE_STATIC if uml_attr.static else FEATURE_INSTANCE,
+                )
+            yield PUML_ITEM_END
+
+    for uml_relation in sorted(uml_relations, key=lambda rel: rel.source_fqn.lower()):
+        yield PUML_RELATION_TPL.format(
+            source_fqn=uml_relation.source_fqn,
+            rel_type=uml_relation.type.value,
+            target_fqn=uml_relation.target_fqn,
+            label=f' : {uml_relation.label}' if uml_relation.label else '',
+            source_cardinality=f'"{uml_relation.source_cardinality}"' if uml_relation.source_cardinality else '',
+            target_cardinality=f'"{uml_relation.target_cardinality}"' if uml_relation.target_cardinality else '',
+        )
+    yield PUML_FILE_END
+
+
+def build_synthetic_model() -> Tuple[List[UmlItem], List[UmlRelation]]:
+    uml_items: List[UmlItem] = []
+    uml_relations: List[UmlRelation] = []
+    for class_index in range(CLASSES_COUNT):
+        class_fqn = f'synthetic.module{class_index % 50}.Class{class_index}'
+        attributes = [
+            UmlAttribute(f'attribute_{attribute_index}', 'Optional[List[Reference]]', attribute_index == 0)
+            for attribute_index in range(ATTRIBUTES_PER_CLASS)
+        ]
+        uml_items.append(UmlClass(f'Class{class_index}', class_fqn, attributes, is_abstract=class_index % 7 == 0))
+        if class_index > 0:
+            parent_fqn = f'synthetic.module{(class_index // 2) % 50}.Class{class_index // 2}'
+            uml_relations.append(UmlRelation(parent_fqn, class_fqn, RelType.INHERITANCE))
+            uml_relations.append(
+                UmlRelation(class_fqn, parent_fqn, RelType.REFERENCE, label='parent:ref', target_cardinality='0..1')
+            )
+    for enum_index in range(ENUMS_COUNT):
+        members = [Member(f'VALUE_{member_index}', str(member_index)) for member_index in range(5)]
+        uml_items.append(UmlEnum(f'Enum{enum_index}', f'synthetic.enums.Enum{enum_index}', members))
+
+    return uml_items, uml_relations
+
+
+if __name__ == '__main__':
+    synthetic_items, synthetic_relations = build_synthetic_model()
+    assert ''.join(to_puml_content('synthetic', synthetic_items, synthetic_relations)) == ''.join(
+        templated_to_puml_content('synthetic', synthetic_items, synthetic_relations)
+    ), 'both implementations must render the same contents'
+
+    templated_duration = timeit(
+        lambda: ''.join(templated_to_puml_content('synthetic', synthetic_items, synthetic_relations)),
+        number=REPETITIONS,
+    )
+    block_duration = timeit(
+        lambda: ''.join(to_puml_content('synthetic', synthetic_items, synthetic_relations)), number=REPETITIONS
+    )
+
+    print(f'{len(synthetic_items)} items and {len(synthetic_relations)} relations exported {REPETITIONS} times')
+    print(f'- with str.format templates: {templated_duration:.3f}s')
+    print(f'- with blocks per item:      {block_duration:.3f}s')
+    print(f'speedup: x{templated_duration / block_duration:.1f}')
@@ -0,0 +1,76 @@
+"""
+Compares the cost of filtering the domain definitions of the aas-core-meta modules:
+- by reading the '__module__' attribute of the classes (current implementation)
+- by calling inspect.getmembers on the classes (former implementation)
+
+Requires the aas-core-meta package:
+
+.. code-block:: sh
+
+    python -m benchmarks.filter_domain_definitions
+"""
+
+from importlib import import_module
+from inspect import getmembers, isclass
+from pkgutil import iter_modules
+from timeit import timeit
+from types import ModuleType
+from typing import Iterable, List, Type
+
+import aas_core_meta
+
+from pyaas2puml.inspection.inspectmodule import filter_domain_definitions
+
+ROOT_MODULE_NAME = 'aas_core_meta'
+REPETITIONS = 20
+
+
+def filter_domain_definitions_with_getmembers(module: ModuleType, root_module_name: str) -> Iterable[Type]:
+    for definition_key in dir(module):
+        definition_type = getattr(module, definition_key)
+        if isclass(definition_type):
+            definition_members = getmembers(definition_type)
+            definition_module_member = next(
+                (
+                    member
+                    for member in definition_members
+                    if member[0] == '__module__' and member[1].startswith(root_module_name)
+                ),
+                None,
+            )
+            if definition_module_member is not None:
+                yield definition_type
+
+
+def import_aas_core_meta_modules() -> List[ModuleType]:
+    modules = []
+    for module_info in iter_modules(aas_core_meta.__path__, f'{ROOT_MODULE_NAME}.'):
+        try:
+            modules.append(import_module(module_info.name))
+        except Exception as error:  # some versions of the meta-model may not be importable
+            print(f'skipped {module_info.name}: {error}')
+
+    return modules
+
+
+def filter_all(modules: List[ModuleType], filter_function) -> int:
+    return sum(len(list(filter_function(module, ROOT_MODULE_NAME))) for module in modules)
+
+
+if __name__ == '__main__':
+    aas_core_meta_modules = import_aas_core_meta_modules()
+    assert filter_all(aas_core_meta_modules, filter_domain_definitions) == filter_all(
+        aas_core_meta_modules, filter_domain_definitions_with_getmembers
+    ), 'both implementations must find the same domain definitions'
+
+    getmembers_duration = timeit(
+        lambda: filter_all(aas_core_meta_modules, filter_domain_definitions_with_getmembers), number=REPETITIONS
+    )
+    module_attribute_duration = timeit(
+        lambda: filter_all(aas_core_meta_modules, filter_domain_definitions), number=REPETITIONS
+    )
+
+    print(f'{len(aas_core_meta_modules)} aas-core-meta modules filtered {REPETITIONS} times')
+    print(f'- with inspect.getmembers: {getmembers_duration:.3f}s')
+    print(f'- with __module__:         {module_attribute_duration:.3f}s')
+    print(f'speedup: x{getmembers_duration / module_attribute_duration:.1f}')
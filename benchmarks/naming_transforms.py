@@ -0,0 +1,104 @@
+"""
+Compares the cost of the naming transforms applied by the AAS normalisation passes on the identifiers
+of the aas-core-meta domain (item names and fqns, attribute names and types, relation ends and labels):
+- with uncompiled regular expressions and lambdas (former implementation)
+- with precompiled regular expressions
+- with precompiled regular expressions and the memo of the naming transforms
+
+Requires the aas-core-meta package:
+
+.. code-block:: sh
+
+    python -m benchmarks.naming_transforms
+"""
+
+import re
+from os.path import dirname
+from timeit import timeit
+from typing import Dict, List
+
+import aas_core_meta
+
+from pyaas2puml.domain.umlclass import UmlClass
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import UmlRelation
+from pyaas2puml.inspection.inspectpackage import inspect_package
+from pyaas2puml.utils import plural_attribute_to_singular, snake_to_camel
+
+DOMAIN_MODULE = 'aas_core_meta'
+DOMAIN_SUBMODULES = ['v3_1']
+REPETITIONS = 50
+
+
+def uncompiled_snake_to_camel(snake_str):
+    new_str = snake_str
+    if re.search(r'_([a-zA-Z0-9])([a-zA-Z0-9]+)', new_str):
+        new_str = re.sub(
+            r'_([a-zA-Z0-9])([a-zA-Z0-9]+)', lambda match: match.group(1).upper() + match.group(2).lower(), new_str
+        )
+        new_str = re.sub(
+            r'([A-Z])([A-Z]+)([0-9])', lambda match: match.group(1) + match.group(2).lower() + match.group(3), new_str
+        )
+        new_str = re.sub(
+            r'([A-Z])([A-Z]+)([A-Z])', lambda match: match.group(1) + match.group(2).lower() + match.group(3), new_str
+        )
+    return new_str
+
+
+def uncompiled_plural_attribute_to_singular(text):
+    return re.sub(r'([a-zA-Z]{2,})s$', r'\1', text)
+
+
+def collect_identifiers() -> List[str]:
+    domain_items_by_fqn: Dict[str, UmlItem] = {}
+    domain_relations: List[UmlRelation] = []
+    inspect_package(
+        dirname(aas_core_meta.__file__), DOMAIN_MODULE, domain_items_by_fqn, domain_relations, DOMAIN_SUBMODULES
+    )
+
+    identifiers = []
+    for item in domain_items_by_fqn.values():
+        identifiers.extend((item.name, item.fqn))
+        if isinstance(item, UmlClass):
+            for attr in item.attributes:
+                identifiers.append(attr.name)
+                if attr.type:
+                    identifiers.append(attr.type)
+    for relation in domain_relations:
+        identifiers.extend((relation.source_fqn, relation.target_fqn, relation.label))
+
+    return identifiers
+
+
+def transform_all(identifiers: List[str], to_camel_case, to_singular):
+    for identifier in identifiers:
+        to_singular(to_camel_case(identifier))
+
+
+if __name__ == '__main__':
+    aas_identifiers = collect_identifiers()
+    for aas_identifier in aas_identifiers:
+        assert snake_to_camel(aas_identifier) == uncompiled_snake_to_camel(aas_identifier)
+        assert plural_attribute_to_singular(aas_identifier) == uncompiled_plural_attribute_to_singular(aas_identifier)
+
+    durations = {
+        'uncompiled regular expressions': timeit(
+            lambda: transform_all(aas_identifiers, uncompiled_snake_to_camel, uncompiled_plural_attribute_to_singular),
+            number=REPETITIONS,
+        ),
+        'precompiled regular expressions': timeit(
+            lambda: transform_all(
+                aas_identifiers, snake_to_camel.__wrapped__, plural_attribute_to_singular.__wrapped__
+            ),
+            number=REPETITIONS,
+        ),
+        'precompiled and memoized': timeit(
+            lambda: transform_all(aas_identifiers, snake_to_camel, plural_attribute_to_singular),
+            number=REPETITIONS,
+        ),
+    }
+
+    print(f'{len(aas_identifiers)} aas-core-meta identifiers transformed {REPETITIONS} times')
+    reference_duration = durations['uncompiled regular expressions']
+    for label, duration in durations.items():
+        print(f'- {label}: {duration:.3f}s (x{reference_duration / duration:.1f})')
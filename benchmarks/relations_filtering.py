@@ -0,0 +1,82 @@
+"""
+Compares the cost of selecting the items and relations drawn in the diagrams generated by main.py:
+- by browsing all the relations of the domain for each diagram (former implementation)
+- by combining the bitsets of the relations of the kept items (current implementation, see relationsindex.py)
+
+The selections are measured on the aas-core-meta domain (the diagrams of main.py and one diagram per class) and on a
+synthetic domain of 10k items (one diagram per class for 500 classes). Requires the aas-core-meta package:
+
+.. code-block:: sh
+
+    python -m benchmarks.relations_filtering
+"""
+
+from timeit import timeit
+from typing import Dict, List, Tuple
+
+from benchmarks.exporter_rendering import build_synthetic_model
+from main import DOMAIN_MODULE, DOMAIN_PATH, DOMAIN_SUBMODULES, PUML_CLS_DIAGRAMS
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.pyaas2puml import AasPumlGenerator
+
+SYNTHETIC_SELECTIONS_COUNT = 500
+REPETITIONS = 5
+
+
+def filter_by_browsing_the_relations(
+    generator: AasPumlGenerator, domain_items_to_keep: List[str]
+) -> Tuple[Dict[str, UmlItem], List[UmlRelation]]:
+    domain_relations = generator.domain_relations
+    all_inheritances = [(rel.source_fqn, rel.target_fqn) for rel in domain_relations if rel.type == RelType.INHERITANCE]
+    kept_fqns = set(domain_items_to_keep)
+    domain_items = {fqn: item for fqn, item in generator.domain_items.items() if fqn in kept_fqns}
+    domain_relations = [
+        rel for rel in domain_relations if rel.source_fqn in domain_items and rel.target_fqn in domain_items
+    ]
+    remain_inheritances = [
+        (rel.source_fqn, rel.target_fqn) for rel in domain_relations if rel.type == RelType.INHERITANCE
+    ]
+    removed_inheritances = [inheritance for inheritance in all_inheritances if inheritance not in remain_inheritances]
+    generator._add_filtered_out_parent_classes_as_generics(domain_items, removed_inheritances)
+    # sorts the classes in the order of the items to keep
+    return {fqn: domain_items[fqn] for fqn in domain_items_to_keep if fqn in domain_items}, domain_relations
+
+
+def benchmark(label: str, generator: AasPumlGenerator, selections: List[List[str]]):
+    for selection in selections:
+        assert generator._handle_classes_and_relations_filtering(selection) == filter_by_browsing_the_relations(
+            generator, selection
+        ), 'both implementations must select the same items and relations'
+
+    browsing_duration = timeit(
+        lambda: [filter_by_browsing_the_relations(generator, selection) for selection in selections], number=REPETITIONS
+    )
+    bitsets_duration = timeit(
+        lambda: [generator._handle_classes_and_relations_filtering(selection) for selection in selections],
+        number=REPETITIONS,
+    )
+    print(
+        f'- {label} ({len(generator.domain_relations)} relations, {len(selections)} selections): '
+        f'browsing {browsing_duration:.3f}s, bitsets {bitsets_duration:.3f}s '
+        f'(x{browsing_duration / bitsets_duration:.1f})'
+    )
+
+
+if __name__ == '__main__':
+    print(f'selections of the items and relations of the diagrams, computed {REPETITIONS} times')
+    aas_generator = AasPumlGenerator(DOMAIN_PATH, DOMAIN_MODULE, DOMAIN_SUBMODULES)
+    benchmark('aas-core-meta', aas_generator, PUML_CLS_DIAGRAMS + [[fqn] for fqn in aas_generator.domain_items])
+
+    synthetic_items, synthetic_relations = build_synthetic_model()
+    synthetic_generator = AasPumlGenerator(
+        'synthetic',
+        'synthetic',
+        domain_items={uml_item.fqn: uml_item for uml_item in synthetic_items},
+        domain_relations=synthetic_relations,
+    )
+    benchmark(
+        'synthetic domain',
+        synthetic_generator,
+        [[uml_item.fqn] for uml_item in synthetic_items[:SYNTHETIC_SELECTIONS_COUNT]],
+    )
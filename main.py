@@ -1,11 +1,12 @@
 import os
-from copy import deepcopy
-from pathlib import Path
+import sys
+from argparse import ArgumentParser
 
 import aas_core_meta
 from aas_core_meta.v3_1 import *
+from pyaas2puml.export.sinks import CheckSink, open_sink
 from pyaas2puml.pyaas2puml import AasPumlGenerator
-from pyaas2puml.utils import classname, write_file, snake_to_kebab, camel_to_kebab, snake_to_camel
+from pyaas2puml.utils import classname, snake_to_kebab, camel_to_kebab, snake_to_camel
 
 PUML_CLS_DIAGRAMS = (
     (
@@ -70,43 +71,61 @@ DOMAIN_PATH = os.path.dirname(aas_core_meta.__file__)
 DOMAIN_MODULE = "aas_core_meta"
 DOMAIN_SUBMODULES = ["v3_1"]
 
+# the all-classes diagram is too large to be laid out by PlantUML: it is also split in diagrams of bounded size
+MAX_CLASSES_PER_PARTITION = 30
+
 START_NUM = 11
 SKIP_NUMS = [13, 22, 50, 53, 55, 56, 57, 59]
 
 if __name__ == '__main__':
-    output_path = Path('output')
-    output_path.mkdir(exist_ok=True)
-    basic_generator = AasPumlGenerator(DOMAIN_PATH, DOMAIN_MODULE, DOMAIN_SUBMODULES)
-    all_domain_items = basic_generator.domain_items
-    all_relations = basic_generator.domain_relations
+    argparser = ArgumentParser(description='Generate the PlantUML class diagrams of the aas-core-meta domain.')
+    argparser.add_argument('--output', type=str, default='output',
+                           help='the output directory, or a .zip, .tar, .tar.gz archive gathering the diagrams')
+    argparser.add_argument('--check', action='store_true',
+                           help='compare the generated diagrams with the ones of the output directory without writing '
+                                'them, exit with an error status if some of them are stale')
+    args = argparser.parse_args()
+    if args.check and not os.path.isdir(args.output):
+        argparser.error(f'the diagrams can only be checked in an existing output directory, not in {args.output}')
+
+    # the generator leaves its domain items unchanged: it is reused for all the diagrams. The domain modules are not
+    # needed once they are inspected
+    generator = AasPumlGenerator(DOMAIN_PATH, DOMAIN_MODULE, DOMAIN_SUBMODULES, unload_domain_modules=True)
+
+    # in check mode, only the report of the stale diagrams is printed
+    def log(*values):
+        if not args.check:
+            print(*values)
+
+    sink = CheckSink(args.output) if args.check else open_sink(args.output)
+    with sink:
+        log("Creating PlantUML files for each set of classes defined in PUML_CLS_DIAGRAMS")
+        offset = 0
+        for i, classes_in_diagram in enumerate(PUML_CLS_DIAGRAMS, START_NUM):
+            offset += 1 if i + offset in SKIP_NUMS else 0
+            i = i + offset
+            cls_diagr_file = f'{i}-{camel_to_kebab(classes_in_diagram[0].split(".")[-1])}.puml'
+            log(f"Creating PlantUML file for classes: {classes_in_diagram}")
+            puml_content: str = generator.generate_puml(classes_in_diagram)
+            sink.write(cls_diagr_file, puml_content)
 
-    print("Creating PlantUML files for each set of classes defined in PUML_CLS_DIAGRAMS")
-    offset = 0
-    for i, classes_in_diagram in enumerate(PUML_CLS_DIAGRAMS, START_NUM):
-        offset += 1 if i + offset in SKIP_NUMS else 0
-        i = i + offset
-        generator = AasPumlGenerator(DOMAIN_PATH, DOMAIN_MODULE, DOMAIN_SUBMODULES,
-                                     deepcopy(all_domain_items), deepcopy(all_relations))
-        cls_diagr_file = f'{i}-{camel_to_kebab(classes_in_diagram[0].split(".")[-1])}.puml'
-        cls_diagr_file = output_path / cls_diagr_file
-        print(f"Creating PlantUML file for classes: {classes_in_diagram}")
-        puml_content: str = generator.generate_puml(classes_in_diagram)
-        write_file(cls_diagr_file, puml_content)
+        log("Creating PlantUML file for all classes in the domain module")
+        sink.write(f'classes/{snake_to_kebab(DOMAIN_MODULE)}-all.puml', generator.generate_puml())
 
-    aas_classes_files = output_path / 'classes'
-    aas_classes_files.mkdir(exist_ok=True)
+        log("Creating partitioned PlantUML files for all classes in the domain module")
+        for i, (classes_in_partition, puml_content) in enumerate(
+                generator.generate_partitioned_pumls(MAX_CLASSES_PER_PARTITION), 1):
+            log(f"Creating PlantUML file for partition {i}: {classes_in_partition}")
+            sink.write(f'partitions/{snake_to_kebab(DOMAIN_MODULE)}-part-{i}.puml', puml_content)
 
-    print("Creating PlantUML file for all classes in the domain module")
-    aas_all_classes_file = aas_classes_files / f'{snake_to_kebab(DOMAIN_MODULE)}-all.puml'
-    generator = AasPumlGenerator(DOMAIN_PATH, DOMAIN_MODULE, DOMAIN_SUBMODULES,
-                                 deepcopy(all_domain_items), deepcopy(all_relations))
-    write_file(aas_all_classes_file, generator.generate_puml())
+        log("Creating PlantUML files for each class in the domain module")
+        for item in generator.domain_items:
+            log("Creating PlantUML file for class:", item)
+            cls_diagr_file = f'classes/{camel_to_kebab(item.split(".")[-1])}.puml'
+            puml_content: str = generator.generate_puml(domain_items_to_keep=[item],
+                                                        to_include_members_from_parents=True)
+            sink.write(cls_diagr_file, puml_content)
 
-    print("Creating PlantUML files for each class in the domain module")
-    for item in all_domain_items:
-        print("Creating PlantUML file for class:", item)
-        cls_diagr_file = aas_classes_files / f'{camel_to_kebab(item.split(".")[-1])}.puml'
-        generator = AasPumlGenerator(DOMAIN_PATH, DOMAIN_MODULE, DOMAIN_SUBMODULES,
-                                     deepcopy(all_domain_items), deepcopy(all_relations))
-        puml_content: str = generator.generate_puml(domain_items_to_keep=[item], to_include_members_from_parents=True)
-        write_file(cls_diagr_file, puml_content)
+    if args.check:
+        print(sink.get_report())
+        sys.exit(1 if sink.stale_files else 0)
@@ -1,8 +1,17 @@
+from collections import deque
+from difflib import unified_diff
 from io import StringIO
+from itertools import islice, zip_longest
 from pathlib import Path
-from typing import Iterable, List, Union
+from re import compile as re_compile
+from typing import Deque, Iterable, Iterator, List, Optional, Union
 
 from pyaas2puml.py2puml import py2puml
+from pyaas2puml.pyaas2puml import AasPumlGenerator
+
+# number of lines displayed before and after the first different line
+DIFF_CONTEXT_LINES = 3
+UNIFIED_DIFF_HUNK_HEADER = re_compile(r'^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@$')
 
 
 def assert_py2puml_is_file_content(domain_path: str, domain_module: str, diagram_filepath: Union[str, Path]):
@@ -11,6 +20,35 @@ def assert_py2puml_is_file_content(domain_path: str, domain_module: str, diagram
         assert_py2puml_is_stringio(domain_path, domain_module, expected_puml_file)
 
 
+def assert_puml_is_file_content(puml_content: Iterable[str], diagram_filepath: Union[str, Path]):
+    """
+    Compares already generated contents (from the inspected_models fixture, for example) with the existing class
+    diagram, read line by line
+    """
+    with open(diagram_filepath, 'r', encoding='utf8') as expected_puml_file:
+        assert_lines_stream(iter_lines_with_returns(puml_content), iter_lines_with_returns(expected_puml_file))
+
+
+def assert_pyaas2puml_is_file_content(
+    domain_path: str,
+    domain_module: str,
+    diagram_filepath: Union[str, Path],
+    domain_submodules: Optional[Iterable[str]] = None,
+    **generate_puml_kwargs,
+):
+    """
+    Compares the diagram generated by the AasPumlGenerator (see AasPumlGenerator.generate_puml for the options) with
+    the existing class diagram. Only the existing diagram is streamed line by line: generate_puml post-processes the
+    whole diagram, which is built in memory
+    """
+    generator = AasPumlGenerator(domain_path, domain_module, domain_submodules)
+    with open(diagram_filepath, 'r', encoding='utf8') as expected_puml_file:
+        assert_lines_stream(
+            iter_lines_with_returns(StringIO(generator.generate_puml(**generate_puml_kwargs))),
+            iter_lines_with_returns(expected_puml_file),
+        )
+
+
 def normalize_lines_with_returns(lines_with_returns: Iterable[str]) -> List[str]:
     """
     When comparing contents, each piece of contents can either be:
@@ -23,11 +61,80 @@ def normalize_lines_with_returns(lines_with_returns: Iterable[str]) -> List[str]
     return ''.join(lines_with_returns).split('\n')
 
 
+def iter_lines_with_returns(lines_with_returns: Iterable[str]) -> Iterator[str]:
+    """
+    Lazy version of normalize_lines_with_returns: yields the same lines while the pieces of contents are consumed
+    """
+    pending_pieces: List[str] = []
+    for piece in lines_with_returns:
+        if '\n' not in piece:
+            pending_pieces.append(piece)
+            continue
+
+        first_line, *lines, last_piece = piece.split('\n')
+        pending_pieces.append(first_line)
+        yield ''.join(pending_pieces)
+        yield from lines
+        pending_pieces = [last_piece]
+
+    yield ''.join(pending_pieces)
+
+
 def assert_py2puml_is_stringio(domain_path: str, domain_module: str, expected_content_stream: StringIO):
-    puml_content_lines = normalize_lines_with_returns(py2puml(domain_path, domain_module))
-    expected_content_lines = normalize_lines_with_returns(expected_content_stream)
+    assert_lines_stream(
+        iter_lines_with_returns(py2puml(domain_path, domain_module)), iter_lines_with_returns(expected_content_stream)
+    )
+
+
+def assert_lines_stream(
+    actual_lines: Iterable[str], expected_lines: Iterable[str], context_lines: int = DIFF_CONTEXT_LINES
+):
+    """
+    Compares the lines of the actual and expected contents as they are read, and stops at the first different line:
+    the assertion message is a unified diff of the lines around it (at most context_lines before and after)
+    """
+    actual_lines, expected_lines = iter(actual_lines), iter(expected_lines)
+    previous_lines: Deque[str] = deque(maxlen=context_lines)
+    missing_line = object()
+    mismatch_index = None
+    for line_index, (actual_line, expected_line) in enumerate(
+        zip_longest(actual_lines, expected_lines, fillvalue=missing_line)
+    ):
+        if actual_line != expected_line:
+            mismatch_index = line_index
+            break
+        previous_lines.append(actual_line)
+    else:
+        return
+
+    # reads the following lines of both contents, within the context bounds
+    actual_window = [*previous_lines, *([] if actual_line is missing_line else [actual_line])]
+    actual_window.extend(islice(actual_lines, context_lines))
+    expected_window = [*previous_lines, *([] if expected_line is missing_line else [expected_line])]
+    expected_window.extend(islice(expected_lines, context_lines))
+
+    window_offset = mismatch_index - len(previous_lines)
+    diff_lines = [
+        shift_hunk_header(diff_line, window_offset)
+        for diff_line in unified_diff(expected_window, actual_window, 'expected', 'actual', lineterm='')
+    ]
+    diff = '\n'.join(diff_lines)
+    raise AssertionError(f'actual and expected contents have changed at line {mismatch_index + 1}:\n{diff}')
+
+
+def shift_hunk_header(diff_line: str, line_offset: int) -> str:
+    """
+    Shifts the line numbers of the hunk header of a unified diff computed on a window of the compared contents
+    """
+    hunk_header_match = UNIFIED_DIFF_HUNK_HEADER.match(diff_line)
+    if hunk_header_match is None:
+        return diff_line
 
-    assert_multilines(puml_content_lines, expected_content_lines)
+    expected_start, expected_length, actual_start, actual_length = hunk_header_match.groups()
+    return (
+        f'@@ -{int(expected_start) + line_offset}{expected_length or ""} '
+        f'+{int(actual_start) + line_offset}{actual_length or ""} @@'
+    )
 
 
 def assert_multilines(actual_multilines: List[str], expected_multilines: List[str]):
@@ -3,9 +3,7 @@
 
 from argparse import ArgumentParser
 from pathlib import Path
-from sys import path
-
-from pyaas2puml.pyaas2puml import pyaas2puml
+from sys import path, stderr
 
 
 def run():
@@ -19,6 +17,48 @@ def run():
     argparser.add_argument('-v', '--version', action='version', version='pyaas2puml 0.9.1')
     argparser.add_argument('path', metavar='path', type=str, help='the filepath to the domain')
     argparser.add_argument('module', metavar='module', type=str, help='the module name of the domain', default=None)
+    argparser.add_argument(
+        '--snapshot',
+        metavar='snapshot',
+        type=str,
+        default=None,
+        help='the filepath to the snapshot of the domain model, used instead of inspecting the domain when it is '
+        'up-to-date with the domain sources, and refreshed otherwise',
+    )
+    argparser.add_argument(
+        '--output',
+        metavar='output',
+        type=str,
+        default=None,
+        help='the output directory, or the .zip, .tar or .tar.gz archive, in which the diagram is written '
+        '(named after the module) instead of being printed',
+    )
+    argparser.add_argument(
+        '--profile',
+        choices=['text', 'json'],
+        default=None,
+        help='prints on the standard error the import time, the imported modules and the inspection time of each '
+        'domain module, as a text report sorted by decreasing cost or as JSON',
+    )
 
     args = argparser.parse_args()
-    print(''.join(pyaas2puml(args.path, args.module)))
+    # imported once the arguments are parsed, so that the --version and --help options do not load the inspection
+    from pyaas2puml.pyaas2puml import pyaas2puml
+
+    inspection_profile = None
+    if args.profile is not None:
+        from pyaas2puml.inspection.profiling import InspectionProfile
+
+        inspection_profile = InspectionProfile()
+
+    puml_content = ''.join(pyaas2puml(args.path, args.module, args.snapshot, inspection_profile))
+    if inspection_profile is not None:
+        print(inspection_profile.get_report() if args.profile == 'text' else inspection_profile.to_json(), file=stderr)
+    if args.output is None:
+        print(puml_content)
+    else:
+        from pyaas2puml.export.sinks import is_archive, open_sink
+
+        # the manifest of an output directory would replace the one of the other diagrams written in it
+        with open_sink(args.output, with_manifest=is_archive(args.output)) as sink:
+            sink.write(f'{args.module}.puml', puml_content)
@@ -0,0 +1,79 @@
+"""
+Cache of the PlantUML fragments shared by the diagrams of a domain: the block of lines of each item and the line of
+each relation are rendered and post-processed once, the diagrams concatenate the cached fragments.
+
+The post-processing function is applied to each fragment instead of the whole content: it must only rewrite text
+within lines (a rewrite may end with the line break ending a fragment, but must not span over two lines).
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from pyaas2puml.domain.umlclass import UmlClass
+from pyaas2puml.domain.umlenum import UmlEnum
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.export.puml import (
+    PUML_FILE_END,
+    PUML_FILE_START,
+    render_puml_class,
+    render_puml_enum,
+    render_puml_relation,
+    sort_puml_relations,
+)
+
+RelationKey = Tuple[str, str, RelType, str, str, str]
+
+
+class PumlFragmentCache:
+    def __init__(self, post_process: Optional[Callable[[str], str]] = None):
+        self.post_process = post_process
+        self.file_start = self._post_process(PUML_FILE_START)
+        self.file_end = self._post_process(PUML_FILE_END)
+        self._item_fragments: Dict[Hashable, str] = {}
+        self._relation_fragments: Dict[RelationKey, str] = {}
+
+    def get_item_fragment(self, item_key: Hashable) -> Optional[str]:
+        """
+        Returns the fragment cached for the given key, None if the item was not rendered yet
+        """
+        return self._item_fragments.get(item_key)
+
+    def add_item_fragment(self, item_key: Hashable, uml_item: UmlItem, sort_members: bool = False) -> str:
+        """
+        Renders the item and caches its fragment. The key must identify the item and all the options changing its
+        rendering
+        """
+        if isinstance(uml_item, UmlEnum):
+            fragment = self._post_process(render_puml_enum(uml_item, sort_members))
+        elif isinstance(uml_item, UmlClass):
+            fragment = self._post_process(render_puml_class(uml_item, sort_members))
+        else:
+            raise TypeError(f'cannot process uml_item of type {uml_item.__class__}')
+
+        self._item_fragments[item_key] = fragment
+        return fragment
+
+    def get_relation_fragment(self, uml_relation: UmlRelation) -> str:
+        # the relations are keyed by value: they are rendered once, whatever the diagram they are filtered in
+        relation_key = (
+            uml_relation.source_fqn,
+            uml_relation.target_fqn,
+            uml_relation.type,
+            uml_relation.label,
+            uml_relation.source_cardinality,
+            uml_relation.target_cardinality,
+        )
+        fragment = self._relation_fragments.get(relation_key)
+        if fragment is None:
+            fragment = self._relation_fragments[relation_key] = self._post_process(render_puml_relation(uml_relation))
+        return fragment
+
+    def get_relations_fragments(self, uml_relations: Iterable[UmlRelation]) -> List[str]:
+        return [self.get_relation_fragment(uml_relation) for uml_relation in sort_puml_relations(uml_relations)]
+
+    def clear(self):
+        self._item_fragments.clear()
+        self._relation_fragments.clear()
+
+    def _post_process(self, fragment: str) -> str:
+        return fragment if self.post_process is None else self.post_process(fragment)
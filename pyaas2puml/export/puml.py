@@ -1,8 +1,7 @@
-from copy import copy
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
-from pyaas2puml.domain.umlclass import UmlClass
-from pyaas2puml.domain.umlenum import UmlEnum
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.domain.umlenum import Member, UmlEnum
 from pyaas2puml.domain.umlitem import UmlItem
 from pyaas2puml.domain.umlrelation import UmlRelation
 
@@ -13,14 +12,8 @@ hide methods
 """
 PUML_FILE_END = """@enduml
 """
-PUML_ITEM_START_TPL = """{item_type} {item_fqn}{generics} {{
-"""
-PUML_ATTR_TPL = """  {visibility}{attr_name}: {attr_type}{staticity}
-"""
 PUML_ITEM_END = """}
 """
-PUML_RELATION_TPL = """{source_fqn} {source_cardinality}{rel_type}{target_cardinality} {target_fqn}{label}
-"""
 
 FEATURE_STATIC = ' {static}'
 FEATURE_INSTANCE = ''
@@ -28,63 +21,109 @@ FEATURE_INSTANCE = ''
 
 def to_puml_content(diagram_name: str, uml_items: List[UmlItem], uml_relations: List[UmlRelation],
                     sort_members: bool = False, sort_relations: bool = True) -> Iterable[str]:
-    yield PUML_FILE_START.format(diagram_name=diagram_name)
+    yield PUML_FILE_START
 
-    # exports the domain classes and enums
+    # exports the domain classes and enums, as one block of lines per item
     for uml_item in uml_items:
         if isinstance(uml_item, UmlEnum):
-            yield from yeld_puml_enum(uml_item, sort_members)
+            yield render_puml_enum(uml_item, sort_members)
         elif isinstance(uml_item, UmlClass):
-            yield from yeld_puml_class(uml_item, sort_members)
+            yield render_puml_class(uml_item, sort_members)
         else:
             raise TypeError(f'cannot process uml_item of type {uml_item.__class__}')
 
     # exports the domain relationships between classes and enums
-    uml_relations = sorted(uml_relations, key=lambda rel: rel.source_fqn.lower()) if sort_relations else uml_relations
-    for uml_relation in uml_relations:
-        yield PUML_RELATION_TPL.format(
-            source_fqn=uml_relation.source_fqn, rel_type=uml_relation.type.value, target_fqn=uml_relation.target_fqn,
-            label=f" : {uml_relation.label}" if uml_relation.label else '',
-            source_cardinality=f'"{uml_relation.source_cardinality}"' if uml_relation.source_cardinality else '',
-            target_cardinality=f'"{uml_relation.target_cardinality}"' if uml_relation.target_cardinality else '',
-        )
+    yield render_puml_relations(uml_relations, sort_relations)
 
     yield PUML_FILE_END
 
 
-def yeld_puml_enum(uml_enum: UmlEnum, sort_members: bool = False) -> Iterable[str]:
-    yield PUML_ITEM_START_TPL.format(item_type='enum', item_fqn=uml_enum.fqn,
-                                     generics=f'<{uml_enum.generics}>' if uml_enum.generics else '')
-    if sort_members:
-        uml_enum.members.sort(key=lambda member: member.name.lower())
-    for member in uml_enum.members:
-        yield PUML_ATTR_TPL.format(visibility="", attr_name=member.name, attr_type=member.value,
-                                   staticity=FEATURE_STATIC)
-    yield PUML_ITEM_END
+def render_puml_relation(uml_relation: UmlRelation) -> str:
+    source_cardinality = f'"{uml_relation.source_cardinality}"' if uml_relation.source_cardinality else ''
+    target_cardinality = f'"{uml_relation.target_cardinality}"' if uml_relation.target_cardinality else ''
+    label = f' : {uml_relation.label}' if uml_relation.label else ''
+    return (
+        f'{uml_relation.source_fqn} {source_cardinality}{uml_relation.type.value}{target_cardinality} '
+        f'{uml_relation.target_fqn}{label}\n'
+    )
 
 
-def yeld_puml_class(uml_class: UmlClass, sort_members: bool = False) -> Iterable[str]:
-    yield PUML_ITEM_START_TPL.format(
-        item_type='abstract class' if uml_class.is_abstract else 'class', item_fqn=uml_class.fqn,
-        generics=f'<{uml_class.generics}>' if uml_class.generics else ''
+def sort_puml_relations(uml_relations: Iterable[UmlRelation]) -> List[UmlRelation]:
+    return sorted(uml_relations, key=lambda uml_relation: uml_relation.source_fqn.lower())
+
+
+def render_puml_relations(uml_relations: Iterable[UmlRelation], sort_relations: bool = True) -> str:
+    if sort_relations:
+        uml_relations = sort_puml_relations(uml_relations)
+
+    return ''.join([render_puml_relation(uml_relation) for uml_relation in uml_relations])
+
+
+def render_puml_item_start(item_type: str, uml_item: UmlItem) -> str:
+    generics = f'<{uml_item.generics}>' if uml_item.generics else ''
+    return f'{item_type} {uml_item.fqn}{generics} {{\n'
+
+
+def get_puml_members(uml_enum: UmlEnum, sort_members: bool = False) -> Tuple[Member, ...]:
+    """
+    Returns the members of the enum to draw, sorted by name if required, without modifying the enum: the returned
+    tuple does not alias the members list of the enum
+    """
+    if sort_members:
+        return tuple(sorted(uml_enum.members, key=lambda member: member.name.lower()))
+    return tuple(uml_enum.members)
+
+
+def render_puml_enum(uml_enum: UmlEnum, sort_members: bool = False) -> str:
+    return ''.join(
+        [
+            render_puml_item_start('enum', uml_enum),
+            *[
+                f'  {member.name}: {member.value}{FEATURE_STATIC}\n'
+                for member in get_puml_members(uml_enum, sort_members)
+            ],
+            PUML_ITEM_END,
+        ]
     )
+
+
+def render_puml_attribute(uml_attr: UmlAttribute) -> str:
+    staticity = FEATURE_STATIC if uml_attr.static else FEATURE_INSTANCE
+    # the visibility is derived from the name on purpose: the attributes are renamed after their inspection
+    # (snake_to_camel, plural_attribute_to_singular), a stored visibility would become stale
+    return f'  {uml_attr.visibility}{uml_attr.name}: {uml_attr.type}{staticity}\n'
+
+
+def get_puml_attributes(uml_class: UmlClass, sort_members: bool = False) -> List[UmlAttribute]:
+    """
+    Returns the attributes of the class to draw, without modifying the class: the instance attributes named like a
+    static attribute are left out, the attributes are sorted by name if required
+    """
+    static_attr_names = {attr.name for attr in uml_class.attributes if attr.static}
+    puml_attributes = [attr for attr in uml_class.attributes if attr.static or attr.name not in static_attr_names]
     if sort_members:
-        uml_class.attributes.sort(key=lambda attr: attr.name.lower())
+        puml_attributes.sort(key=lambda attr: attr.name.lower())
+    return puml_attributes
 
-    remove_duplicated_attrs(uml_class)
 
-    for uml_attr in uml_class.attributes:
-        yield PUML_ATTR_TPL.format(
-            visibility=uml_attr.visibility,
-            attr_name=uml_attr.name,
-            attr_type=uml_attr.type,
-            staticity=FEATURE_STATIC if uml_attr.static else FEATURE_INSTANCE,
-        )
-    yield PUML_ITEM_END
+def render_puml_class(uml_class: UmlClass, sort_members: bool = False) -> str:
+    return ''.join(
+        [
+            render_puml_item_start('abstract class' if uml_class.is_abstract else 'class', uml_class),
+            *[render_puml_attribute(uml_attr) for uml_attr in get_puml_attributes(uml_class, sort_members)],
+            PUML_ITEM_END,
+        ]
+    )
+
+
+def yeld_puml_enum(uml_enum: UmlEnum, sort_members: bool = False) -> Iterable[str]:
+    yield render_puml_enum(uml_enum, sort_members)
+
+
+def yeld_puml_class(uml_class: UmlClass, sort_members: bool = False) -> Iterable[str]:
+    yield render_puml_class(uml_class, sort_members)
 
 
 def remove_duplicated_attrs(uml_class: UmlClass):
-    static_attrs = [attr.name for attr in uml_class.attributes if attr.static]
-    for attr in copy(uml_class.attributes):
-        if not attr.static and attr.name in static_attrs:
-            uml_class.attributes.remove(attr)
+    # the rendering functions leave the classes unchanged, see get_puml_attributes
+    uml_class.attributes[:] = get_puml_attributes(uml_class)
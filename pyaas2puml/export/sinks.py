@@ -0,0 +1,294 @@
+"""
+Output sinks receiving the generated diagrams: a directory, a zip archive or a tar archive.
+
+The contents are buffered and written in bulk when the buffer is full and when the sink is closed. A manifest listing
+the written files (path, size and sha256 digest) is added to the output when the sink is closed, unless the generation
+failed: the output of a failed generation is left without manifest.
+
+The check sink writes nothing: it compares the contents with the files of an existing directory (golden files) and
+reports the files of the directory which are not generated anymore (orphan files).
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import sha256
+from io import BytesIO
+from itertools import zip_longest
+from json import dumps
+from pathlib import Path, PurePosixPath
+from tarfile import TarFile, TarInfo
+from tarfile import open as open_tar
+from time import time
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+from zipfile import ZIP_DEFLATED, ZipFile
+
+MANIFEST_FILE = 'manifest.json'
+# number of bytes buffered before being written in the output
+DEFAULT_BUFFER_SIZE = 1 << 20
+# number of bytes read at once when hashing an existing file
+READ_CHUNK_SIZE = 1 << 16
+ZIP_SUFFIXES = ('.zip',)
+TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+
+class OutputSink(ABC):
+    """
+    Base class of the output sinks, to be used as a context manager:
+
+    .. code-block:: python
+
+        with open_sink('output.zip') as sink:
+            sink.write('classes/submodel.puml', puml_content)
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE, with_manifest: bool = True):
+        self.buffer_size = buffer_size
+        self.with_manifest = with_manifest
+        self.manifest: Dict[str, Dict[str, Union[int, str]]] = {}
+        self._buffered_files: List[Tuple[str, bytes]] = []
+        self._buffered_size = 0
+
+    def write(self, file_path: Union[str, PurePosixPath], content: str):
+        """
+        Buffers the content of the file, whose path is relative to the output
+        """
+        file_path = PurePosixPath(file_path).as_posix()
+        encoded_content = content.encode('utf8')
+        self.manifest[file_path] = {'size': len(encoded_content), 'sha256': sha256(encoded_content).hexdigest()}
+        self._buffered_files.append((file_path, encoded_content))
+        self._buffered_size += len(encoded_content)
+        if self._buffered_size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffered_files:
+            self._write_files(self._buffered_files)
+            self._buffered_files = []
+            self._buffered_size = 0
+
+    def close(self):
+        if self.with_manifest:
+            manifest = [{'path': file_path, **file_entry} for file_path, file_entry in self.manifest.items()]
+            self._buffered_files.append((MANIFEST_FILE, dumps(manifest, indent=2).encode('utf8')))
+        self.flush()
+        self._close()
+
+    def __enter__(self) -> 'OutputSink':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # the output is incomplete: the resources are released without writing the manifest
+            self._close()
+
+    @abstractmethod
+    def _write_files(self, files: List[Tuple[str, bytes]]):
+        pass
+
+    @abstractmethod
+    def _close(self):
+        """
+        Releases the resources of the sink once all its files are written
+        """
+
+
+class DirectorySink(OutputSink):
+    def __init__(self, directory: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE, with_manifest: bool = True):
+        super().__init__(buffer_size, with_manifest)
+        self.directory = Path(directory)
+        # the folders are created once
+        self._created_folders: Set[Path] = set()
+
+    def _write_files(self, files: List[Tuple[str, bytes]]):
+        for file_path, content in files:
+            output_file = self.directory / file_path
+            if output_file.parent not in self._created_folders:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                self._created_folders.add(output_file.parent)
+            output_file.write_bytes(content)
+
+    def _close(self):
+        # each file is closed once written
+        pass
+
+
+class ZipSink(OutputSink):
+    def __init__(self, archive: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE, with_manifest: bool = True):
+        super().__init__(buffer_size, with_manifest)
+        self._zip_file = ZipFile(archive, 'w', compression=ZIP_DEFLATED)
+
+    def _write_files(self, files: List[Tuple[str, bytes]]):
+        for file_path, content in files:
+            self._zip_file.writestr(file_path, content)
+
+    def _close(self):
+        self._zip_file.close()
+
+
+class TarSink(OutputSink):
+    def __init__(self, archive: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE, with_manifest: bool = True):
+        super().__init__(buffer_size, with_manifest)
+        # the compression is given by the suffix of the archive: .tar.gz, .tgz, .tar.bz2, .tar.xz
+        archive_name = str(archive)
+        if archive_name.endswith(('.gz', '.tgz')):
+            mode = 'w:gz'
+        elif archive_name.endswith('.bz2'):
+            mode = 'w:bz2'
+        elif archive_name.endswith('.xz'):
+            mode = 'w:xz'
+        else:
+            mode = 'w'
+        self._tar_file: TarFile = open_tar(archive, mode)
+
+    def _write_files(self, files: List[Tuple[str, bytes]]):
+        modification_time = time()
+        for file_path, content in files:
+            file_info = TarInfo(file_path)
+            file_info.size = len(content)
+            file_info.mtime = modification_time
+            self._tar_file.addfile(file_info, BytesIO(content))
+
+    def _close(self):
+        self._tar_file.close()
+
+
+class StaleFile(NamedTuple):
+    """
+    File of the checked directory which differs from the generated content:
+    - missing: the file does not exist
+    - modified: the file differs, from the given line (None when the file or the generated content ended)
+    - orphan: the file exists but is not generated anymore
+    """
+
+    path: str
+    status: str
+    line_number: Optional[int] = None
+    existing_line: Optional[str] = None
+    generated_line: Optional[str] = None
+
+
+def hash_file(file: Path) -> str:
+    file_hash = sha256()
+    with open(file, 'rb') as file_stream:
+        for chunk in iter(lambda: file_stream.read(READ_CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def decode_line(line: Optional[bytes]) -> Optional[str]:
+    # the line terminators are kept: they may be the only difference
+    return None if line is None else line.decode('utf8', errors='replace')
+
+
+def check_file(existing_file: Path, file_path: str, content: bytes) -> Optional[StaleFile]:
+    """
+    Compares the content with the existing file: by size and by hash first, then line by line to locate the first
+    difference, reading the existing file as a stream. Returns None when the file is up-to-date
+    """
+    if not existing_file.is_file():
+        return StaleFile(file_path, 'missing')
+    if existing_file.stat().st_size == len(content) and hash_file(existing_file) == sha256(content).hexdigest():
+        return None
+
+    with open(existing_file, 'rb') as existing_lines:
+        for line_number, (existing_line, generated_line) in enumerate(zip_longest(existing_lines, BytesIO(content)), 1):
+            if existing_line != generated_line:
+                return StaleFile(
+                    file_path, 'modified', line_number, decode_line(existing_line), decode_line(generated_line)
+                )
+
+    # same lines with different sizes or hashes: the file changed while being checked
+    return StaleFile(file_path, 'modified')
+
+
+class CheckSink(OutputSink):
+    """
+    Compares the contents with the files of an existing directory, in a pool of worker threads, instead of writing
+    them. The stale files are available once the sink is closed:
+
+    .. code-block:: python
+
+        with CheckSink('output') as sink:
+            sink.write('classes/submodel.puml', puml_content)
+        print(sink.get_report())
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_workers: Optional[int] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        with_manifest: bool = True,
+    ):
+        super().__init__(buffer_size, with_manifest)
+        self.directory = Path(directory)
+        self.stale_files: List[StaleFile] = []
+        self.checked_files_count = 0
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._checks: List[Future] = []
+
+    def _write_files(self, files: List[Tuple[str, bytes]]):
+        for file_path, content in files:
+            self._checks.append(self._executor.submit(check_file, self.directory / file_path, file_path, content))
+
+    def _close(self):
+        self._executor.shutdown(wait=True)
+        stale_files = [
+            stale_file for stale_file in (check.result() for check in self._checks) if stale_file is not None
+        ]
+        # the manifest is not an orphan when it is not checked: it is written by the other sinks
+        generated_files = {*self.manifest, MANIFEST_FILE}
+        orphan_files = [
+            StaleFile(file_path, 'orphan')
+            for file_path in (
+                existing_file.relative_to(self.directory).as_posix()
+                for existing_file in self.directory.rglob('*')
+                if existing_file.is_file()
+            )
+            if file_path not in generated_files
+        ]
+        self.checked_files_count = len(self._checks) + len(orphan_files)
+        self.stale_files = sorted(stale_files + orphan_files, key=lambda stale_file: stale_file.path)
+        self._checks = []
+
+    def get_report(self) -> str:
+        """
+        Returns a compact report of the check: one line per stale file, with its first difference
+        """
+        if not self.stale_files:
+            return f'{self.checked_files_count} files are up-to-date in {self.directory}'
+
+        report_lines = [f'{len(self.stale_files)}/{self.checked_files_count} files are stale in {self.directory}:']
+        for stale_file in self.stale_files:
+            report_line = f'  {stale_file.status:<8} {stale_file.path}'
+            if stale_file.line_number is not None:
+                existing_line = '<end of file>' if stale_file.existing_line is None else repr(stale_file.existing_line)
+                generated_line = (
+                    '<end of file>' if stale_file.generated_line is None else repr(stale_file.generated_line)
+                )
+                report_line += f' (line {stale_file.line_number}: {existing_line} -> {generated_line})'
+            report_lines.append(report_line)
+
+        return '\n'.join(report_lines)
+
+
+def is_archive(output: Union[str, Path]) -> bool:
+    return str(output).endswith(ZIP_SUFFIXES + TAR_SUFFIXES)
+
+
+def open_sink(
+    output: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE, with_manifest: bool = True
+) -> OutputSink:
+    """
+    Opens the sink matching the given output: a zip or tar archive (depending on its suffix) or a directory
+    """
+    output_name = str(output)
+    if output_name.endswith(ZIP_SUFFIXES):
+        return ZipSink(output, buffer_size, with_manifest)
+    elif output_name.endswith(TAR_SUFFIXES):
+        return TarSink(output, buffer_size, with_manifest)
+
+    return DirectorySink(output, buffer_size, with_manifest)
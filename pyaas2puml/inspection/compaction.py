@@ -0,0 +1,91 @@
+"""
+Compaction of the inspected domain models: the data needed by the passes normalising the AAS models (decorators,
+model references asserted by the invariants) are extracted once from the class types as plain data.
+
+Releasing the class types does not reduce the memory by itself, the domain modules still reference the classes. It lets
+batch runs unload the domain modules and release their parsed sources once the domain is inspected: the inspected
+classes would otherwise keep the unloaded modules in memory through their types.
+"""
+
+from linecache import cache as linecache_entries
+from sys import modules
+from typing import Dict, List, NamedTuple, Tuple, Type
+
+from pyaas2puml.domain.umlclass import UmlClass
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.parsing.modelreferences import ModelReference, get_model_references
+from pyaas2puml.parsing.sourcelocator import get_module_source
+from pyaas2puml.utils import classname, get_class_decorators, get_decorator_name
+
+
+class ClassTraits(NamedTuple):
+    """
+    Plain data extracted from the type of an inspected class:
+    - the namespace of the class: the name of its module, followed by the ones of its enclosing classes
+    - the names of the decorators of the class, in their declaration order
+    - the model references asserted by the invariant decorators of the class
+    """
+
+    namespace: str
+    decorator_names: Tuple[str, ...]
+    model_references: Tuple[ModelReference, ...]
+
+    def has_decorator(self, decorator_name: str) -> bool:
+        return decorator_name in self.decorator_names
+
+
+def extract_class_traits(class_type: Type) -> ClassTraits:
+    return ClassTraits(
+        classname(class_type).rpartition('.')[0],
+        tuple(
+            decorator_name
+            for decorator_name in map(get_decorator_name, get_class_decorators(class_type))
+            if decorator_name is not None
+        ),
+        get_model_references(class_type),
+    )
+
+
+def extract_domain_class_traits(domain_items_by_fqn: Dict[str, UmlItem]) -> Dict[str, ClassTraits]:
+    """
+    Returns the traits of the inspected classes which have a type reference, by class fqn. The classes are left
+    unchanged
+    """
+    return {
+        fqn: extract_class_traits(domain_item.class_type)
+        for fqn, domain_item in domain_items_by_fqn.items()
+        if isinstance(domain_item, UmlClass) and domain_item.class_type is not None
+    }
+
+
+def release_class_types(domain_items_by_fqn: Dict[str, UmlItem]):
+    """
+    Releases the type references of the inspected classes, so that the unloaded domain modules can be garbage-collected
+    (see unload_domain_modules). The classes are modified in place: it must only be called on the items owned by the
+    caller
+    """
+    for domain_item in domain_items_by_fqn.values():
+        if isinstance(domain_item, UmlClass):
+            domain_item.class_type = None
+
+
+def unload_domain_modules(domain_module: str) -> List[str]:
+    """
+    Removes the domain module and its submodules from the imported modules, and releases the cached sources of
+    their files. The modules are garbage-collected if nothing else references them or their classes.
+    Returns the names of the unloaded modules
+    """
+    unloaded_module_names = [
+        module_name
+        for module_name in modules
+        if module_name == domain_module or module_name.startswith(f'{domain_module}.')
+    ]
+    for module_name in unloaded_module_names:
+        module_file = getattr(modules.pop(module_name), '__file__', None)
+        if module_file is not None:
+            linecache_entries.pop(module_file, None)
+
+    # the parsed sources are cached by file path, the ones of the other domains are parsed again if needed
+    get_module_source.cache_clear()
+
+    return unloaded_module_names
@@ -1,8 +1,8 @@
-from dataclasses import is_dataclass
+from dataclasses import dataclass, field, is_dataclass
 from enum import Enum
-from inspect import getmembers, isclass
+from inspect import isclass
 from types import ModuleType
-from typing import Dict, Iterable, List, Type
+from typing import Dict, Iterable, List, Set, Type
 
 from pyaas2puml.domain.umlitem import UmlItem
 from pyaas2puml.domain.umlrelation import UmlRelation
@@ -11,27 +11,46 @@ from pyaas2puml.inspection.inspectenum import inspect_enum_type
 from pyaas2puml.inspection.inspectnamedtuple import inspect_namedtuple_type
 
 
+@dataclass
+class VisitedDefinitions:
+    """
+    Registry of the class definitions (identified by their defining module and their name) visited while inspecting
+    the modules of a package, so that a class imported in several modules is considered only once
+    """
+
+    fqns: Set[str] = field(default_factory=set)
+    duplicate_visits_count: int = 0
+
+    def is_first_visit(self, definition_type: Type) -> bool:
+        definition_fqn = f'{getattr(definition_type, "__module__", None)}.{definition_type.__name__}'
+        if definition_fqn in self.fqns:
+            self.duplicate_visits_count += 1
+            return False
+
+        self.fqns.add(definition_fqn)
+        return True
+
+
 def filter_domain_relations(domain_items: Dict[str, UmlItem], domain_relations: List[UmlRelation]):
     for relation in list(domain_relations):
         if relation.source_fqn not in domain_items or relation.target_fqn not in domain_items:
             domain_relations.remove(relation)
 
 
-def filter_domain_definitions(module: ModuleType, root_module_name: str) -> Iterable[Type]:
+def filter_domain_definitions(
+    module: ModuleType, root_module_name: str, visited_definitions: VisitedDefinitions = None
+) -> Iterable[Type]:
     for definition_key in dir(module):
         definition_type = getattr(module, definition_key)
         if isclass(definition_type):
-            definition_members = getmembers(definition_type)
-            definition_module_member = next(
-                (
-                    member
-                    for member in definition_members
-                    # ensures that the type belongs to the module being parsed
-                    if member[0] == '__module__' and member[1].startswith(root_module_name)
-                ),
-                None,
-            )
-            if definition_module_member is not None:
+            # skips the classes already visited in the previously inspected modules
+            if visited_definitions is not None and not visited_definitions.is_first_visit(definition_type):
+                continue
+
+            # reads the defining module directly: inspect.getmembers would evaluate and sort all the class members
+            definition_module = getattr(definition_type, '__module__', None)
+            # ensures that the classes imported in the module being parsed belong to the domain
+            if isinstance(definition_module, str) and definition_module.startswith(root_module_name):
                 yield definition_type
 
 
@@ -62,7 +81,8 @@ def inspect_module(
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
     domain_relations: List[UmlRelation],
+    visited_definitions: VisitedDefinitions = None,
 ):
     # processes only the definitions declared or imported within the given root module
-    for definition_type in filter_domain_definitions(domain_item_module, root_module_name):
+    for definition_type in filter_domain_definitions(domain_item_module, root_module_name, visited_definitions):
         inspect_domain_definition(definition_type, root_module_name, domain_items_by_fqn, domain_relations)
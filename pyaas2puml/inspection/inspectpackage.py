@@ -1,23 +1,162 @@
 from importlib import import_module
-from pkgutil import walk_packages
+from itertools import islice
+from pathlib import Path
+from pkgutil import ModuleInfo, iter_modules
+from time import perf_counter
 from types import ModuleType
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple, Union
 
 from pyaas2puml.domain.umlitem import UmlItem
 from pyaas2puml.domain.umlrelation import UmlRelation
-from pyaas2puml.inspection.inspectmodule import inspect_module
+from pyaas2puml.inspection.inspectmodule import VisitedDefinitions, inspect_module
+from pyaas2puml.inspection.profiling import InspectionProfile
+from pyaas2puml.snapshot import build_snapshot_header, load_snapshot, save_snapshot
+
+# kind of the models saved in the snapshots by inspect_package
+INSPECTED_PACKAGE_MODEL_KIND = 'inspected-package'
+
+
+def walk_domain_packages(
+    paths: Iterable[str],
+    prefix: str,
+    selected_fqns: Tuple[str, ...] = None,
+    seen_paths: Set[str] = None,
+    import_package: Callable[[str], ModuleType] = import_module,
+) -> Iterator[ModuleInfo]:
+    """
+    Yields the modules and subpackages found recursively in the given paths, like pkgutil.walk_packages does.
+    When selected_fqns is given, only the modules belonging to the selected (sub)packages are yielded
+    and only the packages leading to them are imported (with import_package) to be traversed: the other packages are
+    pruned.
+    """
+    seen_paths = set() if seen_paths is None else seen_paths
+    for module_info in iter_modules(paths, prefix):
+        is_selected = selected_fqns is None or any(
+            module_info.name == selected_fqn or module_info.name.startswith(f'{selected_fqn}.')
+            for selected_fqn in selected_fqns
+        )
+        if is_selected:
+            yield module_info
+
+        leads_to_selection = is_selected or any(
+            selected_fqn.startswith(f'{module_info.name}.') for selected_fqn in selected_fqns
+        )
+        if module_info.ispkg and leads_to_selection:
+            # like pkgutil.walk_packages: packages which cannot be imported are skipped
+            try:
+                package = import_package(module_info.name)
+            except ImportError:
+                continue
+
+            # does not traverse the paths already seen
+            package_paths = [path for path in getattr(package, '__path__', None) or [] if path not in seen_paths]
+            seen_paths.update(package_paths)
+            yield from walk_domain_packages(
+                package_paths, f'{module_info.name}.', selected_fqns, seen_paths, import_package
+            )
+
+
+def iter_domain_modules(
+    domain_path: str,
+    domain_module: str,
+    domain_submodules: Iterable[str] = None,
+    inspection_profile: InspectionProfile = None,
+) -> Iterator[ModuleType]:
+    """
+    Imports and yields the domain modules one at a time: the package module first,
+    then its children modules and subpackages.
+    When domain_submodules are given (like ['v3_1']), only the modules of these subpackages are imported and yielded.
+    When an inspection profile is given, the imports of the modules and packages are recorded in it.
+    """
+    import_domain_module = import_module if inspection_profile is None else inspection_profile.import_module
+    selected_fqns = (
+        tuple(f'{domain_module}.{submodule}' for submodule in domain_submodules) if domain_submodules else None
+    )
+    if selected_fqns is None:
+        yield import_domain_module(domain_module)
+
+    for _, name, is_pkg in walk_domain_packages(
+        [domain_path], f'{domain_module}.', selected_fqns, import_package=import_domain_module
+    ):
+        if not is_pkg:
+            yield import_domain_module(name)
+
+
+def iter_package(
+    domain_path: str,
+    domain_module: str,
+    domain_items_by_fqn: Dict[str, UmlItem] = None,
+    domain_submodules: Iterable[str] = None,
+    visited_definitions: VisitedDefinitions = None,
+    inspection_profile: InspectionProfile = None,
+) -> Iterator[Union[UmlItem, UmlRelation]]:
+    """
+    Lazily inspects the domain package: the uml items, then the uml relations of a module are yielded
+    before the next module is imported, so that the consumer can filter them or stop the inspection early.
+
+    The items already registered in domain_items_by_fqn are not inspected again,
+    the newly inspected items are registered in it.
+    When domain_submodules are given, the modules out of these subpackages are neither imported nor inspected.
+
+    Each class is considered only once, in the first module where it is found; pass a VisitedDefinitions instance
+    to read how many duplicate visits of classes imported in several modules were avoided.
+
+    Pass an InspectionProfile instance to record the import and inspection times of each module.
+    """
+    if domain_items_by_fqn is None:
+        domain_items_by_fqn = {}
+    if visited_definitions is None:
+        visited_definitions = VisitedDefinitions()
+
+    for domain_item_module in iter_domain_modules(domain_path, domain_module, domain_submodules, inspection_profile):
+        inspected_items_count = len(domain_items_by_fqn)
+        module_relations: List[UmlRelation] = []
+        inspection_start = perf_counter()
+        inspect_module(domain_item_module, domain_module, domain_items_by_fqn, module_relations, visited_definitions)
+        if inspection_profile is not None:
+            inspection_profile.add_inspection_time(domain_item_module.__name__, perf_counter() - inspection_start)
+
+        # the items of the module are the last ones registered (dictionaries preserve the insertion order)
+        yield from list(islice(domain_items_by_fqn.values(), inspected_items_count, None))
+        yield from module_relations
 
 
 def inspect_package(
-    domain_path: str, domain_module: str, domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+    domain_path: str,
+    domain_module: str,
+    domain_items_by_fqn: Dict[str, UmlItem],
+    domain_relations: List[UmlRelation],
+    domain_submodules: Iterable[str] = None,
+    visited_definitions: VisitedDefinitions = None,
+    snapshot_path: Union[str, Path] = None,
+    inspection_profile: InspectionProfile = None,
 ):
-    # inspects the package module first, then its children modules and subpackages
-    item_module = import_module(domain_module)
-    inspect_module(item_module, domain_module, domain_items_by_fqn, domain_relations)
+    """
+    When a snapshot path is given, the items and relations are loaded from the snapshot if it is up-to-date
+    with the domain sources. Otherwise, the domain is inspected and the inspected items and relations are saved
+    in the snapshot.
+    When an inspection profile is given, the import and inspection times of the inspected modules are recorded in it.
+    """
+    snapshot_header = None
+    if snapshot_path is not None:
+        snapshot_header = build_snapshot_header(
+            INSPECTED_PACKAGE_MODEL_KIND, domain_path, domain_module, domain_submodules
+        )
+        snapshot = load_snapshot(snapshot_path, snapshot_header)
+        if snapshot is not None:
+            snapshot_items_by_fqn, snapshot_relations = snapshot
+            domain_items_by_fqn.update(snapshot_items_by_fqn)
+            domain_relations.extend(snapshot_relations)
+            return
 
-    for _, name, is_pkg in walk_packages([domain_path], f'{domain_module}.'):
-        if not is_pkg:
-            domain_item_module: ModuleType = import_module(name)
-            inspect_module(domain_item_module, domain_module, domain_items_by_fqn, domain_relations)
-    item_module = import_module(f'{domain_module}', f'{domain_module}.')
-    inspect_module(item_module, domain_module, domain_items_by_fqn, domain_relations)
+    # the inspected items are registered in domain_items_by_fqn by iter_package
+    domain_relations.extend(
+        uml_element
+        for uml_element in iter_package(
+            domain_path, domain_module, domain_items_by_fqn, domain_submodules, visited_definitions, inspection_profile
+        )
+        if isinstance(uml_element, UmlRelation)
+    )
+
+    if snapshot_header is not None:
+        save_snapshot(snapshot_path, snapshot_header, domain_items_by_fqn, domain_relations)
@@ -0,0 +1,112 @@
+"""
+Instrumentation of the inspection of a domain package, to see which modules dominate its start-up: for each module
+imported while walking the domain, records its import wall time, the modules imported along with it (its transitive
+imports which were not imported yet) and its inspection time.
+
+.. code-block:: python
+
+    inspection_profile = InspectionProfile()
+    inspect_package(domain_path, domain_module, domain_items_by_fqn, domain_relations,
+                    inspection_profile=inspection_profile)
+    print(inspection_profile.get_report())
+"""
+
+from dataclasses import asdict, dataclass, field
+from importlib import import_module
+from json import dumps
+from sys import modules
+from time import perf_counter
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class ModuleProfile:
+    """
+    Costs of a domain module, in seconds. The inspection time is None for the packages which are only imported to be
+    walked through
+    """
+
+    name: str
+    import_time: float
+    imported_modules: Tuple[str, ...]
+    inspection_time: Optional[float] = None
+
+    @property
+    def total_time(self) -> float:
+        return self.import_time + (self.inspection_time or 0.0)
+
+
+PROFILE_SORT_KEYS: Dict[str, Callable[[ModuleProfile], float]] = {
+    'total': lambda module_profile: module_profile.total_time,
+    'import': lambda module_profile: module_profile.import_time,
+    'inspection': lambda module_profile: module_profile.inspection_time or 0.0,
+    'modules': lambda module_profile: len(module_profile.imported_modules),
+}
+
+
+@dataclass
+class InspectionProfile:
+    module_profiles: Dict[str, ModuleProfile] = field(default_factory=dict)
+
+    def import_module(self, module_name: str) -> ModuleType:
+        """
+        Imports the module like importlib.import_module does, recording its import time and the modules it added to
+        the imported ones (the module itself included, unless it was already imported)
+        """
+        modules_before_import = set(modules)
+        import_start = perf_counter()
+        try:
+            return import_module(module_name)
+        finally:
+            import_time = perf_counter() - import_start
+            if module_name not in self.module_profiles:
+                self.module_profiles[module_name] = ModuleProfile(
+                    module_name,
+                    import_time,
+                    tuple(module for module in modules if module not in modules_before_import),
+                )
+
+    def add_inspection_time(self, module_name: str, inspection_time: float):
+        module_profile = self.module_profiles.get(module_name)
+        if module_profile is None:
+            # the module was imported before the inspection
+            module_profile = self.module_profiles[module_name] = ModuleProfile(module_name, 0.0, ())
+        module_profile.inspection_time = (module_profile.inspection_time or 0.0) + inspection_time
+
+    def get_sorted_profiles(self, sort_key: str = 'total') -> List[ModuleProfile]:
+        """
+        Returns the module profiles from the most expensive to the least expensive one, according to the given sort key
+        (see PROFILE_SORT_KEYS)
+        """
+        return sorted(self.module_profiles.values(), key=PROFILE_SORT_KEYS[sort_key], reverse=True)
+
+    def get_report(self, sort_key: str = 'total') -> str:
+        module_profiles = self.get_sorted_profiles(sort_key)
+        import_time = sum(module_profile.import_time for module_profile in module_profiles)
+        inspection_time = sum(module_profile.inspection_time or 0.0 for module_profile in module_profiles)
+        imported_modules_count = sum(len(module_profile.imported_modules) for module_profile in module_profiles)
+        report_lines = [
+            f'{len(module_profiles)} domain modules imported in {import_time * 1000:.1f}ms '
+            f'({imported_modules_count} modules loaded), inspected in {inspection_time * 1000:.1f}ms',
+            f'{"total":>10} {"import":>10} {"inspection":>10} {"modules":>8}  module',
+        ]
+        for module_profile in module_profiles:
+            module_inspection_time = (
+                '-' if module_profile.inspection_time is None else f'{module_profile.inspection_time * 1000:.1f}ms'
+            )
+            report_lines.append(
+                f'{module_profile.total_time * 1000:>8.1f}ms {module_profile.import_time * 1000:>8.1f}ms '
+                f'{module_inspection_time:>10} {len(module_profile.imported_modules):>8}  {module_profile.name}'
+            )
+
+        return '\n'.join(report_lines)
+
+    def to_json(self, sort_key: str = 'total') -> str:
+        return dumps(
+            [
+                {**asdict(module_profile), 'total_time': module_profile.total_time}
+                for module_profile in self.get_sorted_profiles(sort_key)
+            ],
+            indent=2,
+        )
@@ -0,0 +1,335 @@
+"""
+Structural differences between 2 inspected domains (2 versions of a meta-model, for example).
+
+The items of both domains are compared by their fqn relative to their domain, so that 'aasCoreMeta.v3.Submodel'
+and 'aasCoreMeta.v31.Submodel' are compared together. The items, their attributes or members and the relations
+are indexed by key in both domains, so that the differences are computed in linear time.
+"""
+
+from dataclasses import dataclass
+from enum import Enum, unique
+from json import dumps
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.domain.umlenum import Member, UmlEnum
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import UmlRelation
+from pyaas2puml.export.puml import PUML_FILE_END, PUML_FILE_START
+
+# (source key, relation type, target key, label)
+RelationKey = Tuple[str, str, str, Optional[str]]
+
+
+@unique
+class ChangeType(Enum):
+    ADDED = 'added'
+    REMOVED = 'removed'
+    MODIFIED = 'modified'
+
+
+@unique
+class ChangedElement(Enum):
+    ITEM = 'item'
+    ATTRIBUTE = 'attribute'
+    MEMBER = 'member'
+    RELATION = 'relation'
+
+
+@dataclass(frozen=True)
+class ModelChange:
+    change_type: ChangeType
+    element: ChangedElement
+    # the relative fqn of the item owning the changed element (the source item of a changed relation)
+    item_key: str
+    # the name of the changed attribute or member, the description of the changed relation, or the item key
+    element_key: str
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    # the key of the changed relation
+    relation_key: Optional[RelationKey] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'change': self.change_type.value,
+            'element': self.element.value,
+            'item': self.item_key,
+            'key': self.element_key,
+            'old': self.old_value,
+            'new': self.new_value,
+        }
+
+
+@dataclass
+class ModelDiff:
+    old_items_by_key: Dict[str, UmlItem]
+    new_items_by_key: Dict[str, UmlItem]
+    old_relations_by_key: Dict[RelationKey, UmlRelation]
+    new_relations_by_key: Dict[RelationKey, UmlRelation]
+    changes: List[ModelChange]
+
+    def get_changed_item_keys(self) -> List[str]:
+        """
+        Returns the keys of the items which are changed or whose relations are changed, in the order of the changes:
+        the diagrams drawing these items must be regenerated. The endpoints of the changed relations which are not
+        items of the domains (types of other modules) are left out
+        """
+        changed_item_keys: Dict[str, None] = {}
+        for change in self.changes:
+            item_keys = (change.item_key,) if change.relation_key is None else (change.item_key, change.relation_key[2])
+            for item_key in item_keys:
+                if item_key in self.new_items_by_key or item_key in self.old_items_by_key:
+                    changed_item_keys[item_key] = None
+
+        return list(changed_item_keys)
+
+    def to_json(self) -> str:
+        return dumps([change.to_dict() for change in self.changes], indent=2)
+
+
+def relative_items_by_key(items_by_fqn: Dict[str, UmlItem], fqn_prefix: str) -> Dict[str, UmlItem]:
+    return {fqn.removeprefix(fqn_prefix): item for fqn, item in items_by_fqn.items()}
+
+
+def relation_key(relation: UmlRelation, fqn_prefix: str) -> RelationKey:
+    return (
+        relation.source_fqn.removeprefix(fqn_prefix),
+        relation.type.value,
+        relation.target_fqn.removeprefix(fqn_prefix),
+        relation.label,
+    )
+
+
+def describe_relation_key(relation_key: RelationKey) -> str:
+    _, relation_type, target_key, label = relation_key
+    return f'{relation_type} {target_key}' + (f' : {label}' if label else '')
+
+
+def get_item_type(item: UmlItem) -> str:
+    if isinstance(item, UmlEnum):
+        return 'enum'
+
+    return 'abstract class' if item.is_abstract else 'class'
+
+
+def describe_item(item: UmlItem) -> str:
+    item_type = get_item_type(item)
+    return f'{item_type}<{item.generics}>' if item.generics else item_type
+
+
+def describe_attribute(attribute: UmlAttribute) -> str:
+    return f'{attribute.type} {{static}}' if attribute.static else attribute.type
+
+
+def describe_cardinalities(relation: UmlRelation) -> str:
+    return f'"{relation.source_cardinality}" "{relation.target_cardinality}"'
+
+
+Element = TypeVar('Element')
+
+
+def diff_indexes(
+    old_elements_by_key: Dict[str, Element], new_elements_by_key: Dict[str, Element], describe
+) -> Iterator[Tuple[ChangeType, str, Optional[str], Optional[str]]]:
+    """
+    Yields the removed elements, then the added and modified elements in the order of the new index,
+    with the descriptions of their old and new versions
+    """
+    for key, old_element in old_elements_by_key.items():
+        if key not in new_elements_by_key:
+            yield ChangeType.REMOVED, key, describe(old_element), None
+    for key, new_element in new_elements_by_key.items():
+        old_element = old_elements_by_key.get(key)
+        if old_element is None:
+            yield ChangeType.ADDED, key, None, describe(new_element)
+        else:
+            old_description, new_description = describe(old_element), describe(new_element)
+            if old_description != new_description:
+                yield ChangeType.MODIFIED, key, old_description, new_description
+
+
+def index_by_name(elements: Iterable[Element]) -> Dict[str, Element]:
+    # the first element with a given name is the one drawn by the exporter
+    elements_by_name: Dict[str, Element] = {}
+    for element in elements:
+        elements_by_name.setdefault(element.name, element)
+
+    return elements_by_name
+
+
+def diff_item_contents(item_key: str, old_item: UmlItem, new_item: UmlItem) -> Iterator[ModelChange]:
+    if isinstance(old_item, UmlClass) and isinstance(new_item, UmlClass):
+        element, describe = ChangedElement.ATTRIBUTE, describe_attribute
+        old_elements, new_elements = old_item.attributes, new_item.attributes
+    elif isinstance(old_item, UmlEnum) and isinstance(new_item, UmlEnum):
+        element, describe = ChangedElement.MEMBER, lambda member: member.value
+        old_elements, new_elements = old_item.members, new_item.members
+    else:
+        # a class replaced by an enum (or conversely): the item change describes it
+        return
+
+    for change_type, name, old_value, new_value in diff_indexes(
+        index_by_name(old_elements), index_by_name(new_elements), describe
+    ):
+        yield ModelChange(change_type, element, item_key, name, old_value, new_value)
+
+
+def diff_models(
+    old_items_by_fqn: Dict[str, UmlItem],
+    old_relations: List[UmlRelation],
+    new_items_by_fqn: Dict[str, UmlItem],
+    new_relations: List[UmlRelation],
+    old_fqn_prefix: str = '',
+    new_fqn_prefix: str = '',
+) -> ModelDiff:
+    """
+    Computes the changes between 2 domain models, whose items are compared by their fqn without the given prefixes
+    """
+    old_items_by_key = relative_items_by_key(old_items_by_fqn, old_fqn_prefix)
+    new_items_by_key = relative_items_by_key(new_items_by_fqn, new_fqn_prefix)
+
+    changes: List[ModelChange] = []
+    for change_type, item_key, old_value, new_value in diff_indexes(old_items_by_key, new_items_by_key, describe_item):
+        changes.append(ModelChange(change_type, ChangedElement.ITEM, item_key, item_key, old_value, new_value))
+    for item_key, new_item in new_items_by_key.items():
+        old_item = old_items_by_key.get(item_key)
+        if old_item is not None:
+            changes.extend(diff_item_contents(item_key, old_item, new_item))
+
+    old_relations_by_key: Dict[RelationKey, UmlRelation] = {}
+    for relation in old_relations:
+        old_relations_by_key.setdefault(relation_key(relation, old_fqn_prefix), relation)
+    new_relations_by_key: Dict[RelationKey, UmlRelation] = {}
+    for relation in new_relations:
+        new_relations_by_key.setdefault(relation_key(relation, new_fqn_prefix), relation)
+    for change_type, key, old_value, new_value in diff_indexes(
+        old_relations_by_key, new_relations_by_key, describe_cardinalities
+    ):
+        changes.append(
+            ModelChange(
+                change_type, ChangedElement.RELATION, key[0], describe_relation_key(key), old_value, new_value, key
+            )
+        )
+
+    return ModelDiff(old_items_by_key, new_items_by_key, old_relations_by_key, new_relations_by_key, changes)
+
+
+PUML_DIFF_SKINPARAMS = """skinparam class {
+  BackgroundColor<<added>> PaleGreen
+  BackgroundColor<<removed>> MistyRose
+  BackgroundColor<<modified>> LightYellow
+}
+
+"""
+PUML_DIFF_ITEM_START_TPL = """{item_type} {item_key}{stereotype} {{
+"""
+PUML_DIFF_MEMBER_TPL = """  {member}
+"""
+PUML_DIFF_RELATION_TPL = """{source_key} {source_cardinality}{rel_type}{target_cardinality} {target_key}{label}
+"""
+COLORS_BY_CHANGE_TYPE = {ChangeType.ADDED: 'green', ChangeType.REMOVED: 'red', ChangeType.MODIFIED: 'blue'}
+
+
+def format_member(element, change_type: Optional[ChangeType], old_element=None) -> str:
+    if isinstance(element, UmlAttribute):
+        member = f'{element.visibility}{element.name}: {element.type}'
+        staticity = ' {static}' if element.static else ''
+    else:
+        member, staticity = element.name, ''
+
+    if change_type is None:
+        return f'{member}{staticity}'
+    color = COLORS_BY_CHANGE_TYPE[change_type]
+    if change_type == ChangeType.REMOVED:
+        return f'<color:{color}><s>{member}</s></color>{staticity}'
+    elif change_type == ChangeType.MODIFIED:
+        old_type = old_element.type if isinstance(old_element, UmlAttribute) else old_element.value
+        return f'<color:{color}>{member}</color> <color:gray>(was {old_type})</color>{staticity}'
+    return f'<color:{color}>{member}</color>{staticity}'
+
+
+def get_members_by_name(item: UmlItem) -> Dict[str, Union[UmlAttribute, Member]]:
+    return index_by_name(item.attributes if isinstance(item, UmlClass) else item.members)
+
+
+def yield_puml_diff_item(
+    item_key: str,
+    model_diff: ModelDiff,
+    item_change_type: Optional[ChangeType],
+    content_changes: Dict[str, ModelChange],
+) -> Iterator[str]:
+    """
+    Draws a changed item with the colored changes of its members, or an unchanged item without members (stub)
+    when it is drawn as the endpoint of a changed relation
+    """
+    item = model_diff.new_items_by_key.get(item_key) or model_diff.old_items_by_key[item_key]
+    stereotype = f' <<{item_change_type.value}>>' if item_change_type is not None else ''
+    yield PUML_DIFF_ITEM_START_TPL.format(item_type=get_item_type(item), item_key=item_key, stereotype=stereotype)
+
+    if item_change_type in (ChangeType.ADDED, ChangeType.REMOVED):
+        for element in get_members_by_name(item).values():
+            yield PUML_DIFF_MEMBER_TPL.format(member=format_member(element, item_change_type))
+    elif item_change_type == ChangeType.MODIFIED:
+        old_members_by_name = get_members_by_name(model_diff.old_items_by_key[item_key])
+        for name, element in get_members_by_name(item).items():
+            change = content_changes.get(name)
+            yield PUML_DIFF_MEMBER_TPL.format(
+                member=format_member(element, change and change.change_type, old_members_by_name.get(name))
+            )
+        for name, old_element in old_members_by_name.items():
+            change = content_changes.get(name)
+            if change is not None and change.change_type == ChangeType.REMOVED:
+                yield PUML_DIFF_MEMBER_TPL.format(member=format_member(old_element, ChangeType.REMOVED))
+    yield '}\n'
+
+
+def to_puml_diff_content(model_diff: ModelDiff) -> Iterator[str]:
+    """
+    Draws the changed items and relations: the added, removed and modified items are colored by stereotype,
+    the changes of their members and the changed relations are colored (removed elements are struck through).
+    The unchanged endpoints of the changed relations are drawn without members.
+    """
+    item_change_types: Dict[str, ChangeType] = {}
+    content_changes_by_item: Dict[str, Dict[str, ModelChange]] = {}
+    relation_changes: List[ModelChange] = []
+    for change in model_diff.changes:
+        if change.element == ChangedElement.ITEM:
+            item_change_types[change.item_key] = change.change_type
+        elif change.element == ChangedElement.RELATION:
+            relation_changes.append(change)
+        else:
+            content_changes_by_item.setdefault(change.item_key, {})[change.element_key] = change
+            item_change_types.setdefault(change.item_key, ChangeType.MODIFIED)
+
+    yield PUML_FILE_START
+    yield PUML_DIFF_SKINPARAMS
+    for item_key in model_diff.get_changed_item_keys():
+        yield from yield_puml_diff_item(
+            item_key, model_diff, item_change_types.get(item_key), content_changes_by_item.get(item_key, {})
+        )
+
+    for change in relation_changes:
+        relations_by_key = (
+            model_diff.old_relations_by_key
+            if change.change_type == ChangeType.REMOVED
+            else model_diff.new_relations_by_key
+        )
+        relation = relations_by_key[change.relation_key]
+        source_key, rel_type, target_key, label = change.relation_key
+        # colors the link of the arrow: -[#green]->, .[#green].>, *-[#green]-, <|-[#green]-
+        color = COLORS_BY_CHANGE_TYPE[change.change_type]
+        link_index = min(index for index in (rel_type.find('-'), rel_type.find('.')) if index >= 0) + 1
+        if change.change_type == ChangeType.MODIFIED:
+            label = f' : {label + " " if label else ""}(was {change.old_value})'
+        else:
+            label = f' : {label}' if label else ''
+        yield PUML_DIFF_RELATION_TPL.format(
+            source_key=source_key,
+            rel_type=f'{rel_type[:link_index]}[#{color}]{rel_type[link_index:]}',
+            target_key=target_key,
+            label=label,
+            source_cardinality=f'"{relation.source_cardinality}"' if relation.source_cardinality else '',
+            target_cardinality=f'"{relation.target_cardinality}"' if relation.target_cardinality else '',
+        )
+
+    yield PUML_FILE_END
@@ -1,17 +1,22 @@
 from ast import (
+    AST,
     AnnAssign,
     Assign,
+    AsyncFunctionDef,
     Attribute,
     BinOp,
+    ClassDef,
     FunctionDef,
+    Lambda,
     Name,
     NodeVisitor,
     Subscript,
     arg,
     expr,
-    get_source_segment,
+    iter_fields,
 )
 from collections import namedtuple
+from io import StringIO
 from typing import Dict, List, Tuple
 
 from pyaas2puml.domain.umlclass import UmlAttribute
@@ -80,15 +85,32 @@ class ConstructorVisitor(NodeVisitor):
     """
 
     def __init__(
-        self, constructor_source: str, class_name: str, root_fqn: str, module_resolver: ModuleResolver, *args, **kwargs
+        self,
+        constructor_source: str,
+        class_name: str,
+        root_fqn: str,
+        module_resolver: ModuleResolver,
+        *args,
+        constructor_source_lines: List[str] = None,
+        **kwargs,
     ):
+        """
+        The constructor source can be the one of its whole module, along with its lines when they are already split
+        """
         super().__init__(*args, **kwargs)
         self.constructor_source = constructor_source
+        # the lines are split like the Python parser does (line feeds, carriage returns), once for all the annotations
+        self.constructor_source_lines: List[str] = (
+            StringIO(constructor_source, newline='').readlines()
+            if constructor_source_lines is None
+            else constructor_source_lines
+        )
         self.class_fqn: str = f'{module_resolver.module.__name__}.{class_name}'
         self.root_fqn = root_fqn
         self.module_resolver = module_resolver
-        self.class_self_id: str
-        self.variables_namespace: List[Variable] = []
+        self.class_self_id: str = None
+        # the variables of the constructor scope by name: an assignment shadows the previous variable of the same name
+        self.variables_namespace: Dict[str, Variable] = {}
         self.uml_attributes: List[UmlAttribute] = []
         self.uml_relations_by_target_fqn: Dict[str, UmlRelation] = {}
 
@@ -102,69 +124,120 @@ class ConstructorVisitor(NodeVisitor):
         )
 
     def get_from_namespace(self, variable_id: str) -> Variable:
-        return next(
-            (
-                variable
-                # variables namespace is iterated antichronologically
-                # to account for variables being overridden
-                for variable in self.variables_namespace[::-1]
-                if variable.id == variable_id
-            ),
-            None,
-        )
+        return self.variables_namespace.get(variable_id)
+
+    def add_to_namespace(self, variables: List[Variable]):
+        for variable in variables:
+            self.variables_namespace[variable.id] = variable
 
-    def generic_visit(self, node):
-        NodeVisitor.generic_visit(self, node)
+    def generic_visit(self, node: AST):
+        """
+        The attributes are assigned to self in statements: the expressions (conditions, calls, decorators, etc.)
+        are not browsed, only the statements nested in the blocks of the compound statements (if, for, with, etc.)
+        """
+        for _, value in iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, AST) and not isinstance(item, expr):
+                        self.visit(item)
+            elif isinstance(value, AST) and not isinstance(value, expr):
+                self.visit(value)
 
     def visit_FunctionDef(self, node: FunctionDef):
         # retrieves constructor arguments ('self' reference and typed arguments)
-        if node.name == '__init__':
+        if self.class_self_id is None and node.name == '__init__':
             variables_collector = SignatureVariablesCollector(self.constructor_source)
             variables_collector.visit(node)
-            self.class_self_id: str = variables_collector.class_self_id
-            self.variables_namespace = variables_collector.variables
+            self.class_self_id = variables_collector.class_self_id
+            self.variables_namespace = {}
+            self.add_to_namespace(variables_collector.variables)
+
+            for statement in node.body:
+                self.visit(statement)
+
+        # the functions defined in the constructor are not browsed: they may not be called, and have their own scope
+
+    def visit_AsyncFunctionDef(self, node: AsyncFunctionDef):
+        pass
 
-        self.generic_visit(node)
+    def visit_Lambda(self, node: Lambda):
+        pass
+
+    def visit_ClassDef(self, node: ClassDef):
+        # the attributes assigned to self in a nested class belong to the instances of the nested class
+        pass
+
+    def collect_assigned_variables(self, target: expr, annotation: expr) -> Tuple[List[Variable], List[Variable]]:
+        """
+        Returns the variables and the self attributes assigned by the target of an assignment. The common targets (a
+        variable, an attribute of self, a subscript) are handled without visiting them with an AssignedVariablesCollector
+        """
+        if isinstance(target, Name):
+            return ([] if target.id == self.class_self_id else [Variable(target.id, annotation)]), []
+        elif isinstance(target, Attribute):
+            if isinstance(target.value, Name) and target.value.id == self.class_self_id:
+                return [], [Variable(target.attr, annotation)]
+            return [], []
+        elif isinstance(target, Subscript):
+            return [], []
+
+        # unpacked assignments (tuple, list or starred targets)
+        variables_collector = AssignedVariablesCollector(self.class_self_id, annotation)
+        variables_collector.visit(target)
+        return variables_collector.variables, variables_collector.self_attributes
 
     def visit_AnnAssign(self, node: AnnAssign):
-        variables_collector = AssignedVariablesCollector(self.class_self_id, node.annotation)
-        variables_collector.visit(node.target)
+        variables, self_attributes = self.collect_assigned_variables(node.target, node.annotation)
 
         short_type, full_namespaced_definitions = self.derive_type_annotation_details(node.annotation)
         # if any, there is at most one self-assignment
-        for variable in variables_collector.self_attributes:
+        for variable in self_attributes:
             self.uml_attributes.append(UmlAttribute(variable.id, short_type, static=False))
             self.extend_relations(full_namespaced_definitions)
 
         # if any, there is at most one typed variable added to the scope
-        self.variables_namespace.extend(variables_collector.variables)
+        self.add_to_namespace(variables)
 
     def visit_Assign(self, node: Assign):
         # recipients of the assignment
         for assigned_target in node.targets:
-            variables_collector = AssignedVariablesCollector(self.class_self_id, None)
-            variables_collector.visit(assigned_target)
+            variables, self_attributes = self.collect_assigned_variables(assigned_target, None)
 
             # attempts to infer attribute type when a single attribute is assigned to a variable
-            if (len(variables_collector.self_attributes) == 1) and (isinstance(node.value, Name)):
+            if (len(self_attributes) == 1) and (isinstance(node.value, Name)):
                 assigned_variable = self.get_from_namespace(node.value.id)
                 if assigned_variable is not None:
                     short_type, full_namespaced_definitions = self.derive_type_annotation_details(
                         assigned_variable.type_expr
                     )
-                    self.uml_attributes.append(
-                        UmlAttribute(variables_collector.self_attributes[0].id, short_type, False)
-                    )
+                    self.uml_attributes.append(UmlAttribute(self_attributes[0].id, short_type, False))
                     self.extend_relations(full_namespaced_definitions)
 
             else:
-                for variable in variables_collector.self_attributes:
+                for variable in self_attributes:
                     short_type, full_namespaced_definitions = self.derive_type_annotation_details(variable.type_expr)
                     self.uml_attributes.append(UmlAttribute(variable.id, short_type, static=False))
                     self.extend_relations(full_namespaced_definitions)
 
             # other assignments were done in new variables that can shadow existing ones
-            self.variables_namespace.extend(variables_collector.variables)
+            self.add_to_namespace(variables)
+
+    def get_source_segment(self, node: expr) -> str:
+        """
+        Same as ast.get_source_segment, on the lines of the constructor source split once: ast.get_source_segment
+        splits the source at each call, which is quadratic for the constructors made of many statements
+        """
+        lineno, end_lineno = node.lineno - 1, node.end_lineno - 1
+        if lineno == end_lineno:
+            return self.constructor_source_lines[lineno].encode()[node.col_offset : node.end_col_offset].decode()
+
+        return ''.join(
+            [
+                self.constructor_source_lines[lineno].encode()[node.col_offset :].decode(),
+                *self.constructor_source_lines[lineno + 1 : end_lineno],
+                self.constructor_source_lines[end_lineno].encode()[: node.end_col_offset].decode(),
+            ]
+        )
 
     def derive_type_annotation_details(self, annotation: expr) -> Tuple[str, List[str]]:
         """
@@ -182,14 +255,12 @@ class ConstructorVisitor(NodeVisitor):
         # definition from module
         elif isinstance(annotation, Attribute):
             full_namespaced_type, short_type = self.module_resolver.resolve_full_namespace_type(
-                get_source_segment(self.constructor_source, annotation)
+                self.get_source_segment(annotation)
             )
             return short_type, [full_namespaced_type]
         # compound type (List[...], Tuple[Dict[str, float], module.DomainType], etc.) or '|'-based union type
         elif isinstance(annotation, (Subscript, BinOp)):
-            return shorten_compound_type_annotation(
-                get_source_segment(self.constructor_source, annotation), self.module_resolver
-            )
+            return shorten_compound_type_annotation(self.get_source_segment(annotation), self.module_resolver)
 
         return None, []
 
@@ -0,0 +1,117 @@
+from ast import AST, Attribute, Call, GeneratorExp, Lambda, ListComp, Name, NodeVisitor, SetComp
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type, Union
+from weakref import WeakKeyDictionary
+
+from pyaas2puml.parsing.sourcelocator import get_class_definition
+
+INVARIANT_DECORATOR = 'invariant'
+IS_MODEL_REFERENCE_TO = 'is_model_reference_to'
+IS_MODEL_REFERENCE_TO_REFERABLE = 'is_model_reference_to_referable'
+
+
+class ModelReference(NamedTuple):
+    """
+    Model reference asserted by an invariant of a class:
+    - the name of the class attribute holding the reference
+    - the name of the key type of the referenced class (None for a reference to any referable)
+    """
+
+    attribute: str
+    key_type: Optional[str]
+
+
+class ModelReferencesCollector(NodeVisitor):
+    """
+    Collects the model references asserted in an invariant decorator, like:
+    - is_model_reference_to(self.derived_from, Key_types.Submodel)
+    - is_model_reference_to_referable(self.observed)
+    - all(is_model_reference_to(reference, Key_types.Submodel) for reference in self.submodels)
+    """
+
+    def __init__(self, class_self_id: str = 'self'):
+        self.class_self_id = class_self_id
+        # iterables of the variables bound by the enclosing comprehensions
+        self.iterables_by_variable: Dict[str, AST] = {}
+        self.model_references: List[ModelReference] = []
+
+    def visit_comprehension_expression(self, node: Union[GeneratorExp, ListComp, SetComp]):
+        enclosing_iterables_by_variable = dict(self.iterables_by_variable)
+        for generator in node.generators:
+            self.visit(generator.iter)
+            if isinstance(generator.target, Name):
+                self.iterables_by_variable[generator.target.id] = generator.iter
+        self.visit(node.elt)
+        self.iterables_by_variable = enclosing_iterables_by_variable
+
+    visit_GeneratorExp = visit_comprehension_expression
+    visit_ListComp = visit_comprehension_expression
+    visit_SetComp = visit_comprehension_expression
+
+    def visit_Call(self, node: Call):
+        function_name = node.func.id if isinstance(node.func, Name) else None
+        if function_name in (IS_MODEL_REFERENCE_TO, IS_MODEL_REFERENCE_TO_REFERABLE) and len(node.args) > 0:
+            referencing_attribute = self.get_self_attribute(node.args[0])
+            if referencing_attribute is not None:
+                key_type = None
+                # the key type is given as a member of the key types enumeration: Key_types.Submodel
+                if function_name == IS_MODEL_REFERENCE_TO and len(node.args) > 1:
+                    key_type_arg = node.args[1]
+                    key_type = (
+                        key_type_arg.attr if isinstance(key_type_arg, Attribute) else getattr(key_type_arg, 'id', None)
+                    )
+                self.model_references.append(ModelReference(referencing_attribute, key_type))
+
+        self.generic_visit(node)
+
+    def get_self_attribute(self, node: AST) -> Optional[str]:
+        """
+        Returns the name of the attribute of 'self' designated by the node, directly (self.attribute)
+        or through the variable of a comprehension iterating over it (reference for reference in self.attribute)
+        """
+        if isinstance(node, Name) and node.id in self.iterables_by_variable:
+            node = self.iterables_by_variable[node.id]
+        if isinstance(node, Attribute) and isinstance(node.value, Name) and node.value.id == self.class_self_id:
+            return node.attr
+
+        return None
+
+
+def is_invariant_decorator(decorator: AST) -> bool:
+    return isinstance(decorator, Call) and isinstance(decorator.func, Name) and decorator.func.id == INVARIANT_DECORATOR
+
+
+# the model references are extracted once per class, without preventing the classes from being garbage-collected
+_MODEL_REFERENCES_BY_CLASS: 'WeakKeyDictionary[Type, Tuple[ModelReference, ...]]' = WeakKeyDictionary()
+
+
+def get_model_references(class_type: Type) -> Tuple[ModelReference, ...]:
+    """
+    Returns the model references asserted by the invariant decorators of the given class, in the order of the
+    decorators. Only the first model reference of each invariant is retained.
+    """
+    model_references = _MODEL_REFERENCES_BY_CLASS.get(class_type)
+    if model_references is None:
+        class_definition = get_class_definition(class_type)
+        decorators = [] if class_definition is None else class_definition.decorator_list
+        model_references = tuple(
+            invariant_model_references[0]
+            for invariant_model_references in (
+                collect_model_references(decorator) for decorator in decorators if is_invariant_decorator(decorator)
+            )
+            if len(invariant_model_references) > 0
+        )
+        _MODEL_REFERENCES_BY_CLASS[class_type] = model_references
+
+    return model_references
+
+
+def collect_model_references(invariant: Call) -> List[ModelReference]:
+    # the reference to the instance is the argument of the invariant condition: lambda self: ...
+    condition = invariant.args[0] if len(invariant.args) > 0 else None
+    if isinstance(condition, Lambda) and len(condition.args.args) > 0:
+        collector = ModelReferencesCollector(condition.args.args[0].arg)
+    else:
+        collector = ModelReferencesCollector()
+    collector.visit(invariant)
+
+    return collector.model_references
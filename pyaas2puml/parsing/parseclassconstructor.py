@@ -8,6 +8,7 @@ from pyaas2puml.domain.umlclass import UmlAttribute
 from pyaas2puml.domain.umlrelation import UmlRelation
 from pyaas2puml.parsing.astvisitors import ConstructorVisitor
 from pyaas2puml.parsing.moduleresolver import ModuleResolver
+from pyaas2puml.parsing.sourcelocator import get_function_definition
 
 
 def parse_class_constructor(
@@ -31,12 +32,23 @@ def parse_class_constructor(
     # gets the original constructor, if wrapped by a decorator
     constructor = unwrap(constructor)
 
-    constructor_source: str = dedent(getsource(constructor.__code__))
-    constructor_ast: AST = parse(constructor_source)
-
     module_resolver = ModuleResolver(import_module(class_type.__module__))
 
-    visitor = ConstructorVisitor(constructor_source, class_type.__name__, root_module_name, module_resolver)
+    # the constructor is looked up in the parsed tree of its module, shared by all the constructors of the module
+    located_constructor = get_function_definition(constructor.__code__)
+    if located_constructor is None:
+        constructor_source: str = dedent(getsource(constructor.__code__))
+        constructor_ast: AST = parse(constructor_source)
+        visitor = ConstructorVisitor(constructor_source, class_type.__name__, root_module_name, module_resolver)
+    else:
+        module_source, constructor_ast = located_constructor
+        visitor = ConstructorVisitor(
+            module_source.source,
+            class_type.__name__,
+            root_module_name,
+            module_resolver,
+            constructor_source_lines=module_source.lines,
+        )
     visitor.visit(constructor_ast)
 
     return visitor.uml_attributes, visitor.uml_relations_by_target_fqn
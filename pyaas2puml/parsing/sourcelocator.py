@@ -0,0 +1,113 @@
+"""
+Locates the definitions of the classes and functions in the parsed tree of their module file: each file is read and
+parsed once, then the definitions are looked up by qualified name (classes) or by first line and name (functions).
+inspect.getsource reads and scans the lines of the file again for each definition.
+"""
+
+from ast import AsyncFunctionDef, ClassDef, FunctionDef, Module, NodeVisitor, parse
+from functools import lru_cache
+from io import StringIO
+from linecache import getlines
+from sys import modules
+from types import CodeType
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+FunctionDefinition = Union[FunctionDef, AsyncFunctionDef]
+
+# number of parsed module files kept in memory: the classes of a module are inspected one after another, the least
+# recently used trees are released when the inspection moves on to other modules
+MODULE_SOURCES_CACHE_SIZE = 32
+
+
+class ModuleSource(NamedTuple):
+    """
+    Source of a module file, with the indexes of its definitions:
+    - the source code and its lines, split like the Python parser does
+    - the class definitions by qualified name
+    - the function definitions by first line (the one of their first decorator, if any) and name
+    """
+
+    source: str
+    lines: List[str]
+    class_definitions: Dict[str, ClassDef]
+    function_definitions: Dict[Tuple[int, str], FunctionDefinition]
+
+
+class DefinitionsCollector(NodeVisitor):
+    """
+    Indexes the class definitions of a module by their qualified name and all the function definitions by their first
+    line and name
+    """
+
+    def __init__(self):
+        self.class_definitions: Dict[str, ClassDef] = {}
+        self.function_definitions: Dict[Tuple[int, str], FunctionDefinition] = {}
+        self.class_names: List[str] = []
+        # classes defined in functions are local classes, they cannot be found by their qualified name
+        self.function_depth = 0
+
+    def visit_ClassDef(self, node: ClassDef):
+        self.class_names.append(node.name)
+        if self.function_depth == 0:
+            self.class_definitions['.'.join(self.class_names)] = node
+        self.generic_visit(node)
+        self.class_names.pop()
+
+    def visit_FunctionDef(self, node: FunctionDefinition):
+        # the first line of the code object of a decorated function is the one of its first decorator
+        first_line = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+        self.function_definitions[(first_line, node.name)] = node
+
+        self.function_depth += 1
+        self.generic_visit(node)
+        self.function_depth -= 1
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
+@lru_cache(maxsize=MODULE_SOURCES_CACHE_SIZE)
+def get_module_source(file_path: str) -> Optional[ModuleSource]:
+    """
+    Reads and parses once the given module file (the parsed tree is shared by all its definitions), None if the
+    source is not available
+    """
+    source = ''.join(getlines(file_path))
+    if not source:
+        return None
+    try:
+        module_ast: Module = parse(source)
+    # the file may have been changed since the module was imported
+    except SyntaxError:
+        return None
+
+    collector = DefinitionsCollector()
+    collector.visit(module_ast)
+
+    return ModuleSource(
+        source,
+        StringIO(source, newline='').readlines(),
+        collector.class_definitions,
+        collector.function_definitions,
+    )
+
+
+def get_class_definition(class_type: Type) -> Optional[ClassDef]:
+    module_file = getattr(modules.get(class_type.__module__), '__file__', None)
+    module_source = None if module_file is None else get_module_source(module_file)
+    if module_source is None:
+        return None
+
+    return module_source.class_definitions.get(class_type.__qualname__)
+
+
+def get_function_definition(function_code: CodeType) -> Optional[Tuple[ModuleSource, FunctionDefinition]]:
+    """
+    Returns the definition of the function compiled in the given code object, with the source of its module.
+    Returns None for the functions which cannot be located this way (lambdas, functions compiled from strings, etc.)
+    """
+    module_source = get_module_source(function_code.co_filename)
+    if module_source is None:
+        return None
+
+    function_definition = module_source.function_definitions.get((function_code.co_firstlineno, function_code.co_name))
+    return None if function_definition is None else (module_source, function_definition)
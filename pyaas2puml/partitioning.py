@@ -0,0 +1,122 @@
+"""
+Partitioning of the items of a domain into clusters of bounded size, to be rendered as separate diagrams.
+
+The items are clustered:
+1. by connected components of the relation graph
+2. by module, for the components exceeding the size budget
+3. by chunks of items visited in breadth-first order, for the module groups still exceeding the size budget
+Then the small clusters are packed together (first-fit decreasing), so that the diagrams are filled up to the budget.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List
+
+from pyaas2puml.domain.umlrelation import UmlRelation
+
+
+def partition_items(
+    item_fqns: Iterable[str], relations: Iterable[UmlRelation], max_cluster_size: int
+) -> List[List[str]]:
+    """
+    Splits the given items into clusters of at most max_cluster_size items, keeping the related items together as
+    much as possible. The items of each cluster keep their given order, the clusters are ordered by their first item.
+    Runs in O(items + relations), besides the packing of the clusters.
+    """
+    if max_cluster_size < 1:
+        raise ValueError(f'the maximum size of the clusters must be positive, got {max_cluster_size}')
+
+    positions_by_fqn: Dict[str, int] = {fqn: position for position, fqn in enumerate(item_fqns)}
+    neighbours_by_fqn: Dict[str, List[str]] = {fqn: [] for fqn in positions_by_fqn}
+    for relation in relations:
+        source_fqn, target_fqn = relation.source_fqn, relation.target_fqn
+        if source_fqn != target_fqn and source_fqn in neighbours_by_fqn and target_fqn in neighbours_by_fqn:
+            neighbours_by_fqn[source_fqn].append(target_fqn)
+            neighbours_by_fqn[target_fqn].append(source_fqn)
+
+    clusters: List[List[str]] = []
+    for component in iter_connected_components(positions_by_fqn, neighbours_by_fqn):
+        if len(component) <= max_cluster_size:
+            clusters.append(component)
+            continue
+        for module_group in group_by_module(component):
+            if len(module_group) <= max_cluster_size:
+                clusters.append(module_group)
+            else:
+                clusters.extend(split_in_breadth_first_chunks(module_group, neighbours_by_fqn, max_cluster_size))
+
+    return [
+        sorted(cluster, key=positions_by_fqn.__getitem__)
+        for cluster in pack_clusters(clusters, max_cluster_size, positions_by_fqn)
+    ]
+
+
+def iter_connected_components(item_fqns: Iterable[str], neighbours_by_fqn: Dict[str, List[str]]) -> Iterator[List[str]]:
+    visited_fqns = set()
+    for start_fqn in item_fqns:
+        if start_fqn in visited_fqns:
+            continue
+        visited_fqns.add(start_fqn)
+        component = [start_fqn]
+        fqns_to_visit = deque(component)
+        while fqns_to_visit:
+            for neighbour_fqn in neighbours_by_fqn[fqns_to_visit.popleft()]:
+                if neighbour_fqn not in visited_fqns:
+                    visited_fqns.add(neighbour_fqn)
+                    component.append(neighbour_fqn)
+                    fqns_to_visit.append(neighbour_fqn)
+        yield component
+
+
+def group_by_module(item_fqns: Iterable[str]) -> List[List[str]]:
+    items_by_module: Dict[str, List[str]] = {}
+    for fqn in item_fqns:
+        items_by_module.setdefault(fqn.rpartition('.')[0], []).append(fqn)
+
+    return list(items_by_module.values())
+
+
+def split_in_breadth_first_chunks(
+    item_fqns: List[str], neighbours_by_fqn: Dict[str, List[str]], max_chunk_size: int
+) -> List[List[str]]:
+    """
+    Orders the items by a breadth-first traversal of their relations (restricted to the given items), starting with
+    the most connected items, and cuts this order into chunks: the neighbouring items tend to end in the same chunk
+    """
+    group_fqns = set(item_fqns)
+    group_neighbours_by_fqn = {
+        fqn: [neighbour_fqn for neighbour_fqn in neighbours_by_fqn[fqn] if neighbour_fqn in group_fqns]
+        for fqn in item_fqns
+    }
+    start_fqns = sorted(item_fqns, key=lambda fqn: len(group_neighbours_by_fqn[fqn]), reverse=True)
+    breadth_first_fqns = [
+        fqn for component in iter_connected_components(start_fqns, group_neighbours_by_fqn) for fqn in component
+    ]
+
+    return [
+        breadth_first_fqns[chunk_start : chunk_start + max_chunk_size]
+        for chunk_start in range(0, len(breadth_first_fqns), max_chunk_size)
+    ]
+
+
+def pack_clusters(
+    clusters: List[List[str]], max_cluster_size: int, positions_by_fqn: Dict[str, int]
+) -> List[List[str]]:
+    """
+    Packs the clusters into as few bins of max_cluster_size items as possible, with the first-fit decreasing heuristic
+    """
+    packed_clusters: List[List[str]] = []
+    for cluster in sorted(clusters, key=len, reverse=True):
+        target_cluster = next(
+            (
+                packed_cluster
+                for packed_cluster in packed_clusters
+                if len(packed_cluster) + len(cluster) <= max_cluster_size
+            ),
+            None,
+        )
+        if target_cluster is None:
+            packed_clusters.append(list(cluster))
+        else:
+            target_cluster.extend(cluster)
+
+    return sorted(packed_clusters, key=lambda packed_cluster: min(positions_by_fqn[fqn] for fqn in packed_cluster))
@@ -1,22 +1,33 @@
 import re
-from inspect import getsource
-from typing import Iterable, Optional, Dict, List, Tuple
+from collections import deque
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, AbstractSet, Iterable, Optional, Dict, List, Tuple, Union
 
-from pyaas2puml.domain.umlclass import UmlClass
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
 from pyaas2puml.domain.umlenum import UmlEnum
 from pyaas2puml.domain.umlitem import UmlItem
 from pyaas2puml.domain.umlrelation import UmlRelation, RelType
-from pyaas2puml.export.puml import to_puml_content
-from pyaas2puml.inspection.inspectmodule import filter_domain_relations
-from pyaas2puml.inspection.inspectpackage import inspect_package
-from pyaas2puml.utils import classname, has_decorator, snake_to_camel, plural_attribute_to_singular
+from pyaas2puml.export.fragments import PumlFragmentCache
+from pyaas2puml.relationsindex import RelationsIndex
+from pyaas2puml.snapshot import build_snapshot_header, load_snapshot, save_snapshot
+from pyaas2puml.utils import snake_to_camel, plural_attribute_to_singular
+
+if TYPE_CHECKING:
+    from pyaas2puml.inspection.compaction import ClassTraits
+    from pyaas2puml.inspection.profiling import InspectionProfile
+    from pyaas2puml.modeldiff import ModelDiff
 
 
 class AasPumlGenerator:
     REF_RELATION_SUFFIX = ":ref"
+    # kind of the models saved in the snapshots: the normalised AAS models
+    SNAPSHOT_MODEL_KIND = "aas-normalised"
 
     def __init__(self, domain_path: str, domain_module: str, domain_submodules: Iterable[str] = None,
-                 domain_items: Dict[str, UmlItem] = None, domain_relations: List[UmlRelation] = None):
+                 domain_items: Dict[str, UmlItem] = None, domain_relations: List[UmlRelation] = None,
+                 snapshot_path: Union[str, Path] = None, unload_domain_modules: bool = False,
+                 inspection_profile: "InspectionProfile" = None):
         """ Initialize the AAS PlantUML generator.
         :param domain_path: the path to the domain module.
         :param domain_module: the name of the domain module.
@@ -25,17 +36,25 @@ class AasPumlGenerator:
         :param domain_items: the domain items to include in the PlantUML. If given the domain module is not inspected.
         :param domain_relations: the domain relations to include in the PlantUML. If given the domain module is not
         inspected.
+        :param snapshot_path: the path to the snapshot of the normalised domain model. If the snapshot is up-to-date
+        with the sources of the domain, the domain module is not inspected. Otherwise, the inspected domain model is
+        saved in the snapshot for the next runs.
+        :param unload_domain_modules: once the domain module is inspected, remove its modules from the imported ones
+        and release their parsed sources, so that batch runs do not keep them in memory. The type references of the
+        inspected classes are released as well.
+        :param inspection_profile: records the import and inspection times of the domain modules, when the domain
+        module is inspected (see inspection.profiling.InspectionProfile).
         """
         self.domain_path = domain_path
         self.domain_module = domain_module
         self.domain_submodules = domain_submodules
-        if domain_items is None:
-            self.domain_items: Dict[str, UmlItem] = {}
-            self.domain_relations: List[UmlRelation] = []
-            self._inspect_package()
-        else:
-            self.domain_items = domain_items
-            self.domain_relations = domain_relations
+        self.unload_domain_modules = unload_domain_modules
+        self.inspection_profile = inspection_profile
+        self._attributes_with_parents_by_fqn: Optional[Dict[str, List[UmlAttribute]]] = None
+        self._classes_by_name: Dict[str, UmlClass] = {}
+        self._ref_cardinalities_by_attribute: Optional[Dict[Tuple[str, str], str]] = None
+        self._neighbours_by_fqn: Optional[Dict[str, List[Tuple[str, RelType]]]] = None
+        self._relations_index: Optional[RelationsIndex] = None
 
         self.regex_to_replace = {
             # Remove the following strings from the PlantUML file
@@ -62,20 +81,92 @@ class AasPumlGenerator:
         if domain_submodules:
             for submodule in domain_submodules:
                 self.regex_to_replace[fr"{snake_to_camel(submodule)}\."] = ""
+        # The rendered items and relations are shared by all the diagrams. The IDTA specific changes are applied to
+        # each fragment: they only rewrite text within lines
+        self._fragment_cache = PumlFragmentCache(self._apply_changes_to_puml_content)
+
+        # the domain items and relations are set once the caches computed from them exist (see invalidate)
+        if domain_items is None:
+            self._domain_items: Dict[str, UmlItem] = {}
+            self._domain_relations: List[UmlRelation] = []
+            self._load_snapshot_or_inspect_package(snapshot_path)
+        else:
+            self.domain_items = domain_items
+            self.domain_relations = domain_relations
+
+    @property
+    def domain_items(self) -> Dict[str, UmlItem]:
+        return self._domain_items
+
+    @domain_items.setter
+    def domain_items(self, domain_items: Dict[str, UmlItem]):
+        self._domain_items = domain_items
+        self.invalidate()
+
+    @property
+    def domain_relations(self) -> List[UmlRelation]:
+        return self._domain_relations
+
+    @domain_relations.setter
+    def domain_relations(self, domain_relations: List[UmlRelation]):
+        self._domain_relations = domain_relations
+        self.invalidate()
+
+    def invalidate(self):
+        """Clear the indexes and the rendered fragments computed from the domain items and relations, which are reused
+        by all the diagrams. It must be called once the domain items or relations are modified in place: assigning the
+        domain_items or domain_relations attributes calls it."""
+        self._attributes_with_parents_by_fqn = None
+        self._neighbours_by_fqn = None
+        self._relations_index = None
+        self._fragment_cache.clear()
+
+    def _load_snapshot_or_inspect_package(self, snapshot_path: Optional[Union[str, Path]]):
+        if snapshot_path is None:
+            self._inspect_package()
+            return
+
+        snapshot_header = build_snapshot_header(self.SNAPSHOT_MODEL_KIND, self.domain_path, self.domain_module,
+                                                self.domain_submodules)
+        snapshot = load_snapshot(snapshot_path, snapshot_header)
+        if snapshot is None:
+            self._inspect_package()
+            save_snapshot(snapshot_path, snapshot_header, self.domain_items, self.domain_relations)
+        else:
+            self.domain_items, self.domain_relations = snapshot
 
     def _inspect_package(self):
-        inspect_package(self.domain_path, self.domain_module, self.domain_items, self.domain_relations)
+        # the inspection modules are only imported when the domain is inspected: not when a snapshot is loaded
+        from pyaas2puml.inspection.compaction import (
+            extract_domain_class_traits, release_class_types, unload_domain_modules
+        )
+        from pyaas2puml.inspection.inspectpackage import inspect_package
+
+        inspect_package(
+            self.domain_path, self.domain_module, self.domain_items, self.domain_relations, self.domain_submodules,
+            inspection_profile=self.inspection_profile
+        )
+        # the selected submodules may import classes from other modules of the domain, they must be filtered out
         if self.domain_submodules:
             self._filter_domain_items_from_submodules()
+        # the passes below only need plain data extracted from the class types
+        class_traits_by_fqn = extract_domain_class_traits(self.domain_items)
+        if self.unload_domain_modules:
+            # the inspected items belong to the generator, their class types would keep the unloaded modules in memory
+            release_class_types(self.domain_items)
+            unload_domain_modules(self.domain_module)
         self._remove_duplicated_relations()
-        self._inspect_reference_relations()
+        self._index_domain_items()
+        self._inspect_reference_relations(class_traits_by_fqn)
         self._replace_compositions_with_dependencies()
-        self._set_aas_core_meta_abstract_classes_as_abstract()
+        self._set_aas_core_meta_abstract_classes_as_abstract(class_traits_by_fqn)
         self._use_values_in_enumerations_as_names()
         self._rename_snake_case_to_camel_case()
         self._rename_plural_attrs_labels_to_singular()
 
     def _filter_domain_items_from_submodules(self):
+        from pyaas2puml.inspection.inspectmodule import filter_domain_relations
+
         items_from_submodules = []
         for item in self.domain_items:
             for submodule in self.domain_submodules:
@@ -123,41 +214,13 @@ class AasPumlGenerator:
                 attr_name = plural_attribute_to_singular(rel.label.removesuffix(self.REF_RELATION_SUFFIX))
                 rel.label = f"{attr_name}{self.REF_RELATION_SUFFIX}"
 
-    def _inspect_reference_relations(self):
-        domain_classes_with_invariant_decorator = [i for i in self.domain_items.values() if
-                                                   isinstance(i, UmlClass) and has_decorator(i.class_type, "invariant")]
-        for item in domain_classes_with_invariant_decorator:
-            # Get the source code of the class
-            source = getsource(item.class_type)
-            # Get list of decorators source code
-            decorators = source[:source.find("\nclass ")].lstrip("@").split("\n@")
-            # Make a list of invariant decorators source code
-            invariants = [decorator for decorator in decorators if decorator.split("(")[0] == "invariant"]
-            # In each decorator search for 'is_model_reference_to' and for its args (including list comprehensions)
-            for invariant_src in invariants:
-                if "is_model_reference_to" not in invariant_src:
-                    continue
-
-                # Get the args of the 'is_model_reference_to' or 'is_model_reference_to_referable' func
-                if "is_model_reference_to_referable" in invariant_src:
-                    is_model_ref_to_regex = r"is_model_reference_to_referable\(\s*(\S+)\s*\)"
-                    is_model_ref_to_search = re.search(is_model_ref_to_regex, invariant_src)
-                    ref_attr = is_model_ref_to_search.group(1)
-                    target_cls = ".".join(classname(item.class_type).split(".")[:-1]) + ".Referable"
-                elif "is_model_reference_to" in invariant_src:
-                    is_model_ref_to_regex = r"is_model_reference_to\(\s*(\S+)\s*,\s*(\S+)?\s*\)"
-                    is_model_ref_to_search = re.search(is_model_ref_to_regex, invariant_src)
-                    ref_attr = is_model_ref_to_search.group(1)
-                    key_type_attr = is_model_ref_to_search.group(2)
-                    target_cls = ".".join(classname(item.class_type).split(".")[:-1]) + "." + key_type_attr.split(".")[-1]
-
-                if not ref_attr.startswith("self."):
-                    # Search for list comprehension
-                    is_model_ref_to_regex_with_list_comprehension = rf"\(\s*{is_model_ref_to_regex}\s*for (.+?) in (\S+)\s*\)"
-                    ref_attr = re.search(is_model_ref_to_regex_with_list_comprehension, invariant_src).group(4)
-                # Get the class name from the args
-                # Create a relation between the current class and found class argument
-                self._create_ref_relation(item.fqn, ref_attr.removeprefix("self."), target_cls)
+    def _inspect_reference_relations(self, class_traits_by_fqn: Dict[str, "ClassTraits"]):
+        for fqn, class_traits in class_traits_by_fqn.items():
+            # The model references are asserted by the 'is_model_reference_to' functions in the invariant decorators
+            for model_reference in class_traits.model_references:
+                target_cls = f"{class_traits.namespace}.{model_reference.key_type or 'Referable'}"
+                # Create a relation between the current class and the referenced class
+                self._create_ref_relation(fqn, model_reference.attribute, target_cls)
 
     def _create_ref_relation(self, source_cls: str, attr: str, target_cls: str):
         ref_cardinality = self._identify_ref_target_cardinality(source_cls, attr)
@@ -166,27 +229,37 @@ class AasPumlGenerator:
                                                  target_cardinality=ref_cardinality))
 
     def _identify_ref_target_cardinality(self, source_cls, attr):
-        for i in self.domain_items.values():
-            if isinstance(i, UmlClass) and i.name == "Reference":
-                reference_cls = i
-                break
-        else:
+        if self._ref_cardinalities_by_attribute is None:
             raise ValueError("Reference class not found in the domain items")
+        return self._ref_cardinalities_by_attribute.get((source_cls, attr))
 
-        source_class: UmlClass = self.domain_items.get(source_cls)
-        if source_class is None or reference_cls is None:
-            return None
-        for attribute in source_class.attributes:
-            if attribute.name == attr:
-                if attribute.type == f"Optional[List[{reference_cls.name}]]":
-                    return "0..*"
-                elif attribute.type == f"List[{reference_cls.name}]":
-                    return "1..*"
-                elif attribute.type == f"Optional[{reference_cls.name}]":
-                    return "0..1"
-                elif attribute.type == reference_cls.name:
-                    return "1"
-        return None
+    def _index_domain_items(self):
+        """Index the classes by name and the attributes typed with the Reference class by class and attribute name,
+        so that the creation of each reference relation is a dictionary lookup."""
+        self._classes_by_name = {}
+        for item in self.domain_items.values():
+            if isinstance(item, UmlClass):
+                self._classes_by_name.setdefault(item.name, item)
+
+        reference_cls: Optional[UmlClass] = self._classes_by_name.get("Reference")
+        if reference_cls is None:
+            self._ref_cardinalities_by_attribute = None
+            return
+
+        ref_cardinalities_by_type = {
+            f"Optional[List[{reference_cls.name}]]": "0..*",
+            f"List[{reference_cls.name}]": "1..*",
+            f"Optional[{reference_cls.name}]": "0..1",
+            reference_cls.name: "1",
+        }
+        self._ref_cardinalities_by_attribute = {}
+        for item in self.domain_items.values():
+            if isinstance(item, UmlClass):
+                for attribute in item.attributes:
+                    ref_cardinality = ref_cardinalities_by_type.get(attribute.type)
+                    # the first attribute with the given name and typed with the Reference class gives the cardinality
+                    if ref_cardinality is not None:
+                        self._ref_cardinalities_by_attribute.setdefault((item.fqn, attribute.name), ref_cardinality)
 
     def _replace_compositions_with_dependencies(self):
         """Replace compositions with dependencies in the domain relations."""
@@ -194,16 +267,16 @@ class AasPumlGenerator:
             if rel.type == RelType.COMPOSITION:
                 rel.type = RelType.DEPENDENCY
 
-    def _set_aas_core_meta_abstract_classes_as_abstract(self):
+    def _set_aas_core_meta_abstract_classes_as_abstract(self, class_traits_by_fqn: Dict[str, "ClassTraits"]):
         """
         Set the is_abstract attribute to True for abstract classes from aas-core-meta
 
         This is done, because standard isabstract() function does not work for abstract classes in aas-core-meta,
         as they are not defined as abstract classes in the source code, but marked with a decorator 'abstract'
         """
-        for item in self.domain_items.values():
-            if isinstance(item, UmlClass) and has_decorator(item.class_type, 'abstract'):
-                item.is_abstract = True
+        for fqn, class_traits in class_traits_by_fqn.items():
+            if class_traits.has_decorator('abstract'):
+                self.domain_items[fqn].is_abstract = True
 
     def _use_values_in_enumerations_as_names(self):
         for item in self.domain_items.values():
@@ -214,77 +287,245 @@ class AasPumlGenerator:
 
     def generate_puml(self, domain_items_to_keep: Optional[List[str]] = None,
                       to_include_members_from_parents: bool = False,
-                      sort_members=False) -> str:
+                      sort_members=False, hops: Optional[int] = None,
+                      relation_types: Optional[Iterable[RelType]] = None) -> str:
         """Create a PlantUML file from the classes in the domain module.
+        The domain items and relations of the generator are left unchanged, so that it can generate several diagrams.
+        The items and relations are rendered once for all the diagrams: invalidate must be called when they are modified.
         :param domain_items_to_keep: the items to include in the PlantUML file. If None, all items are included.
         :param to_include_members_from_parents: include the members from the parent classes in the child classes.
         :param sort_members: sort the members of the classes alphabetically.
+        :param hops: if given, the items to keep are the seeds of the diagram, which also includes the items reachable
+        from them through at most this number of relations (see get_neighbourhood).
+        :param relation_types: the types of the relations followed to reach the neighbours of the seeds. If None, all
+        the relations are followed.
         """
-        if to_include_members_from_parents:
-            self._include_members_from_parents()
+        domain_items: Dict[str, UmlItem] = self.domain_items
+        domain_relations: List[UmlRelation] = self.domain_relations
+        if domain_items_to_keep and hops is not None:
+            domain_items_to_keep = self.get_neighbourhood(domain_items_to_keep, hops, relation_types)
         if domain_items_to_keep:
-            self._handle_classes_and_relations_filtering(domain_items_to_keep)
-        puml_content = ''.join(to_puml_content(self.domain_module, self.domain_items.values(), self.domain_relations,
-                                               sort_members)).removesuffix("\n")
-        # Apply IDTA specific changes to the PlantUML content and write it to the output file
-        idta_puml_content = self._apply_changes_to_puml_content(puml_content)
-        return idta_puml_content
-
-    def _include_members_from_parents(self):
-        """Include the members from the parent classes in the child classes."""
-        inheritance_rels = [rel for rel in self.domain_relations if rel.type == RelType.INHERITANCE]
-        while len(inheritance_rels) > 0:
-            self._incl_members_from_parents(inheritance_rels, inheritance_rels[0])
-
-    def _incl_members_from_parents(self, inheritance_relations: List[UmlRelation], inheritance_rel):
-        parent = self.domain_items.get(inheritance_rel.source_fqn)
-        child = self.domain_items.get(inheritance_rel.target_fqn)
-
-        parent_inheritance_rels = [rel for rel in inheritance_relations if rel.target_fqn == parent.fqn]
-        for rel in parent_inheritance_rels:
-            self._incl_members_from_parents(inheritance_relations, rel)
-
-        for attr in parent.attributes:
-            if attr in child.attributes:
-                continue
-            child.attributes.append(attr)
-        inheritance_relations.remove(inheritance_rel)
-
-    def _handle_classes_and_relations_filtering(self, domain_items_to_keep: List[str], sort_classes=True):
-        all_inheritances: List[Tuple[str, str]] = self._get_inheritances()
-        self._filter_items_and_relations(domain_items_to_keep)
-        remain_inheritances: List[Tuple[str, str]] = self._get_inheritances()
-        removed_inheritances = [inheritance for inheritance in all_inheritances if
-                                inheritance not in remain_inheritances]
-        self._add_filtered_out_parent_classes_as_generics(removed_inheritances)
-
-        if sort_classes:
-            self._sort_classes(domain_items_to_keep)
+            domain_items, domain_relations = self._handle_classes_and_relations_filtering(domain_items_to_keep)
+        return self._render_puml(domain_items, domain_relations, to_include_members_from_parents, sort_members)
+
+    def generate_partitioned_pumls(self, max_items_per_diagram: int, to_include_members_from_parents: bool = False,
+                                   sort_members=False) -> List[Tuple[List[str], str]]:
+        """Split the domain items into clusters of related items and create a PlantUML file for each cluster, so that
+        huge domains are drawn in diagrams of bounded size (see partitioning.partition_items).
+        The items outside a cluster which are related to its items are drawn as stubs (classes without members),
+        so that the relations crossing the clusters are kept.
+        :param max_items_per_diagram: the maximum number of items of a cluster (the stubs are not counted).
+        :param to_include_members_from_parents: include the members from the parent classes in the child classes.
+        :param sort_members: sort the members of the classes alphabetically.
+        :return: the fqns of the items of each cluster, with the PlantUML content drawing them.
+        """
+        from pyaas2puml.partitioning import partition_items
+
+        neighbours_by_fqn = self._get_neighbours_by_fqn()
+        partitioned_pumls = []
+        for cluster_fqns in partition_items(self.domain_items, self.domain_relations, max_items_per_diagram):
+            cluster_fqns_set = set(cluster_fqns)
+            stub_fqns = list(dict.fromkeys(
+                neighbour_fqn for fqn in cluster_fqns for neighbour_fqn, _ in neighbours_by_fqn.get(fqn, ())
+                if neighbour_fqn not in cluster_fqns_set and neighbour_fqn in self.domain_items
+            ))
+            domain_items, domain_relations = self._handle_classes_and_relations_filtering(cluster_fqns + stub_fqns)
+            # the relations between the stubs belong to other clusters
+            domain_relations = [rel for rel in domain_relations
+                                if rel.source_fqn in cluster_fqns_set or rel.target_fqn in cluster_fqns_set]
+            partitioned_pumls.append((cluster_fqns, self._render_puml(
+                domain_items, domain_relations, to_include_members_from_parents, sort_members, set(stub_fqns))))
+
+        return partitioned_pumls
+
+    def get_items_fqn_prefix(self) -> str:
+        """Return the prefix of the fqns of the domain items: the name of the domain module, followed by the name of
+        the submodule when the items come from a single submodule."""
+        if self.domain_submodules and len(self.domain_submodules) == 1:
+            return f"{snake_to_camel(self.domain_module)}.{snake_to_camel(self.domain_submodules[0])}."
+        return f"{snake_to_camel(self.domain_module)}."
+
+    def diff(self, old_generator: "AasPumlGenerator") -> "ModelDiff":
+        """Compute the changes between the domain of the given generator and the domain of this generator. The items
+        are compared by their fqn relative to their domain (see get_items_fqn_prefix).
+        """
+        from pyaas2puml.modeldiff import diff_models
 
-    def _get_inheritances(self) -> List[Tuple[str, str]]:
-        return [(rel.source_fqn, rel.target_fqn) for rel in self.domain_relations if rel.type == RelType.INHERITANCE]
+        return diff_models(old_generator.domain_items, old_generator.domain_relations, self.domain_items,
+                           self.domain_relations, old_generator.get_items_fqn_prefix(), self.get_items_fqn_prefix())
 
-    def _filter_items_and_relations(self, only_domain_items: List[str]):
-        for fqn in list(self.domain_items.keys()):
-            if fqn not in only_domain_items:
-                del self.domain_items[fqn]
-        filter_domain_relations(self.domain_items, self.domain_relations)
+    def generate_puml_diff(self, model_diff: "ModelDiff") -> str:
+        """Create a PlantUML file drawing only the changes of the given model diff (see modeldiff.to_puml_diff_content).
+        """
+        from pyaas2puml.modeldiff import to_puml_diff_content
+
+        puml_content = ''.join(to_puml_diff_content(model_diff)).removesuffix("\n")
+        return self._apply_changes_to_puml_content(puml_content)
+
+    @staticmethod
+    def _as_stub(item: UmlItem) -> UmlItem:
+        if isinstance(item, UmlClass):
+            return replace(item, attributes=[], generics="")
+        elif isinstance(item, UmlEnum):
+            return replace(item, members=[])
+        return item
+
+    def _render_puml(self, domain_items: Dict[str, UmlItem], domain_relations: List[UmlRelation],
+                     to_include_members_from_parents: bool, sort_members: bool,
+                     stub_fqns: AbstractSet[str] = frozenset()) -> str:
+        """Concatenate the fragments of the items and relations, with the IDTA specific changes applied. The fragment
+        of an item is rendered once per set of rendering options: the domain items must be left unchanged."""
+        fragment_cache = self._fragment_cache
+        puml_fragments = [fragment_cache.file_start]
+        for fqn, item in domain_items.items():
+            is_stub = fqn in stub_fqns
+            # the generics are the parents filtered out of the diagram: they differ between the diagrams
+            item_key = (fqn, item.generics, to_include_members_from_parents, sort_members, is_stub)
+            item_fragment = fragment_cache.get_item_fragment(item_key)
+            if item_fragment is None:
+                item_fragment = fragment_cache.add_item_fragment(
+                    item_key, self._prepare_item_to_render(fqn, item, to_include_members_from_parents, is_stub),
+                    sort_members)
+            puml_fragments.append(item_fragment)
+        puml_fragments.extend(fragment_cache.get_relations_fragments(domain_relations))
+        puml_fragments.append(fragment_cache.file_end)
+
+        return ''.join(puml_fragments).removesuffix("\n")
+
+    def _prepare_item_to_render(self, fqn: str, item: UmlItem, to_include_members_from_parents: bool,
+                                is_stub: bool) -> UmlItem:
+        if is_stub:
+            return self._as_stub(item)
+        if to_include_members_from_parents:
+            attributes_with_parents = self._get_attributes_with_parents_by_fqn().get(fqn)
+            if attributes_with_parents is not None:
+                item = replace(item, attributes=attributes_with_parents)
+        return item
+
+    def get_neighbourhood(self, seed_fqns: Iterable[str], hops: int,
+                          relation_types: Optional[Iterable[RelType]] = None) -> List[str]:
+        """Return the fqns of the seed items followed by the ones of the items reachable from them through at most
+        the given number of relations, followed in both directions, in breadth-first order.
+        Only the relations whose endpoints are visited are browsed, in the index of the relations built once.
+        :param seed_fqns: the fqns of the items from which the neighbourhood is explored.
+        :param hops: the maximum number of relations between a seed and an item of its neighbourhood.
+        :param relation_types: the types of the followed relations. If None, all the relations are followed.
+        """
+        neighbours_by_fqn = self._get_neighbours_by_fqn()
+        followed_types = None if relation_types is None else set(relation_types)
+        # the dictionary keeps the order in which the items are visited
+        visited_fqns: Dict[str, None] = dict.fromkeys(seed_fqns)
+        hop_fqns = list(visited_fqns)
+        for _ in range(hops):
+            next_hop_fqns = []
+            for fqn in hop_fqns:
+                for neighbour_fqn, rel_type in neighbours_by_fqn.get(fqn, ()):
+                    if neighbour_fqn not in visited_fqns and (followed_types is None or rel_type in followed_types):
+                        visited_fqns[neighbour_fqn] = None
+                        next_hop_fqns.append(neighbour_fqn)
+            if not next_hop_fqns:
+                break
+            hop_fqns = next_hop_fqns
+
+        return list(visited_fqns)
+
+    def _get_neighbours_by_fqn(self) -> Dict[str, List[Tuple[str, RelType]]]:
+        """Index once the relations by item, in both directions: the source item of a relation is a neighbour of its
+        target item and conversely."""
+        if self._neighbours_by_fqn is None:
+            self._neighbours_by_fqn = {}
+            for rel in self.domain_relations:
+                self._neighbours_by_fqn.setdefault(rel.source_fqn, []).append((rel.target_fqn, rel.type))
+                self._neighbours_by_fqn.setdefault(rel.target_fqn, []).append((rel.source_fqn, rel.type))
+        return self._neighbours_by_fqn
+
+    def _get_attributes_with_parents_by_fqn(self) -> Dict[str, List[UmlAttribute]]:
+        """Merge once the attributes of each class with the ones of its ancestors, which are merged before their
+        children (topological order of the inheritance graph). The merged attributes are reused for every diagram.
+        """
+        if self._attributes_with_parents_by_fqn is not None:
+            return self._attributes_with_parents_by_fqn
 
-    def _add_filtered_out_parent_classes_as_generics(self, removed_inheritances: List[Tuple[str, str]]):
+        parents_by_child: Dict[str, List[str]] = {
+            fqn: [] for fqn, item in self.domain_items.items() if isinstance(item, UmlClass)
+        }
+        children_by_parent: Dict[str, List[str]] = {fqn: [] for fqn in parents_by_child}
+        for rel in self.domain_relations:
+            if rel.type == RelType.INHERITANCE and rel.source_fqn in parents_by_child \
+                    and rel.target_fqn in parents_by_child:
+                parents_by_child[rel.target_fqn].append(rel.source_fqn)
+                children_by_parent[rel.source_fqn].append(rel.target_fqn)
+
+        attributes_with_parents_by_fqn: Dict[str, List[UmlAttribute]] = {}
+        unmerged_parents_counts = {fqn: len(parents) for fqn, parents in parents_by_child.items()}
+        classes_to_merge = deque(fqn for fqn, parents_count in unmerged_parents_counts.items() if parents_count == 0)
+        while classes_to_merge:
+            fqn = classes_to_merge.popleft()
+            attributes = list(self.domain_items[fqn].attributes)
+            attribute_keys = {self._attribute_key(attr) for attr in attributes}
+            # the attributes of the parents come after the attributes of the class, in the order of the relations
+            for parent_fqn in parents_by_child[fqn]:
+                for parent_attr in attributes_with_parents_by_fqn[parent_fqn]:
+                    parent_attr_key = self._attribute_key(parent_attr)
+                    if parent_attr_key not in attribute_keys:
+                        attribute_keys.add(parent_attr_key)
+                        attributes.append(parent_attr)
+            attributes_with_parents_by_fqn[fqn] = attributes
+
+            for child_fqn in children_by_parent[fqn]:
+                unmerged_parents_counts[child_fqn] -= 1
+                if unmerged_parents_counts[child_fqn] == 0:
+                    classes_to_merge.append(child_fqn)
+
+        self._attributes_with_parents_by_fqn = attributes_with_parents_by_fqn
+        return attributes_with_parents_by_fqn
+
+    @staticmethod
+    def _attribute_key(attr: UmlAttribute) -> Tuple[str, str, bool]:
+        # the fields compared by UmlAttribute.__eq__
+        return attr.name, attr.type, attr.static
+
+    def _handle_classes_and_relations_filtering(self, domain_items_to_keep: List[str], sort_classes=True
+                                                ) -> Tuple[Dict[str, UmlItem], List[UmlRelation]]:
+        """Keep the given domain items and the relations between them, selected in the index of the relations."""
+        if sort_classes:
+            # the classes appear in the order in which they should appear in the PlantUML file
+            domain_items = {fqn: self.domain_items[fqn] for fqn in domain_items_to_keep if fqn in self.domain_items}
+        else:
+            kept_fqns = set(domain_items_to_keep)
+            domain_items = {fqn: item for fqn, item in self.domain_items.items() if fqn in kept_fqns}
+
+        relations_index = self._get_relations_index()
+        kept_targets_bitset = relations_index.get_targets_bitset(domain_items)
+        kept_relations_bitset = relations_index.get_sources_bitset(domain_items) & kept_targets_bitset
+        domain_relations = list(relations_index.iter_relations(kept_relations_bitset))
+        # the inheritances whose child is kept and whose parent is filtered out
+        removed_inheritances_bitset = relations_index.inheritances_bitset & kept_targets_bitset & ~kept_relations_bitset
+        removed_inheritances = [(rel.source_fqn, rel.target_fqn)
+                                for rel in relations_index.iter_relations(removed_inheritances_bitset)]
+        self._add_filtered_out_parent_classes_as_generics(domain_items, removed_inheritances)
+
+        return domain_items, domain_relations
+
+    def _get_relations_index(self) -> RelationsIndex:
+        """Index once the relations as bitsets, used to select the relations of each diagram."""
+        if self._relations_index is None:
+            self._relations_index = RelationsIndex(self.domain_relations)
+        return self._relations_index
+
+    @staticmethod
+    def _add_filtered_out_parent_classes_as_generics(domain_items: Dict[str, UmlItem],
+                                                     removed_inheritances: List[Tuple[str, str]]):
         """Add classes that are filtered out from the PlantUML file and will be not shown in the diagram,
         as generics to the classes that inherit from them.
         """
         for parent, child in removed_inheritances:
-            if child in self.domain_items:
-                if self.domain_items[child].generics:
-                    self.domain_items[child].generics = rf"{self.domain_items[child].generics}\n{parent}"
+            if child in domain_items:
+                if domain_items[child].generics:
+                    domain_items[child] = replace(domain_items[child],
+                                                  generics=rf"{domain_items[child].generics}\n{parent}")
                 else:
-                    self.domain_items[child].generics = parent
-
-    def _sort_classes(self, items_order: Iterable[str]):
-        # Sort the classes in the order as they should appear in the PlantUML file
-        sorted_domain_items = {fqn: self.domain_items[fqn] for fqn in items_order if fqn in self.domain_items}
-        self.domain_items = sorted_domain_items
+                    domain_items[child] = replace(domain_items[child], generics=parent)
 
     def _apply_changes_to_puml_content(self, text: str) -> str:
         for pattern, repl in self.regex_to_replace.items():
@@ -292,6 +533,8 @@ class AasPumlGenerator:
         return text
 
 
-def pyaas2puml(domain_path: str, domain_module: str) -> Iterable[str]:
-    generator = AasPumlGenerator(domain_path, domain_module)
+def pyaas2puml(domain_path: str, domain_module: str, snapshot_path: Union[str, Path] = None,
+               inspection_profile: "InspectionProfile" = None) -> Iterable[str]:
+    generator = AasPumlGenerator(domain_path, domain_module, snapshot_path=snapshot_path,
+                                 inspection_profile=inspection_profile)
     return generator.generate_puml()
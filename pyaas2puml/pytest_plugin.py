@@ -0,0 +1,71 @@
+"""
+Pytest plugin shipped with pyaas2puml (registered with the pytest11 entry point of the package): the inspected models
+of the domains are cached for the whole test session, so that each domain is inspected once whatever the number of
+tests documenting it.
+
+.. code-block:: python
+
+    def test_domain_diagram_is_up_to_date(inspected_models: InspectedModelsCache):
+        assert_puml_is_file_content(inspected_models.py2puml('src/domain', 'domain'), 'docs/domain.puml')
+"""
+
+from os.path import normpath
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Tuple
+
+from pytest import fixture
+
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import UmlRelation
+
+
+class InspectedModel(NamedTuple):
+    """
+    Inspected model of a domain: the items by fully-qualified name and the relations. Only the containers are frozen
+    (a read-only mapping and a tuple): the items and relations themselves are mutable objects shared by the tests of
+    the session, they must not be modified
+    """
+
+    items_by_fqn: Mapping[str, UmlItem]
+    relations: Tuple[UmlRelation, ...]
+
+
+class InspectedModelsCache:
+    def __init__(self):
+        self._models_by_domain: Dict[Tuple[str, str], InspectedModel] = {}
+
+    def get_model(self, domain_path: str, domain_module: str) -> InspectedModel:
+        """
+        Returns the model of the domain, inspected at the first call only
+        """
+        domain_key = (normpath(domain_path), domain_module)
+        inspected_model = self._models_by_domain.get(domain_key)
+        if inspected_model is None:
+            # the inspection modules are only imported when a domain is inspected
+            from pyaas2puml.inspection.inspectpackage import inspect_package
+
+            domain_items_by_fqn: Dict[str, UmlItem] = {}
+            domain_relations = []
+            inspect_package(domain_path, domain_module, domain_items_by_fqn, domain_relations)
+            inspected_model = self._models_by_domain[domain_key] = InspectedModel(
+                MappingProxyType(domain_items_by_fqn), tuple(domain_relations)
+            )
+
+        return inspected_model
+
+    def py2puml(self, domain_path: str, domain_module: str) -> Iterable[str]:
+        """
+        Same contents as pyaas2puml.py2puml.py2puml, generated from the cached model of the domain
+        """
+        from pyaas2puml.export.puml import to_puml_content
+
+        inspected_model = self.get_model(domain_path, domain_module)
+        return to_puml_content(domain_module, inspected_model.items_by_fqn.values(), inspected_model.relations)
+
+    def clear(self):
+        self._models_by_domain.clear()
+
+
+@fixture(scope='session')
+def inspected_models() -> InspectedModelsCache:
+    return InspectedModelsCache()
@@ -0,0 +1,64 @@
+"""
+Index of the relations of a domain as bitsets, to select the relations drawn in a diagram without browsing all of them:
+the bit i of a bitset (a Python integer) stands for the i-th relation of the domain. Each item fqn is mapped to the
+bitset of the relations it is the source of and to the bitset of the relations it is the target of.
+
+The relations between the items of a diagram are then the intersection of the union of the source bitsets of its items
+with the union of their target bitsets: operations on integers whose cost depends on the number of items of the
+diagram, not on the number of relations of the domain.
+"""
+
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+
+
+def indexes_to_bitset(indexes: Iterable[int]) -> int:
+    return reduce(or_, (1 << index for index in indexes), 0)
+
+
+class RelationsIndex:
+    def __init__(self, domain_relations: Sequence[UmlRelation]):
+        self.relations: List[UmlRelation] = list(domain_relations)
+        source_indexes_by_fqn: Dict[str, List[int]] = {}
+        target_indexes_by_fqn: Dict[str, List[int]] = {}
+        inheritance_indexes: List[int] = []
+        for relation_index, relation in enumerate(self.relations):
+            source_indexes_by_fqn.setdefault(relation.source_fqn, []).append(relation_index)
+            target_indexes_by_fqn.setdefault(relation.target_fqn, []).append(relation_index)
+            if relation.type == RelType.INHERITANCE:
+                inheritance_indexes.append(relation_index)
+
+        self._source_bitsets_by_fqn: Dict[str, int] = {
+            fqn: indexes_to_bitset(indexes) for fqn, indexes in source_indexes_by_fqn.items()
+        }
+        self._target_bitsets_by_fqn: Dict[str, int] = {
+            fqn: indexes_to_bitset(indexes) for fqn, indexes in target_indexes_by_fqn.items()
+        }
+        self.inheritances_bitset = indexes_to_bitset(inheritance_indexes)
+
+    def get_sources_bitset(self, fqns: Iterable[str]) -> int:
+        """
+        Returns the bitset of the relations whose source is one of the given items
+        """
+        source_bitsets_by_fqn = self._source_bitsets_by_fqn
+        return reduce(or_, (source_bitsets_by_fqn.get(fqn, 0) for fqn in fqns), 0)
+
+    def get_targets_bitset(self, fqns: Iterable[str]) -> int:
+        """
+        Returns the bitset of the relations whose target is one of the given items
+        """
+        target_bitsets_by_fqn = self._target_bitsets_by_fqn
+        return reduce(or_, (target_bitsets_by_fqn.get(fqn, 0) for fqn in fqns), 0)
+
+    def iter_relations(self, relations_bitset: int) -> Iterator[UmlRelation]:
+        """
+        Yields the relations of the bitset, in the order of the domain relations
+        """
+        relations = self.relations
+        while relations_bitset:
+            lowest_bit = relations_bitset & -relations_bitset
+            yield relations[lowest_bit.bit_length() - 1]
+            relations_bitset ^= lowest_bit
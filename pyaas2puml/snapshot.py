@@ -0,0 +1,90 @@
+"""
+Snapshots of inspected domain models, to render diagrams without importing and inspecting the domain again.
+
+A snapshot is a binary file made of 2 pickled objects:
+- a SnapshotHeader, which is read first to check that the snapshot is still valid
+- the domain items and relations, whose class_type references are stripped
+
+Snapshots are pickle files: only load the snapshots that you created.
+"""
+
+from dataclasses import dataclass, replace
+from hashlib import sha256
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, UnpicklingError, dump, load
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from pyaas2puml.domain.umlclass import UmlClass
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import UmlRelation
+
+# to be incremented when the structure of the domain classes or the normalisation of the models change
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SnapshotHeader:
+    format_version: int
+    # which inspection produced the model (raw inspection of the package, normalised AAS model, etc.)
+    model_kind: str
+    domain_module: str
+    domain_submodules: Optional[Tuple[str, ...]]
+    sources_hash: str
+
+
+def hash_domain_sources(domain_path: Union[str, Path]) -> str:
+    """
+    Hashes the paths and the contents of the Python files of the domain: reading them is much faster
+    than importing and inspecting them
+    """
+    domain_root = Path(domain_path)
+    sources_hash = sha256()
+    for source_path in sorted(domain_root.rglob('*.py')):
+        sources_hash.update(source_path.relative_to(domain_root).as_posix().encode('utf8'))
+        sources_hash.update(source_path.read_bytes())
+
+    return sources_hash.hexdigest()
+
+
+def build_snapshot_header(
+    model_kind: str, domain_path: Union[str, Path], domain_module: str, domain_submodules: Iterable[str] = None
+) -> SnapshotHeader:
+    return SnapshotHeader(
+        format_version=SNAPSHOT_FORMAT_VERSION,
+        model_kind=model_kind,
+        domain_module=domain_module,
+        domain_submodules=None if domain_submodules is None else tuple(domain_submodules),
+        sources_hash=hash_domain_sources(domain_path),
+    )
+
+
+def without_class_type(uml_item: UmlItem) -> UmlItem:
+    return replace(uml_item, class_type=None) if isinstance(uml_item, UmlClass) else uml_item
+
+
+def save_snapshot(
+    snapshot_path: Union[str, Path],
+    header: SnapshotHeader,
+    domain_items_by_fqn: Dict[str, UmlItem],
+    domain_relations: List[UmlRelation],
+):
+    domain_items_by_fqn = {fqn: without_class_type(uml_item) for fqn, uml_item in domain_items_by_fqn.items()}
+    with open(snapshot_path, 'wb') as snapshot_file:
+        dump(header, snapshot_file, protocol=HIGHEST_PROTOCOL)
+        dump((domain_items_by_fqn, domain_relations), snapshot_file, protocol=HIGHEST_PROTOCOL)
+
+
+def load_snapshot(
+    snapshot_path: Union[str, Path], expected_header: SnapshotHeader
+) -> Optional[Tuple[Dict[str, UmlItem], List[UmlRelation]]]:
+    """
+    Returns the domain items and relations of the snapshot, or None if the snapshot does not exist or is outdated
+    (its header differs from the expected one: other format version, other domain or modified domain sources)
+    """
+    try:
+        with open(snapshot_path, 'rb') as snapshot_file:
+            if load(snapshot_file) != expected_header:
+                return None
+            return load(snapshot_file)
+    except (OSError, EOFError, UnpicklingError, AttributeError, ImportError):
+        return None
@@ -1,8 +1,10 @@
 import re
-from ast import parse
+from ast import AST, Call, Name, parse
+from functools import lru_cache
 from inspect import getsource
 from pathlib import Path
-from typing import Type, Union, Optional
+from textwrap import dedent
+from typing import List, Type, Union, Optional
 
 
 def investigate_domain_definition(type_to_inspect: Type):
@@ -43,17 +45,35 @@ def write_file(file: Union[str, Path], content: str):
         f.write(content)
 
 
+def get_class_decorators(class_type: Type) -> List[AST]:
+    # the parsing modules are only imported when a domain is inspected
+    from pyaas2puml.parsing.sourcelocator import get_class_definition
+
+    # Look the class up in the parsed source of its module
+    class_definition = get_class_definition(class_type)
+    if class_definition is None:
+        # Parse the source code of the class (local classes cannot be looked up by their qualified name)
+        class_definition = parse(dedent(getsource(class_type))).body[0]
+    return getattr(class_definition, 'decorator_list', [])
+
+
+def get_decorator_name(decorator: AST) -> Optional[str]:
+    """
+    Returns the name of a decorator used as such (@abstract) or called (@invariant(...)), None for the other forms
+    """
+    if isinstance(decorator, Call):
+        decorator = decorator.func
+    return decorator.id if isinstance(decorator, Name) else None
+
+
 def has_decorator(class_type, decorator_name: Optional[str] = None):
     if class_type is None:
         return
-    # Get the source code of the class
-    source = getsource(class_type)
-    # Parse the source code into an AST
-    parsed_ast = parse(source)
-    if hasattr(parsed_ast.body[0], 'decorator_list') and parsed_ast.body[0].decorator_list:
+    decorators = get_class_decorators(class_type)
+    if decorators:
         if decorator_name is None:
             return True
-        for decorator in parsed_ast.body[0].decorator_list:
+        for decorator in decorators:
             if hasattr(decorator, 'id') and decorator.id == decorator_name:
                 return True
             elif hasattr(decorator, 'func') and decorator.func.id == decorator_name:
@@ -61,23 +81,44 @@ def has_decorator(class_type, decorator_name: Optional[str] = None):
     return False
 
 
+# memo size of the naming transforms, large enough for the identifiers of a whole meta-model
+NAMING_TRANSFORMS_CACHE_SIZE = 8192
+
+SNAKE_CASE_WORD_PATTERN = re.compile(r'_([a-zA-Z0-9])([a-zA-Z0-9]+)')
+ACRONYM_BEFORE_DIGIT_PATTERN = re.compile(r'([A-Z])([A-Z]+)([0-9])')
+ACRONYM_BEFORE_CAPITAL_PATTERN = re.compile(r'([A-Z])([A-Z]+)([A-Z])')
+CAMEL_CASE_WORDS_PATTERN = re.compile(r'([a-z0-9])([A-Z])')
+PLURAL_ATTRIBUTE_PATTERN = re.compile(r'([a-zA-Z]{2,})s$')
+
+
+def _capitalize_snake_case_word(match: re.Match) -> str:
+    return match.group(1).upper() + match.group(2).lower()
+
+
+def _lower_acronym(match: re.Match) -> str:
+    return match.group(1) + match.group(2).lower() + match.group(3)
+
+
+@lru_cache(maxsize=NAMING_TRANSFORMS_CACHE_SIZE)
 def snake_to_camel(snake_str):
     new_str = snake_str
-    if re.search(r'_([a-zA-Z0-9])([a-zA-Z0-9]+)', new_str):
-        new_str = re.sub(r'_([a-zA-Z0-9])([a-zA-Z0-9]+)', lambda match: match.group(1).upper() + match.group(2).lower(),
-                         new_str)
-        new_str = re.sub(r'([A-Z])([A-Z]+)([0-9])',
-                         lambda match: match.group(1) + match.group(2).lower() + match.group(3), new_str)
-        new_str = re.sub(r'([A-Z])([A-Z]+)([A-Z])',
-                         lambda match: match.group(1) + match.group(2).lower() + match.group(3), new_str)
+    if SNAKE_CASE_WORD_PATTERN.search(new_str):
+        new_str = SNAKE_CASE_WORD_PATTERN.sub(_capitalize_snake_case_word, new_str)
+        new_str = ACRONYM_BEFORE_DIGIT_PATTERN.sub(_lower_acronym, new_str)
+        new_str = ACRONYM_BEFORE_CAPITAL_PATTERN.sub(_lower_acronym, new_str)
     return new_str
 
 
+@lru_cache(maxsize=NAMING_TRANSFORMS_CACHE_SIZE)
 def snake_to_kebab(snake_str):
-    return re.sub(r'_', '-', snake_str.lower())
+    return snake_str.lower().replace('_', '-')
 
+
+@lru_cache(maxsize=NAMING_TRANSFORMS_CACHE_SIZE)
 def camel_to_kebab(camel_str):
-    return re.sub(r'([a-z0-9])([A-Z])', r'\1-\2', camel_str).lower()
+    return CAMEL_CASE_WORDS_PATTERN.sub(r'\1-\2', camel_str).lower()
+
 
+@lru_cache(maxsize=NAMING_TRANSFORMS_CACHE_SIZE)
 def plural_attribute_to_singular(text):
-    return re.sub(r'([a-zA-Z]{2,})s$', r'\1', text)
+    return PLURAL_ATTRIBUTE_PATTERN.sub(r'\1', text)
@@ -0,0 +1,8 @@
+from pyaas2puml import pytest_plugin
+
+
+def pytest_configure(config):
+    # the plugin is registered by the pytest11 entry point of the package once it is installed: this makes its fixtures
+    # available to the tests of a checkout where pyaas2puml is not installed (or installed before the plugin existed)
+    if not config.pluginmanager.is_registered(pytest_plugin):
+        config.pluginmanager.register(pytest_plugin)
@@ -0,0 +1,20 @@
+"""Mimics the markers used to describe the meta-model in aas-core-meta"""
+
+
+def abstract(cls):
+    return cls
+
+
+def invariant(condition, description: str = None):
+    def decorate(cls):
+        return cls
+
+    return decorate
+
+
+def is_model_reference_to(reference, expected_type) -> bool:
+    return True
+
+
+def is_model_reference_to_referable(reference) -> bool:
+    return True
@@ -0,0 +1,75 @@
+from enum import Enum
+from typing import List, Optional
+
+from tests.modules.withaasmeta.marker import abstract, invariant, is_model_reference_to, is_model_reference_to_referable
+
+
+class Key_types(Enum):
+    Referable = 'Referable'
+    Submodel = 'Submodel'
+
+
+class Key:
+    type: Key_types
+    value: str
+
+    def __init__(self, type: Key_types, value: str):
+        self.type = type
+        self.value = value
+
+
+class Reference:
+    keys: List[Key]
+
+    def __init__(self, keys: List[Key]):
+        self.keys = keys
+
+
+@abstract
+class Has_semantics:
+    semantic_ID: Optional[Reference]
+
+    def __init__(self, semantic_ID: Optional[Reference] = None):
+        self.semantic_ID = semantic_ID
+
+
+@abstract
+class Referable:
+    id_short: Optional[str]
+
+    def __init__(self, id_short: Optional[str] = None):
+        self.id_short = id_short
+
+
+@invariant(
+    lambda self: not (self.derived_from is not None) or is_model_reference_to(self.derived_from, Key_types.Submodel),
+    'Derived-from must be a model reference to a submodel.',
+)
+class Submodel(Referable, Has_semantics):
+    derived_from: Optional[Reference]
+
+    def __init__(
+        self,
+        id_short: Optional[str] = None,
+        semantic_ID: Optional[Reference] = None,
+        derived_from: Optional[Reference] = None,
+    ):
+        Referable.__init__(self, id_short)
+        Has_semantics.__init__(self, semantic_ID)
+        self.derived_from = derived_from
+
+
+@invariant(
+    lambda self: not (self.submodels is not None)
+    or all(is_model_reference_to(reference, Key_types.Submodel) for reference in self.submodels),
+    'All submodels must be model references to a submodel.',
+)
+@invariant(lambda self: is_model_reference_to_referable(self.observed), 'Observed must be a model reference.')
+@invariant(lambda self: self.submodels is None or len(self.submodels) > 0, 'Submodels must not be empty.')
+class Environment:
+    submodels: Optional[List[Reference]]
+    observed: Reference
+
+    def __init__(self, observed: Reference, submodels: Optional[List[Reference]] = None):
+        self.observed = observed
+        self.submodels = submodels
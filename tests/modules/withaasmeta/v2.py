@@ -0,0 +1,76 @@
+from enum import Enum
+from typing import List, Optional
+
+from tests.modules.withaasmeta.marker import invariant, is_model_reference_to
+
+
+class Key_types(Enum):
+    Concept_description = 'Concept_description'
+    Referable = 'Referable'
+    Submodel = 'Submodel'
+
+
+class Key:
+    type: Key_types
+    value: str
+
+    def __init__(self, type: Key_types, value: str):
+        self.type = type
+        self.value = value
+
+
+class Reference:
+    keys: List[Key]
+
+    def __init__(self, keys: List[Key]):
+        self.keys = keys
+
+
+class Referable:
+    id_short: str
+
+    def __init__(self, id_short: str):
+        self.id_short = id_short
+
+
+@invariant(
+    lambda self: not (self.derived_from is not None) or is_model_reference_to(self.derived_from, Key_types.Submodel),
+    'Derived-from must be a model reference to a submodel.',
+)
+class Submodel(Referable):
+    derived_from: Optional[Reference]
+    kind: Optional[str]
+
+    def __init__(self, id_short: str, derived_from: Optional[Reference] = None, kind: Optional[str] = None):
+        Referable.__init__(self, id_short)
+        self.derived_from = derived_from
+        self.kind = kind
+
+
+class Concept_description(Referable):
+    is_case_of: Optional[List[Reference]]
+
+    def __init__(self, id_short: str, is_case_of: Optional[List[Reference]] = None):
+        Referable.__init__(self, id_short)
+        self.is_case_of = is_case_of
+
+
+@invariant(
+    lambda self: not (self.submodels is not None)
+    or all(is_model_reference_to(reference, Key_types.Submodel) for reference in self.submodels),
+    'All submodels must be model references to a submodel.',
+)
+@invariant(
+    lambda self: not (self.concept_descriptions is not None)
+    or all(is_model_reference_to(reference, Key_types.Concept_description) for reference in self.concept_descriptions),
+    'All concept descriptions must be model references to a concept description.',
+)
+class Environment:
+    submodels: Optional[List[Reference]]
+    concept_descriptions: Optional[List[Reference]]
+
+    def __init__(
+        self, submodels: Optional[List[Reference]] = None, concept_descriptions: Optional[List[Reference]] = None
+    ):
+        self.submodels = submodels
+        self.concept_descriptions = concept_descriptions
@@ -0,0 +1,47 @@
+from typing import List
+
+from pytest import raises
+
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.export.fragments import PumlFragmentCache
+from pyaas2puml.export.puml import PUML_FILE_END, PUML_FILE_START
+
+
+def test_fragment_cache_post_processes_each_fragment_once():
+    post_processed_fragments: List[str] = []
+
+    def post_process(fragment: str) -> str:
+        post_processed_fragments.append(fragment)
+        return fragment.upper()
+
+    fragment_cache = PumlFragmentCache(post_process)
+    assert fragment_cache.file_start == PUML_FILE_START.upper()
+    assert fragment_cache.file_end == PUML_FILE_END.upper()
+
+    point = UmlClass('Point', 'geo.Point', [UmlAttribute('y', 'float', False), UmlAttribute('x', 'float', False)])
+    assert fragment_cache.get_item_fragment(('geo.Point', True)) is None
+    assert fragment_cache.add_item_fragment(('geo.Point', True), point, sort_members=True) == (
+        'CLASS GEO.POINT {\n  +X: FLOAT\n  +Y: FLOAT\n}\n'
+    )
+    assert fragment_cache.get_item_fragment(('geo.Point', True)) == 'CLASS GEO.POINT {\n  +X: FLOAT\n  +Y: FLOAT\n}\n'
+
+    # the relations are keyed by value
+    relations = [
+        UmlRelation('geo.Segment', 'geo.Point', RelType.COMPOSITION),
+        UmlRelation('geo.Polygon', 'geo.Point', RelType.COMPOSITION),
+        UmlRelation('geo.Segment', 'geo.Point', RelType.COMPOSITION),
+    ]
+    assert fragment_cache.get_relations_fragments(relations) == [
+        'GEO.POLYGON *-- GEO.POINT\n',
+        'GEO.SEGMENT *-- GEO.POINT\n',
+        'GEO.SEGMENT *-- GEO.POINT\n',
+    ]
+
+    assert len(post_processed_fragments) == 5, 'the start, end, Point class and 2 distinct relations are processed'
+
+
+def test_fragment_cache_rejects_unknown_items():
+    with raises(TypeError, match='cannot process uml_item of type'):
+        PumlFragmentCache().add_item_fragment('geo.Point', UmlItem('Point', 'geo.Point'))
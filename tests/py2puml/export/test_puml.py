@@ -0,0 +1,84 @@
+from copy import deepcopy
+
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.domain.umlenum import Member, UmlEnum
+from pyaas2puml.export.puml import get_puml_attributes, get_puml_members, remove_duplicated_attrs, to_puml_content
+
+
+def build_class_with_duplicated_attributes() -> UmlClass:
+    return UmlClass(
+        'Point',
+        'domain.Point',
+        [
+            UmlAttribute('y', 'float', False),
+            UmlAttribute('origin', 'Point', True),
+            UmlAttribute('x', 'float', False),
+            UmlAttribute('origin', 'Point', False),
+            UmlAttribute('Label', 'str', False),
+        ],
+    )
+
+
+def test_get_puml_attributes_leaves_out_the_instance_attributes_named_like_static_ones():
+    point_class = build_class_with_duplicated_attributes()
+    class_attributes = list(point_class.attributes)
+
+    assert [(attr.name, attr.static) for attr in get_puml_attributes(point_class)] == [
+        ('y', False),
+        ('origin', True),
+        ('x', False),
+        ('Label', False),
+    ]
+    assert [attr.name for attr in get_puml_attributes(point_class, sort_members=True)] == ['Label', 'origin', 'x', 'y']
+    assert point_class.attributes == class_attributes, 'the attributes of the class must be left unchanged'
+
+
+def test_remove_duplicated_attrs_in_place():
+    point_class = build_class_with_duplicated_attributes()
+    class_attributes = point_class.attributes
+    remove_duplicated_attrs(point_class)
+
+    assert point_class.attributes is class_attributes
+    assert [(attr.name, attr.static) for attr in class_attributes] == [
+        ('y', False),
+        ('origin', True),
+        ('x', False),
+        ('Label', False),
+    ]
+
+
+def test_get_puml_members_sorts_a_copy_of_the_members():
+    color_enum = UmlEnum('Color', 'domain.Color', [Member('RED', 'red'), Member('blue', 'blue')])
+
+    assert get_puml_members(color_enum) == tuple(color_enum.members)
+    assert [member.name for member in get_puml_members(color_enum, sort_members=True)] == ['blue', 'RED']
+    assert [member.name for member in color_enum.members] == ['RED', 'blue']
+
+
+def test_to_puml_content_leaves_the_model_unchanged():
+    uml_items = [
+        build_class_with_duplicated_attributes(),
+        UmlEnum('Color', 'domain.Color', [Member('RED', 'red'), Member('blue', 'blue')]),
+    ]
+    original_items = deepcopy(uml_items)
+
+    sorted_puml_content = ''.join(to_puml_content('domain', uml_items, [], sort_members=True))
+    assert uml_items == original_items
+    assert ''.join(to_puml_content('domain', uml_items, [], sort_members=True)) == sorted_puml_content
+    assert sorted_puml_content == (
+        '@startuml\n'
+        'skinparam classAttributeIconSize 0\n'
+        'hide methods\n'
+        '\n'
+        'class domain.Point {\n'
+        '  +Label: str\n'
+        '  +origin: Point {static}\n'
+        '  +x: float\n'
+        '  +y: float\n'
+        '}\n'
+        'enum domain.Color {\n'
+        '  blue: blue {static}\n'
+        '  RED: red {static}\n'
+        '}\n'
+        '@enduml\n'
+    )
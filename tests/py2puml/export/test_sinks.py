@@ -0,0 +1,142 @@
+from json import loads
+from pathlib import Path
+from tarfile import open as open_tar
+from typing import Dict, Type
+from zipfile import ZipFile
+
+from pytest import mark, raises
+
+from pyaas2puml.export.sinks import (
+    MANIFEST_FILE,
+    CheckSink,
+    DirectorySink,
+    OutputSink,
+    StaleFile,
+    TarSink,
+    ZipSink,
+    open_sink,
+)
+
+DIAGRAMS = {
+    '11-submodel.puml': '@startuml\nclass Submodel {\n}\n@enduml',
+    'classes/référable.puml': '@startuml\n@enduml',
+}
+
+
+def read_directory(directory: Path) -> Dict[str, str]:
+    return {
+        file.relative_to(directory).as_posix(): file.read_text(encoding='utf8')
+        for file in directory.rglob('*')
+        if file.is_file()
+    }
+
+
+def read_zip(archive: Path) -> Dict[str, str]:
+    with ZipFile(archive) as zip_file:
+        return {name: zip_file.read(name).decode('utf8') for name in zip_file.namelist()}
+
+
+def read_tar(archive: Path) -> Dict[str, str]:
+    with open_tar(archive) as tar_file:
+        return {member.name: tar_file.extractfile(member).read().decode('utf8') for member in tar_file.getmembers()}
+
+
+@mark.parametrize(
+    ['output_name', 'expected_sink_type', 'read_output'],
+    [
+        ('output', DirectorySink, read_directory),
+        ('output.zip', ZipSink, read_zip),
+        ('output.tar', TarSink, read_tar),
+        ('output.tar.gz', TarSink, read_tar),
+    ],
+)
+def test_open_sink_writes_the_diagrams_and_the_manifest(
+    tmp_path: Path, output_name: str, expected_sink_type: Type[OutputSink], read_output
+):
+    output = tmp_path / output_name
+    with open_sink(output) as sink:
+        assert isinstance(sink, expected_sink_type)
+        for file_path, content in DIAGRAMS.items():
+            sink.write(file_path, content)
+
+    written_files = read_output(output)
+    manifest = loads(written_files.pop(MANIFEST_FILE))
+    assert written_files == DIAGRAMS
+    assert [file_entry['path'] for file_entry in manifest] == list(DIAGRAMS)
+    assert manifest[1]['size'] == len(DIAGRAMS['classes/référable.puml'].encode('utf8'))
+    assert len(manifest[1]['sha256']) == 64
+
+
+def test_sink_writes_the_buffered_files_in_bulk(tmp_path: Path):
+    sink = DirectorySink(tmp_path, buffer_size=50, with_manifest=False)
+    sink.write('11-submodel.puml', DIAGRAMS['11-submodel.puml'])
+    assert read_directory(tmp_path) == {}, 'the content is buffered until the buffer is full'
+
+    sink.write('classes/référable.puml', DIAGRAMS['classes/référable.puml'])
+    assert read_directory(tmp_path) == DIAGRAMS, 'the full buffer is written'
+
+    sink.write('other.puml', '')
+    sink.close()
+    assert read_directory(tmp_path) == {**DIAGRAMS, 'other.puml': ''}, 'closing the sink writes the buffered files'
+
+
+def test_sink_of_a_failed_generation_has_no_manifest(tmp_path: Path):
+    with raises(ValueError), ZipSink(tmp_path / 'output.zip') as sink:
+        sink.write('11-submodel.puml', DIAGRAMS['11-submodel.puml'])
+        raise ValueError('generation failure')
+
+    assert read_zip(tmp_path / 'output.zip') == {}, 'the archive is closed without the buffered files and manifest'
+
+    with raises(ValueError), DirectorySink(tmp_path / 'output', buffer_size=1) as sink:
+        sink.write('11-submodel.puml', DIAGRAMS['11-submodel.puml'])
+        raise ValueError('generation failure')
+
+    assert read_directory(tmp_path / 'output') == {'11-submodel.puml': DIAGRAMS['11-submodel.puml']}
+
+
+def test_check_sink_reports_the_stale_files_without_writing(tmp_path: Path):
+    with DirectorySink(tmp_path) as sink:
+        for file_path, content in DIAGRAMS.items():
+            sink.write(file_path, content)
+    written_files = read_directory(tmp_path)
+
+    with CheckSink(tmp_path, max_workers=2) as check_sink:
+        for file_path, content in DIAGRAMS.items():
+            check_sink.write(file_path, content)
+    assert check_sink.stale_files == []
+    assert check_sink.get_report() == f'3 files are up-to-date in {tmp_path}', 'the manifest is checked as well'
+
+    with CheckSink(tmp_path, with_manifest=False) as check_sink:
+        check_sink.write('11-submodel.puml', '@startuml\nclass Submodel {\n  +id: str\n}\n@enduml')
+        check_sink.write('classes/référable.puml', '@startuml\n@enduml\n')
+        check_sink.write('classes/new.puml', '@startuml\n@enduml')
+
+    assert read_directory(tmp_path) == written_files, 'nothing is written in check mode'
+    assert check_sink.stale_files == [
+        StaleFile('11-submodel.puml', 'modified', 3, '}\n', '  +id: str\n'),
+        StaleFile('classes/new.puml', 'missing'),
+        StaleFile('classes/référable.puml', 'modified', 2, '@enduml', '@enduml\n'),
+    ]
+    assert check_sink.get_report().splitlines() == [
+        f'3/3 files are stale in {tmp_path}:',
+        "  modified 11-submodel.puml (line 3: '}\\n' -> '  +id: str\\n')",
+        '  missing  classes/new.puml',
+        "  modified classes/référable.puml (line 2: '@enduml' -> '@enduml\\n')",
+    ]
+
+
+def test_check_sink_reports_the_orphan_files(tmp_path: Path):
+    with DirectorySink(tmp_path) as sink:
+        for file_path, content in DIAGRAMS.items():
+            sink.write(file_path, content)
+    (tmp_path / 'classes' / 'removed.puml').write_text('@startuml\n@enduml', encoding='utf8')
+
+    with CheckSink(tmp_path, with_manifest=False) as check_sink:
+        for file_path, content in DIAGRAMS.items():
+            check_sink.write(file_path, content)
+
+    assert check_sink.stale_files == [StaleFile('classes/removed.puml', 'orphan')], 'the manifest is not an orphan'
+    assert check_sink.get_report().splitlines() == [
+        f'1/3 files are stale in {tmp_path}:',
+        '  orphan   classes/removed.puml',
+    ]
@@ -0,0 +1,89 @@
+from sys import modules
+from typing import Dict, List
+
+from pytest import fixture
+
+from pyaas2puml.domain.umlclass import UmlClass
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import UmlRelation
+from pyaas2puml.inspection.compaction import (
+    ClassTraits,
+    extract_domain_class_traits,
+    release_class_types,
+    unload_domain_modules,
+)
+from pyaas2puml.inspection.inspectpackage import inspect_package
+from pyaas2puml.parsing.modelreferences import ModelReference
+from pyaas2puml.pyaas2puml import AasPumlGenerator
+
+AAS_DOMAIN_PATH = 'tests/modules/withaasmeta'
+AAS_DOMAIN_MODULE = 'tests.modules.withaasmeta'
+V1_MODULE = 'tests.modules.withaasmeta.v1'
+
+
+@fixture(scope='function')
+def restored_domain_modules():
+    """
+    Restores the unloaded domain modules, which are shared with the other tests
+    """
+    domain_modules = {
+        module_name: module for module_name, module in modules.items() if module_name.startswith(AAS_DOMAIN_MODULE)
+    }
+    yield
+    modules.update(domain_modules)
+
+
+def test_extract_domain_class_traits_leaves_the_classes_unchanged(
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+):
+    inspect_package(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, domain_items_by_fqn, domain_relations, ['v1'])
+
+    class_traits_by_fqn = extract_domain_class_traits(domain_items_by_fqn)
+    assert class_traits_by_fqn[f'{V1_MODULE}.Referable'] == ClassTraits(V1_MODULE, ('abstract',), ())
+    assert class_traits_by_fqn[f'{V1_MODULE}.Submodel'] == ClassTraits(
+        V1_MODULE, ('invariant',), (ModelReference('derived_from', 'Submodel'),)
+    )
+    assert class_traits_by_fqn[f'{V1_MODULE}.Environment'].model_references == (
+        ModelReference('submodels', 'Submodel'),
+        ModelReference('observed', None),
+    )
+    assert class_traits_by_fqn[f'{V1_MODULE}.Referable'].has_decorator('abstract')
+    assert not class_traits_by_fqn[f'{V1_MODULE}.Submodel'].has_decorator('abstract')
+
+    domain_classes = [domain_item for domain_item in domain_items_by_fqn.values() if isinstance(domain_item, UmlClass)]
+    assert list(class_traits_by_fqn) == [domain_class.fqn for domain_class in domain_classes]
+    assert all(domain_class.class_type is not None for domain_class in domain_classes)
+
+    # the traits cannot be extracted from the classes whose types are released
+    release_class_types(domain_items_by_fqn)
+    assert all(domain_class.class_type is None for domain_class in domain_classes)
+    assert extract_domain_class_traits(domain_items_by_fqn) == {}
+
+
+def test_unload_domain_modules(restored_domain_modules):
+    inspect_package(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, {}, [], ['v1'])
+
+    unloaded_module_names = unload_domain_modules(AAS_DOMAIN_MODULE)
+    assert AAS_DOMAIN_MODULE in unloaded_module_names
+    assert V1_MODULE in unloaded_module_names
+    assert 'tests.modules' in modules, 'only the domain modules are unloaded'
+    assert not any(module_name.startswith(AAS_DOMAIN_MODULE) for module_name in modules)
+
+
+def test_generator_unloading_the_domain_modules_generates_the_same_diagrams(restored_domain_modules):
+    generator = AasPumlGenerator(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v1'])
+    assert all(
+        domain_item.class_type is not None
+        for domain_item in generator.domain_items.values()
+        if isinstance(domain_item, UmlClass)
+    ), 'the class types are only released when the domain modules are unloaded'
+    expected_puml = generator.generate_puml()
+
+    generator = AasPumlGenerator(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v1'], unload_domain_modules=True)
+    assert V1_MODULE not in modules
+    assert all(
+        domain_item.class_type is None
+        for domain_item in generator.domain_items.values()
+        if isinstance(domain_item, UmlClass)
+    )
+    assert generator.generate_puml() == expected_puml
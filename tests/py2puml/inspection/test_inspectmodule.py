@@ -0,0 +1,23 @@
+from importlib import import_module
+from typing import List
+
+from pytest import mark
+
+from pyaas2puml.inspection.inspectmodule import filter_domain_definitions
+
+
+@mark.parametrize(
+    ['root_module_name', 'expected_definitions'],
+    [
+        # the imported Engine class belongs to the domain
+        ('tests.modules.withsubdomain', ['Car', 'Engine']),
+        # only the Car class defined in the module belongs to the domain
+        ('tests.modules.withsubdomain.withsubdomain', ['Car']),
+        ('tests.modules.withenum', []),
+    ],
+)
+def test_filter_domain_definitions(root_module_name: str, expected_definitions: List[str]):
+    module = import_module('tests.modules.withsubdomain.withsubdomain')
+    domain_definitions = filter_domain_definitions(module, root_module_name)
+
+    assert [definition_type.__name__ for definition_type in domain_definitions] == expected_definitions
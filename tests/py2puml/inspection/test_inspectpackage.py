@@ -0,0 +1,90 @@
+import sys
+from typing import Dict, List
+
+from pytest import MonkeyPatch, mark
+
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.inspection.inspectmodule import VisitedDefinitions
+from pyaas2puml.inspection.inspectpackage import inspect_package, iter_package
+
+from tests.asserts.relation import assert_relation
+
+WITHSUBDOMAIN_PATH = 'tests/modules/withsubdomain'
+WITHSUBDOMAIN_MODULE = 'tests.modules.withsubdomain'
+
+
+def unimport_withsubdomain_modules(monkeypatch: MonkeyPatch):
+    """Makes sure that the domain modules are not already imported by other tests"""
+    for module_name in list(sys.modules):
+        if module_name.startswith(WITHSUBDOMAIN_MODULE):
+            monkeypatch.delitem(sys.modules, module_name)
+
+
+def test_iter_package_yields_the_uml_elements_of_a_module_before_importing_the_next_one(monkeypatch: MonkeyPatch):
+    unimport_withsubdomain_modules(monkeypatch)
+
+    uml_elements = iter_package(WITHSUBDOMAIN_PATH, WITHSUBDOMAIN_MODULE)
+    engine_item: UmlItem = next(uml_elements)
+    assert engine_item.fqn == 'tests.modules.withsubdomain.subdomain.insubdomain.Engine'
+    assert 'tests.modules.withsubdomain.withsubdomain' not in sys.modules, 'the last module must not be imported yet'
+
+    pilot_item: UmlItem = next(uml_elements)
+    assert pilot_item.fqn == 'tests.modules.withsubdomain.subdomain.insubdomain.Pilot'
+
+    car_item, car_engine_relation = list(uml_elements)
+    assert car_item.fqn == 'tests.modules.withsubdomain.withsubdomain.Car'
+    assert_relation(car_engine_relation, car_item.fqn, engine_item.fqn, RelType.COMPOSITION)
+
+
+def test_iter_package_consistency_with_inspect_package(
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+):
+    inspect_package(WITHSUBDOMAIN_PATH, WITHSUBDOMAIN_MODULE, domain_items_by_fqn, domain_relations)
+    uml_elements = list(iter_package(WITHSUBDOMAIN_PATH, WITHSUBDOMAIN_MODULE))
+
+    assert uml_elements == [*domain_items_by_fqn.values(), *domain_relations]
+
+
+def test_iter_package_skips_the_already_registered_items(domain_items_by_fqn: Dict[str, UmlItem]):
+    inspected_fqns = [
+        uml_element.fqn
+        for uml_element in iter_package(WITHSUBDOMAIN_PATH, WITHSUBDOMAIN_MODULE)
+        if isinstance(uml_element, UmlItem)
+    ]
+    assert len(inspected_fqns) == 3
+
+    domain_items_by_fqn.update({fqn: UmlItem(fqn.split('.')[-1], fqn) for fqn in inspected_fqns[:2]})
+    uml_elements = list(iter_package(WITHSUBDOMAIN_PATH, WITHSUBDOMAIN_MODULE, domain_items_by_fqn))
+
+    assert [uml_element.fqn for uml_element in uml_elements if isinstance(uml_element, UmlItem)] == inspected_fqns[2:]
+    assert list(domain_items_by_fqn) == inspected_fqns, 'the newly inspected item must be registered'
+
+
+@mark.parametrize('domain_submodules', [['subdomain'], ['subdomain.insubdomain']])
+def test_iter_package_neither_imports_nor_inspects_the_modules_out_of_the_domain_submodules(
+    monkeypatch: MonkeyPatch, domain_submodules: List[str]
+):
+    unimport_withsubdomain_modules(monkeypatch)
+
+    uml_elements = list(iter_package(WITHSUBDOMAIN_PATH, WITHSUBDOMAIN_MODULE, domain_submodules=domain_submodules))
+
+    assert [uml_element.fqn for uml_element in uml_elements] == [
+        'tests.modules.withsubdomain.subdomain.insubdomain.Engine',
+        'tests.modules.withsubdomain.subdomain.insubdomain.Pilot',
+    ]
+    assert 'tests.modules.withsubdomain.withsubdomain' not in sys.modules, 'the pruned module must not be imported'
+
+
+def test_iter_package_visits_each_class_once():
+    visited_definitions = VisitedDefinitions()
+    uml_elements = list(iter_package(WITHSUBDOMAIN_PATH, WITHSUBDOMAIN_MODULE, visited_definitions=visited_definitions))
+
+    assert len(uml_elements) == 4, '3 classes and 1 composition'
+    # Engine is imported in the withsubdomain module, where it is not inspected again
+    assert visited_definitions.duplicate_visits_count == 1
+    assert {
+        'tests.modules.withsubdomain.subdomain.insubdomain.Engine',
+        'tests.modules.withsubdomain.subdomain.insubdomain.Pilot',
+        'tests.modules.withsubdomain.withsubdomain.Car',
+    }.issubset(visited_definitions.fqns)
@@ -0,0 +1,118 @@
+from json import loads
+from typing import Dict, List
+
+from pytest import MonkeyPatch, mark, raises
+
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import UmlRelation
+from pyaas2puml.inspection.inspectpackage import inspect_package
+from pyaas2puml.inspection.profiling import InspectionProfile, ModuleProfile
+
+from tests.py2puml.inspection.test_inspectpackage import (
+    WITHSUBDOMAIN_MODULE,
+    WITHSUBDOMAIN_PATH,
+    unimport_withsubdomain_modules,
+)
+
+
+def test_inspect_package_records_the_imports_and_inspections_of_the_domain_modules(
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation], monkeypatch: MonkeyPatch
+):
+    unimport_withsubdomain_modules(monkeypatch)
+    inspection_profile = InspectionProfile()
+    inspect_package(
+        WITHSUBDOMAIN_PATH,
+        WITHSUBDOMAIN_MODULE,
+        domain_items_by_fqn,
+        domain_relations,
+        inspection_profile=inspection_profile,
+    )
+
+    module_profiles = inspection_profile.module_profiles
+    assert list(module_profiles) == [
+        'tests.modules.withsubdomain',
+        'tests.modules.withsubdomain.subdomain',
+        'tests.modules.withsubdomain.subdomain.insubdomain',
+        'tests.modules.withsubdomain.withsubdomain',
+    ]
+    # the subdomain package is only imported to be walked through
+    assert module_profiles['tests.modules.withsubdomain.subdomain'].inspection_time is None
+    assert module_profiles['tests.modules.withsubdomain.subdomain.insubdomain'].inspection_time >= 0
+    assert module_profiles['tests.modules.withsubdomain.subdomain.insubdomain'].imported_modules == (
+        'tests.modules.withsubdomain.subdomain.insubdomain',
+    )
+    # the withsubdomain module imports the insubdomain module, which is already imported
+    assert module_profiles['tests.modules.withsubdomain.withsubdomain'].imported_modules == (
+        'tests.modules.withsubdomain.withsubdomain',
+    )
+    assert len(domain_items_by_fqn) == 3, 'the profiling must not change the inspection'
+
+
+def test_import_module_records_the_transitively_imported_modules(monkeypatch: MonkeyPatch):
+    unimport_withsubdomain_modules(monkeypatch)
+    inspection_profile = InspectionProfile()
+    inspection_profile.import_module('tests.modules.withsubdomain.withsubdomain')
+
+    assert inspection_profile.module_profiles['tests.modules.withsubdomain.withsubdomain'].imported_modules == (
+        'tests.modules.withsubdomain',
+        'tests.modules.withsubdomain.subdomain',
+        'tests.modules.withsubdomain.subdomain.insubdomain',
+        'tests.modules.withsubdomain.withsubdomain',
+    )
+
+
+def test_import_module_records_the_failed_imports():
+    inspection_profile = InspectionProfile()
+    with raises(ModuleNotFoundError):
+        inspection_profile.import_module('tests.modules.missing')
+
+    assert inspection_profile.module_profiles['tests.modules.missing'].imported_modules == ()
+
+
+def build_inspection_profile() -> InspectionProfile:
+    return InspectionProfile(
+        {
+            'domain.package': ModuleProfile('domain.package', 0.003, ('domain.package', 'heavy')),
+            'domain.package.slow_import': ModuleProfile(
+                'domain.package.slow_import', 0.020, ('domain.package.slow_import',), 0.001
+            ),
+            'domain.package.slow_inspection': ModuleProfile(
+                'domain.package.slow_inspection', 0.002, ('domain.package.slow_inspection',), 0.030
+            ),
+        }
+    )
+
+
+@mark.parametrize(
+    ['sort_key', 'expected_modules_order'],
+    [
+        ('total', ['domain.package.slow_inspection', 'domain.package.slow_import', 'domain.package']),
+        ('import', ['domain.package.slow_import', 'domain.package', 'domain.package.slow_inspection']),
+        ('inspection', ['domain.package.slow_inspection', 'domain.package.slow_import', 'domain.package']),
+        ('modules', ['domain.package', 'domain.package.slow_import', 'domain.package.slow_inspection']),
+    ],
+)
+def test_get_sorted_profiles(sort_key: str, expected_modules_order: List[str]):
+    module_profiles = build_inspection_profile().get_sorted_profiles(sort_key)
+
+    assert [module_profile.name for module_profile in module_profiles] == expected_modules_order
+
+
+def test_get_report():
+    assert build_inspection_profile().get_report().split('\n') == [
+        '3 domain modules imported in 25.0ms (4 modules loaded), inspected in 31.0ms',
+        '     total     import inspection  modules  module',
+        '    32.0ms      2.0ms     30.0ms        1  domain.package.slow_inspection',
+        '    21.0ms     20.0ms      1.0ms        1  domain.package.slow_import',
+        '     3.0ms      3.0ms          -        2  domain.package',
+    ]
+
+
+def test_to_json():
+    assert loads(build_inspection_profile().to_json('import'))[0] == {
+        'name': 'domain.package.slow_import',
+        'import_time': 0.020,
+        'imported_modules': ['domain.package.slow_import'],
+        'inspection_time': 0.001,
+        'total_time': 0.021,
+    }
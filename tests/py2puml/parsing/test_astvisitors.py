@@ -1,4 +1,5 @@
-from ast import AST, get_source_segment, parse
+from ast import AST, expr, get_source_segment, parse, walk
+from importlib import import_module
 from inspect import getsource
 from textwrap import dedent
 from typing import Dict, List, Tuple, Union
@@ -7,6 +8,7 @@ from pytest import mark
 
 from pyaas2puml.parsing.astvisitors import (
     AssignedVariablesCollector,
+    ConstructorVisitor,
     SignatureVariablesCollector,
     shorten_compound_type_annotation,
 )
@@ -38,6 +40,25 @@ class ParseMyConstructorArguments:
         pass
 
 
+class ShadowedAndNestedAssignments:
+    def __init__(self, count: int, label: str):
+        # the untyped variable shadows the typed argument
+        count = label
+        self.count = count
+        self.label = label
+
+        def reset():
+            self.reset_count = 0
+
+        class Nested:
+            def __init__(self):
+                self.nested_attribute = 0
+
+        if label:
+            for _ in range(count):
+                self.counted: bool = True
+
+
 def test_SignatureVariablesCollector_collect_arguments():
     constructor_source: str = dedent(getsource(ParseMyConstructorArguments.__init__.__code__))
     constructor_ast: AST = parse(constructor_source)
@@ -257,3 +278,36 @@ def test_shorten_compound_type_annotation(
     )
     assert shortened_annotation == short_annotation
     assert full_namespaced_definitions == namespaced_definitions
+
+
+def test_ConstructorVisitor_skips_the_nested_definitions_and_handles_the_shadowed_variables():
+    constructor_source: str = dedent(getsource(ShadowedAndNestedAssignments.__init__.__code__))
+    module_resolver = ModuleResolver(import_module(ShadowedAndNestedAssignments.__module__))
+
+    visitor = ConstructorVisitor(constructor_source, 'ShadowedAndNestedAssignments', 'tests', module_resolver)
+    visitor.visit(parse(constructor_source))
+
+    assert [(attribute.name, attribute.type) for attribute in visitor.uml_attributes] == [
+        ('count', None),
+        ('label', 'str'),
+        ('counted', 'bool'),
+    ]
+    assert visitor.get_from_namespace('count').type_expr is None, 'the count argument is shadowed by a variable'
+    assert visitor.get_from_namespace('reset') is None, 'the nested definitions are not browsed'
+
+
+def test_ConstructorVisitor_get_source_segment_matches_the_one_of_the_ast_module():
+    constructor_source = """def __init__(self, données: Dict[str, 'Élément'], other):
+    self.items: List[
+        Tuple[int, 'Élément']
+    ] = list(données.items())\r
+    self.other = other
+"""
+    visitor = ConstructorVisitor(
+        constructor_source, 'Parsed', 'tests', ModuleResolver(MockedInstance({'__name__': 'tests'}))
+    )
+
+    expression_nodes = [node for node in walk(parse(constructor_source)) if isinstance(node, expr)]
+    assert len(expression_nodes) > 10, 'test consistency'
+    for node in expression_nodes:
+        assert visitor.get_source_segment(node) == get_source_segment(constructor_source, node)
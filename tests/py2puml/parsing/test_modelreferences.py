@@ -0,0 +1,62 @@
+from ast import parse
+
+from pytest import mark
+
+from pyaas2puml.parsing.modelreferences import (
+    ModelReference,
+    collect_model_references,
+    get_class_definition,
+    get_model_references,
+)
+
+from tests.modules.withaasmeta.v1 import Environment, Reference, Submodel
+
+
+@mark.parametrize(
+    ['invariant_source', 'expected_model_references'],
+    [
+        (
+            'invariant(lambda self: is_model_reference_to(self.derived_from, Key_types.Submodel))',
+            [('derived_from', 'Submodel')],
+        ),
+        ('invariant(lambda me: is_model_reference_to_referable(me.observed))', [('observed', None)]),
+        (
+            'invariant(lambda self: all(is_model_reference_to(ref, Key_types.Submodel) for ref in self.submodels))',
+            [('submodels', 'Submodel')],
+        ),
+        (
+            'invariant(lambda self: is_model_reference_to(self.source, Key_types.Event_element) or is_model_reference_to(self.source, Key_types.Basic_event_element))',
+            [('source', 'Event_element'), ('source', 'Basic_event_element')],
+        ),
+        # references which are not attributes of the instance are ignored
+        ('invariant(lambda self: is_model_reference_to(other.derived_from, Key_types.Submodel))', []),
+        ('invariant(lambda self: self.submodels is None or len(self.submodels) > 0)', []),
+    ],
+)
+def test_collect_model_references(invariant_source: str, expected_model_references: list):
+    invariant = parse(invariant_source).body[0].value
+
+    assert collect_model_references(invariant) == [
+        ModelReference(attribute, key_type) for attribute, key_type in expected_model_references
+    ]
+
+
+def test_get_model_references_in_the_order_of_the_invariant_decorators():
+    assert get_model_references(Environment) == (
+        ModelReference('submodels', 'Submodel'),
+        ModelReference('observed', None),
+    )
+    assert get_model_references(Submodel) == (ModelReference('derived_from', 'Submodel'),)
+    assert get_model_references(Reference) == ()
+
+
+def test_get_model_references_is_cached_per_class():
+    assert get_model_references(Environment) is get_model_references(Environment)
+
+
+def test_get_class_definition_shares_the_parsed_module_tree():
+    environment_definition = get_class_definition(Environment)
+    assert environment_definition.name == 'Environment'
+    assert len(environment_definition.decorator_list) == 3
+
+    assert get_class_definition(Environment) is environment_definition
@@ -0,0 +1,60 @@
+from ast import ClassDef, FunctionDef
+from functools import wraps
+from inspect import getsource
+from textwrap import dedent
+
+from pyaas2puml.parsing.sourcelocator import get_class_definition, get_function_definition, get_module_source
+from pyaas2puml.utils import has_decorator
+
+
+def logged(function):
+    @wraps(function)
+    def logged_function(*args, **kwargs):
+        return function(*args, **kwargs)
+
+    return logged_function
+
+
+class Outer:
+    class Inner:
+        @logged
+        def __init__(self, name: str):
+            self.name = name
+
+
+def define_local_class():
+    class Local:
+        def __init__(self):
+            self.local = True
+
+    return Local
+
+
+def test_get_class_definition_by_qualified_name():
+    inner_definition = get_class_definition(Outer.Inner)
+    assert isinstance(inner_definition, ClassDef)
+    assert inner_definition.name == 'Inner'
+    assert get_class_definition(Outer.Inner) is inner_definition, 'the module is parsed once'
+
+
+def test_get_class_definition_of_a_local_class_is_not_located():
+    assert get_class_definition(define_local_class()) is None
+    assert has_decorator(define_local_class()) is False, 'has_decorator falls back to inspect.getsource'
+
+
+def test_get_function_definition_of_a_decorated_constructor():
+    constructor_code = Outer.Inner.__init__.__wrapped__.__code__
+    module_source, constructor_definition = get_function_definition(constructor_code)
+
+    assert module_source is get_module_source(constructor_code.co_filename)
+    assert isinstance(constructor_definition, FunctionDef)
+    assert constructor_definition.decorator_list[0].lineno == constructor_code.co_firstlineno
+    located_source = ''.join(
+        module_source.lines[constructor_code.co_firstlineno - 1 : constructor_definition.end_lineno]
+    )
+    assert dedent(located_source) == dedent(getsource(constructor_code))
+
+
+def test_get_function_definition_of_a_lambda_is_not_located():
+    assert get_function_definition((lambda: None).__code__) is None
+    assert get_function_definition(compile('def f():\n    pass', '<string>', 'exec')) is None
@@ -1,9 +1,17 @@
 from io import StringIO
+from itertools import count
+from pathlib import Path
 from typing import Iterable, List
 
-from pytest import mark
+from pytest import mark, raises
 
-from pyaas2puml.asserts import normalize_lines_with_returns
+from pyaas2puml.asserts import (
+    assert_lines_stream,
+    assert_pyaas2puml_is_file_content,
+    iter_lines_with_returns,
+    normalize_lines_with_returns,
+)
+from pyaas2puml.pyaas2puml import AasPumlGenerator
 
 PY2PUML_HEADER = """@startuml pyaas2puml.domain
 !pragma useIntermediatePackages false
@@ -21,3 +29,85 @@ PY2PUML_HEADER = """@startuml pyaas2puml.domain
 )
 def test_normalize_lines_with_returns(input_lines_with_returns: Iterable[str], expected_lines: List[str]):
     assert normalize_lines_with_returns(input_lines_with_returns) == expected_lines
+
+
+@mark.parametrize(
+    'input_lines_with_returns',
+    [
+        [],
+        ['line'],
+        ['line\n'],
+        ['li', 'ne\nother ', 'line', '\n\n', 'last'],
+        StringIO(PY2PUML_HEADER),
+    ],
+)
+def test_iter_lines_with_returns_yields_the_normalized_lines(input_lines_with_returns: Iterable[str]):
+    input_lines_with_returns = list(input_lines_with_returns)
+    assert list(iter_lines_with_returns(input_lines_with_returns)) == normalize_lines_with_returns(
+        input_lines_with_returns
+    )
+
+
+def test_assert_lines_stream_stops_at_the_first_different_line_with_a_bounded_diff():
+    expected_lines = [f'line {line_number}' for line_number in range(1, 11)]
+    actual_lines = (f'line {line_number}' if line_number != 6 else 'changed' for line_number in count(1))
+
+    with raises(AssertionError) as assertion_error:
+        assert_lines_stream(actual_lines, expected_lines, context_lines=2)
+
+    assert str(assertion_error.value).splitlines() == [
+        'actual and expected contents have changed at line 6:',
+        '--- expected',
+        '+++ actual',
+        '@@ -4,5 +4,5 @@',
+        ' line 4',
+        ' line 5',
+        '-line 6',
+        '+changed',
+        ' line 7',
+        ' line 8',
+    ]
+    assert next(actual_lines) == 'line 9', 'the actual lines are read up to the end of the diff context'
+
+
+@mark.parametrize(
+    ['actual_lines', 'expected_lines', 'expected_diff_end'],
+    [
+        (['a', 'b'], ['a', 'b', 'c'], ['@@ -2,2 +2 @@', ' b', '-c']),
+        (['a', 'b', 'c'], ['a', 'b'], ['@@ -2 +2,2 @@', ' b', '+c']),
+    ],
+)
+def test_assert_lines_stream_compares_the_lengths(
+    actual_lines: List[str], expected_lines: List[str], expected_diff_end: List[str]
+):
+    assert_lines_stream(iter(expected_lines), iter(expected_lines))
+    with raises(AssertionError, match='have changed at line 3') as assertion_error:
+        assert_lines_stream(actual_lines, expected_lines, context_lines=1)
+
+    assert str(assertion_error.value).splitlines()[-3:] == expected_diff_end
+
+
+def test_assert_pyaas2puml_is_file_content(tmp_path: Path):
+    generator = AasPumlGenerator('tests/modules/withaasmeta', 'tests.modules.withaasmeta', ['v1'])
+    submodel_diagram_file = tmp_path / 'submodel.puml'
+    submodel_diagram_file.write_text(
+        generator.generate_puml(['tests.modules.withaasmeta.v1.Submodel'], to_include_members_from_parents=True),
+        encoding='utf8',
+    )
+
+    assert_pyaas2puml_is_file_content(
+        'tests/modules/withaasmeta',
+        'tests.modules.withaasmeta',
+        submodel_diagram_file,
+        ['v1'],
+        domain_items_to_keep=['tests.modules.withaasmeta.v1.Submodel'],
+        to_include_members_from_parents=True,
+    )
+    with raises(AssertionError, match='have changed at line 7'):
+        assert_pyaas2puml_is_file_content(
+            'tests/modules/withaasmeta',
+            'tests.modules.withaasmeta',
+            submodel_diagram_file,
+            ['v1'],
+            domain_items_to_keep=['tests.modules.withaasmeta.v1.Submodel'],
+        )
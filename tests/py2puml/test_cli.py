@@ -1,6 +1,9 @@
 from io import StringIO
+from json import loads
+from pathlib import Path
 from subprocess import PIPE, run
-from typing import List
+from typing import List, Set
+from zipfile import ZipFile
 
 from pytest import mark
 
@@ -64,3 +67,80 @@ def test_cli_help(help_command: List[str]):
     help_text = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stdout.replace('\n', ' ')
 
     assert __description__ in help_text
+
+
+# modules which must not be imported when the inspection of a domain is not needed
+INSPECTION_MODULES_PREFIXES = ('pyaas2puml.pyaas2puml', 'pyaas2puml.inspection', 'pyaas2puml.parsing')
+HEAVY_STANDARD_MODULES = ('ast', 'dataclasses', 'inspect', 'pickle')
+
+
+def get_modules_imported_by_the_cli(cli_arguments: List[str]) -> Set[str]:
+    """
+    Returns the modules imported by the CLI once the interpreter has started, read from the report of the
+    -X importtime option (the modules imported by the site initialization are reported before the 'site' module)
+    """
+    command = ['python', '-X', 'importtime', '-m', 'pyaas2puml'] + cli_arguments
+    import_time_report = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stderr.splitlines()
+    imported_modules = [
+        report_line.rsplit('|', 1)[1].strip()
+        for report_line in import_time_report
+        if report_line.startswith('import time:')
+    ]
+    return set(imported_modules[imported_modules.index('site') + 1 :])
+
+
+@mark.parametrize('cli_arguments', [['--version'], ['--help']])
+def test_cli_options_do_not_import_the_inspection(cli_arguments: List[str]):
+    imported_modules = get_modules_imported_by_the_cli(cli_arguments)
+
+    assert 'pyaas2puml.cli' in imported_modules
+    assert not [module for module in imported_modules if module.startswith(INSPECTION_MODULES_PREFIXES)]
+    assert imported_modules.isdisjoint(HEAVY_STANDARD_MODULES)
+
+
+def test_cli_does_not_import_the_inspection_when_the_snapshot_is_up_to_date(tmp_path: Path):
+    cli_arguments = ['pyaas2puml/domain', 'pyaas2puml.domain', '--snapshot', str(tmp_path / 'domain.snapshot')]
+    inspecting_modules = get_modules_imported_by_the_cli(cli_arguments)
+    assert 'pyaas2puml.inspection.inspectpackage' in inspecting_modules
+
+    snapshot_modules = get_modules_imported_by_the_cli(cli_arguments)
+    assert 'pyaas2puml.pyaas2puml' in snapshot_modules
+    assert not [
+        module for module in snapshot_modules if module.startswith(('pyaas2puml.inspection', 'pyaas2puml.parsing'))
+    ]
+
+
+def test_cli_writes_the_diagram_in_the_output(tmp_path: Path):
+    command = ['pyaas2puml', 'pyaas2puml/domain', 'pyaas2puml.domain']
+    cli_stdout = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stdout
+    existing_manifest = tmp_path / 'manifest.json'
+    existing_manifest.write_text('[]', encoding='utf8')
+
+    output_stdout = run(
+        command + ['--output', str(tmp_path)], stdout=PIPE, stderr=PIPE, text=True, check=True
+    ).stdout
+
+    assert output_stdout == ''
+    assert (tmp_path / 'pyaas2puml.domain.puml').read_text(encoding='utf8') + '\n' == cli_stdout
+    assert existing_manifest.read_text(encoding='utf8') == '[]', 'the manifest of the directory is left unchanged'
+
+    run(command + ['--output', str(tmp_path / 'diagrams.zip')], check=True)
+    with ZipFile(tmp_path / 'diagrams.zip') as zip_file:
+        assert zip_file.namelist() == ['pyaas2puml.domain.puml', 'manifest.json']
+
+
+def test_cli_prints_the_inspection_profile_on_the_standard_error():
+    command = ['python', '-m', 'pyaas2puml', 'withrootnotincwd', 'withrootnotincwd']
+    cli_stdout = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True, cwd='tests/modules').stdout
+
+    profiled_process = run(
+        command + ['--profile', 'json'], stdout=PIPE, stderr=PIPE, text=True, check=True, cwd='tests/modules'
+    )
+    assert profiled_process.stdout == cli_stdout, 'the diagram must be printed on the standard output'
+    module_profiles = loads(profiled_process.stderr)
+    assert {module_profile['name'] for module_profile in module_profiles} == {
+        'withrootnotincwd',
+        'withrootnotincwd.point',
+        'withrootnotincwd.segment',
+    }
+    assert all(module_profile['total_time'] >= module_profile['import_time'] for module_profile in module_profiles)
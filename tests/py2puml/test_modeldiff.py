@@ -0,0 +1,144 @@
+from json import loads
+
+from pytest import fixture
+
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.modeldiff import ChangedElement, ChangeType, ModelChange, diff_models, to_puml_diff_content
+from pyaas2puml.pyaas2puml import AasPumlGenerator
+
+from tests.py2puml.test_pyaas2puml import AAS_DOMAIN_MODULE, AAS_DOMAIN_PATH
+
+
+@fixture(scope='module')
+def v1_generator() -> AasPumlGenerator:
+    return AasPumlGenerator(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v1'])
+
+
+@fixture(scope='module')
+def v2_generator() -> AasPumlGenerator:
+    return AasPumlGenerator(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v2'])
+
+
+def test_diff_models_compares_the_items_by_relative_fqn():
+    old_items = {
+        'old.A': UmlClass('A', 'old.A', [UmlAttribute('x', 'int', False), UmlAttribute('y', 'str', False)]),
+        'old.B': UmlClass('B', 'old.B', []),
+    }
+    new_items = {
+        'new.A': UmlClass('A', 'new.A', [UmlAttribute('x', 'float', False), UmlAttribute('z', 'str', False)]),
+        'new.C': UmlClass('C', 'new.C', [], is_abstract=True),
+    }
+    old_relations = [UmlRelation('old.A', 'old.B', RelType.COMPOSITION, 'b')]
+    new_relations = [UmlRelation('new.C', 'new.A', RelType.INHERITANCE)]
+
+    model_diff = diff_models(old_items, old_relations, new_items, new_relations, 'old.', 'new.')
+
+    assert model_diff.changes == [
+        ModelChange(ChangeType.REMOVED, ChangedElement.ITEM, 'B', 'B', 'class', None),
+        ModelChange(ChangeType.ADDED, ChangedElement.ITEM, 'C', 'C', None, 'abstract class'),
+        ModelChange(ChangeType.REMOVED, ChangedElement.ATTRIBUTE, 'A', 'y', 'str', None),
+        ModelChange(ChangeType.MODIFIED, ChangedElement.ATTRIBUTE, 'A', 'x', 'int', 'float'),
+        ModelChange(ChangeType.ADDED, ChangedElement.ATTRIBUTE, 'A', 'z', None, 'str'),
+        ModelChange(
+            ChangeType.REMOVED, ChangedElement.RELATION, 'A', '*-- B : b', '"" ""', None, ('A', '*--', 'B', 'b')
+        ),
+        ModelChange(ChangeType.ADDED, ChangedElement.RELATION, 'C', '<|-- A', None, '"" ""', ('C', '<|--', 'A', '')),
+    ]
+    assert model_diff.get_changed_item_keys() == ['B', 'C', 'A']
+
+
+def test_puml_diff_of_a_relation_whose_cardinality_changes_without_label():
+    old_items = {'old.A': UmlClass('A', 'old.A', []), 'old.B': UmlClass('B', 'old.B', [])}
+    new_items = {'new.A': UmlClass('A', 'new.A', []), 'new.B': UmlClass('B', 'new.B', [])}
+    old_relations = [UmlRelation('old.A', 'old.B', RelType.COMPOSITION, target_cardinality='1')]
+    new_relations = [UmlRelation('new.A', 'new.B', RelType.COMPOSITION, target_cardinality='0..*')]
+
+    puml_lines = ''.join(
+        to_puml_diff_content(diff_models(old_items, old_relations, new_items, new_relations, 'old.', 'new.'))
+    ).splitlines()
+
+    assert 'A *-[#blue]-"0..*" B : (was "" "1")' in puml_lines
+
+
+def test_diff_skips_the_relation_endpoints_which_are_not_domain_items():
+    old_items = {'old.A': UmlClass('A', 'old.A', [])}
+    new_items = {'new.A': UmlClass('A', 'new.A', [])}
+    new_relations = [UmlRelation('new.A', 'new.External', RelType.DEPENDENCY)]
+
+    model_diff = diff_models(old_items, [], new_items, new_relations, 'old.', 'new.')
+
+    assert model_diff.get_changed_item_keys() == ['A']
+    assert 'A .[#green].> External' in ''.join(to_puml_diff_content(model_diff)).splitlines()
+
+
+def test_diff_of_identical_domains_has_no_changes(v1_generator: AasPumlGenerator):
+    assert v1_generator.diff(v1_generator).changes == []
+
+
+def test_diff_to_json(v1_generator: AasPumlGenerator, v2_generator: AasPumlGenerator):
+    changes = loads(v2_generator.diff(v1_generator).to_json())
+
+    assert {
+        'change': 'modified',
+        'element': 'attribute',
+        'item': 'Referable',
+        'key': 'idShort',
+        'old': 'Optional[str] {static}',
+        'new': 'str {static}',
+    } in changes
+    assert {
+        'change': 'added',
+        'element': 'relation',
+        'item': 'Environment',
+        'key': '--> ConceptDescription : conceptDescription:ref',
+        'old': None,
+        'new': '"" "0..*"',
+    } in changes
+
+
+def test_generate_puml_diff(v1_generator: AasPumlGenerator, v2_generator: AasPumlGenerator):
+    expected = """@startuml
+skinparam classAttributeIconSize 0
+hide methods
+
+skinparam class {
+  BackgroundColor<<added>> PaleGreen
+  BackgroundColor<<removed>> MistyRose
+  BackgroundColor<<modified>> LightYellow
+}
+
+abstract class HasSemantics <<removed>> <<abstract>> {
+  <color:red><s>+semanticId: Reference[0..1]</s></color>
+}
+class ConceptDescription <<added>> {
+  <color:green>+isCaseOf: Reference[0..*]</color>
+}
+class Referable <<modified>> {
+  <color:blue>+idShort: str</color> <color:gray>(was str[0..1])</color>
+}
+class Environment <<modified>> {
+  +submodel: Reference[0..*]
+  <color:green>+conceptDescription: Reference[0..*]</color>
+  <color:red><s>+observed: Reference</s></color>
+}
+enum KeyTypes <<modified>> <<enumeration>> {
+  <color:green>Concept_description</color>
+  Referable
+  Submodel
+}
+class Submodel <<modified>> {
+  +derivedFrom: Reference[0..1]
+  <color:green>+kind: str[0..1]</color>
+}
+class Reference {
+}
+HasSemantics .[#red].> Reference
+HasSemantics <|-[#red]- Submodel
+Environment -[#red]->"1" Referable : observed:ref
+ConceptDescription .[#green].> Reference
+Referable <|-[#green]- ConceptDescription
+Environment -[#green]->"0..*" ConceptDescription : conceptDescription:ref
+@enduml"""
+
+    assert v2_generator.generate_puml_diff(v2_generator.diff(v1_generator)) == expected
@@ -0,0 +1,56 @@
+from typing import List, Tuple
+
+from pytest import mark, raises
+
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.partitioning import group_by_module, pack_clusters, partition_items, split_in_breadth_first_chunks
+
+
+def dependencies(*source_and_targets: Tuple[str, str]) -> List[UmlRelation]:
+    return [UmlRelation(source_fqn, target_fqn, RelType.DEPENDENCY) for source_fqn, target_fqn in source_and_targets]
+
+
+@mark.parametrize(
+    ['max_cluster_size', 'expected_clusters'],
+    [
+        # the connected components are packed together
+        (10, [['a.A', 'a.B', 'b.C', 'b.D', 'a.E']]),
+        # the components are not split when they fit in the budget
+        (4, [['a.A', 'a.B', 'b.C', 'b.D'], ['a.E']]),
+        # the component exceeding the budget is split by module, then the module groups are packed
+        (3, [['a.A', 'a.B', 'a.E'], ['b.C', 'b.D']]),
+        # the module groups exceeding the budget are split in breadth-first chunks
+        (1, [['a.A'], ['a.B'], ['b.C'], ['b.D'], ['a.E']]),
+    ],
+)
+def test_partition_items(max_cluster_size: int, expected_clusters: List[List[str]]):
+    relations = dependencies(('a.A', 'a.B'), ('a.B', 'b.C'), ('b.C', 'b.D'), ('a.E', 'a.E'), ('a.A', 'other.F'))
+
+    clusters = partition_items(['a.A', 'a.B', 'b.C', 'b.D', 'a.E'], relations, max_cluster_size)
+
+    assert clusters == expected_clusters
+
+
+def test_partition_items_rejects_empty_clusters():
+    with raises(ValueError, match='must be positive'):
+        partition_items(['a.A'], [], 0)
+
+
+def test_group_by_module():
+    assert group_by_module(['a.A', 'b.B', 'a.b.C', 'a.D']) == [['a.A', 'a.D'], ['b.B'], ['a.b.C']]
+
+
+def test_split_in_breadth_first_chunks_starts_with_the_most_connected_items():
+    neighbours_by_fqn = {'A': ['B'], 'B': ['A', 'C', 'D'], 'C': ['B'], 'D': ['B', 'E'], 'E': ['D']}
+
+    chunks = split_in_breadth_first_chunks(['A', 'B', 'C', 'D', 'E'], neighbours_by_fqn, 4)
+
+    assert chunks == [['B', 'A', 'C', 'D'], ['E']]
+
+
+def test_pack_clusters_with_first_fit_decreasing():
+    positions_by_fqn = {fqn: position for position, fqn in enumerate('ABCDEFG')}
+
+    packed_clusters = pack_clusters([['A'], ['B', 'C'], ['D', 'E', 'F'], ['G']], 4, positions_by_fqn)
+
+    assert packed_clusters == [['D', 'E', 'F', 'A'], ['B', 'C', 'G']]
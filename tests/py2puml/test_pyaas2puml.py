@@ -0,0 +1,123 @@
+from typing import List, Optional
+
+from pytest import fixture, mark
+
+from pyaas2puml.domain.umlclass import UmlAttribute, UmlClass
+from pyaas2puml.domain.umlrelation import RelType
+from pyaas2puml.export.puml import to_puml_content
+from pyaas2puml.pyaas2puml import AasPumlGenerator
+
+AAS_DOMAIN_PATH = 'tests/modules/withaasmeta'
+AAS_DOMAIN_MODULE = 'tests.modules.withaasmeta'
+SUBMODEL_FQN = 'tests.modules.withaasmeta.v1.Submodel'
+REFERENCE_FQN = 'tests.modules.withaasmeta.v1.Reference'
+V1_FQN_PREFIX = 'tests.modules.withaasmeta.v1.'
+
+
+@fixture(scope='function')
+def generator() -> AasPumlGenerator:
+    return AasPumlGenerator(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v1'])
+
+
+def test_generate_puml_includes_the_members_of_the_parents(generator: AasPumlGenerator):
+    expected = """@startuml
+skinparam classAttributeIconSize 0
+hide methods
+
+class Submodel<Referable\\nHasSemantics> {
+  +derivedFrom: Reference[0..1]
+  +idShort: str[0..1]
+  +semanticId: Reference[0..1]
+}
+Submodel -->"0..1" Submodel : derivedFrom:ref
+@enduml"""
+
+    assert generator.generate_puml([SUBMODEL_FQN], to_include_members_from_parents=True) == expected
+
+
+def test_generate_puml_leaves_the_domain_items_unchanged(generator: AasPumlGenerator):
+    all_classes_puml = generator.generate_puml()
+    submodel_attributes = list(generator.domain_items[SUBMODEL_FQN].attributes)
+
+    submodel_puml = generator.generate_puml([SUBMODEL_FQN, REFERENCE_FQN], to_include_members_from_parents=True)
+    assert generator.generate_puml() == all_classes_puml
+    submodel: UmlClass = generator.domain_items[SUBMODEL_FQN]
+    assert submodel.attributes == submodel_attributes, 'the members of the parents must not be added to the model'
+    assert submodel.generics == '', 'the filtered-out parents must not be added to the model as generics'
+
+    assert generator.generate_puml([SUBMODEL_FQN, REFERENCE_FQN], to_include_members_from_parents=True) == submodel_puml
+
+
+def test_generate_puml_draws_the_domain_modified_after_invalidation(generator: AasPumlGenerator):
+    generator.generate_puml()
+    generator.generate_puml([SUBMODEL_FQN], to_include_members_from_parents=True)
+    generator.domain_items[f'{V1_FQN_PREFIX}Referable'].attributes.append(UmlAttribute('category', 'str', False))
+    generator.domain_relations[:] = [
+        relation for relation in generator.domain_relations if relation.type != RelType.INHERITANCE
+    ]
+    generator.invalidate()
+
+    assert '  +category: str' in generator.generate_puml().split('\n')
+    assert generator.get_neighbourhood([SUBMODEL_FQN], 1, [RelType.INHERITANCE]) == [SUBMODEL_FQN]
+    assert '  +idShort: str[0..1]' not in generator.generate_puml([SUBMODEL_FQN], to_include_members_from_parents=True)
+
+    generator.domain_items = {SUBMODEL_FQN: generator.domain_items[SUBMODEL_FQN]}
+    assert '  +category: str' not in generator.generate_puml(), 'assigning the domain items invalidates the fragments'
+
+
+def test_generate_puml_draws_the_model_references_asserted_by_the_invariants(generator: AasPumlGenerator):
+    puml_lines = generator.generate_puml().split('\n')
+
+    assert 'Environment -->"0..*" Submodel : submodel:ref' in puml_lines
+    assert 'Environment -->"1" Referable : observed:ref' in puml_lines
+    assert 'Submodel -->"0..1" Submodel : derivedFrom:ref' in puml_lines
+
+
+@mark.parametrize(
+    ['hops', 'relation_types', 'expected_neighbourhood'],
+    [
+        (0, None, ['Submodel']),
+        (1, None, ['Submodel', 'Reference', 'Referable', 'HasSemantics', 'Environment']),
+        (1, [RelType.INHERITANCE], ['Submodel', 'Referable', 'HasSemantics']),
+        (
+            2,
+            [RelType.INHERITANCE, RelType.DEPENDENCY],
+            ['Submodel', 'Reference', 'Referable', 'HasSemantics', 'Environment', 'Key'],
+        ),
+        (10, [RelType.REFERENCE], ['Submodel', 'Environment', 'Referable']),
+    ],
+)
+def test_get_neighbourhood(
+    generator: AasPumlGenerator, hops: int, relation_types: Optional[List[RelType]], expected_neighbourhood: List[str]
+):
+    neighbourhood = generator.get_neighbourhood([SUBMODEL_FQN], hops, relation_types)
+
+    assert neighbourhood == [f'{V1_FQN_PREFIX}{class_name}' for class_name in expected_neighbourhood]
+
+
+def test_generate_puml_draws_the_neighbourhood_of_the_seeds(generator: AasPumlGenerator):
+    neighbourhood = generator.get_neighbourhood([REFERENCE_FQN], 1, [RelType.DEPENDENCY])
+
+    assert generator.generate_puml([REFERENCE_FQN], hops=1, relation_types=[RelType.DEPENDENCY]) == (
+        generator.generate_puml(neighbourhood)
+    )
+    assert generator.generate_puml([REFERENCE_FQN], hops=0) == generator.generate_puml([REFERENCE_FQN])
+
+
+def test_generate_partitioned_pumls_draws_the_related_items_of_other_clusters_as_stubs(generator: AasPumlGenerator):
+    partitioned_pumls = generator.generate_partitioned_pumls(4)
+
+    partitioned_fqns = [fqn for cluster_fqns, _ in partitioned_pumls for fqn in cluster_fqns]
+    assert sorted(partitioned_fqns) == sorted(generator.domain_items)
+    assert all(len(cluster_fqns) <= 4 for cluster_fqns, _ in partitioned_pumls)
+
+    submodel_puml = next(puml for cluster_fqns, puml in partitioned_pumls if SUBMODEL_FQN not in cluster_fqns)
+    assert '\nclass Submodel {\n}\n' in submodel_puml, 'the Submodel class of another cluster is drawn as a stub'
+
+
+def test_generate_puml_applies_the_idta_changes_to_the_fragments_as_to_the_whole_content(generator: AasPumlGenerator):
+    whole_puml_content = ''.join(
+        to_puml_content(AAS_DOMAIN_MODULE, generator.domain_items.values(), generator.domain_relations)
+    ).removesuffix('\n')
+
+    assert generator.generate_puml() == generator._apply_changes_to_puml_content(whole_puml_content)
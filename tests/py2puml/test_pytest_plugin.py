@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from pytest import raises
+
+from pyaas2puml.asserts import assert_puml_is_file_content
+from pyaas2puml.py2puml import py2puml
+from pyaas2puml.pytest_plugin import InspectedModelsCache
+
+
+def test_inspected_models_fixture_is_shared_by_the_session(inspected_models: InspectedModelsCache, request):
+    assert isinstance(inspected_models, InspectedModelsCache)
+    assert request.getfixturevalue('inspected_models') is inspected_models
+
+
+def test_inspected_models_cache_inspects_each_domain_once():
+    inspected_models = InspectedModelsCache()
+    inspected_model = inspected_models.get_model('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    # the trailing separator of the domain path does not change the cached model
+    assert inspected_models.get_model('tests/modules/withsubdomain/', 'tests.modules.withsubdomain') is inspected_model
+    assert list(inspected_model.items_by_fqn.keys()) == [
+        'tests.modules.withsubdomain.subdomain.insubdomain.Engine',
+        'tests.modules.withsubdomain.subdomain.insubdomain.Pilot',
+        'tests.modules.withsubdomain.withsubdomain.Car',
+    ]
+    assert len(inspected_model.relations) == 1
+
+    inspected_models.clear()
+    assert (
+        inspected_models.get_model('tests/modules/withsubdomain', 'tests.modules.withsubdomain') is not inspected_model
+    )
+
+
+def test_inspected_model_containers_are_frozen(inspected_models: InspectedModelsCache):
+    # only the containers are frozen: the items and relations they share with the other tests remain mutable
+    inspected_model = inspected_models.get_model('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    with raises(TypeError):
+        inspected_model.items_by_fqn['tests.modules.withsubdomain.Other'] = None
+    with raises(AttributeError):
+        inspected_model.relations.append(None)
+
+
+def test_inspected_models_py2puml_is_py2puml(inspected_models: InspectedModelsCache):
+    domain_path, domain_module = 'tests/modules/withnestednamespace', 'tests.modules.withnestednamespace'
+    expected_puml_content = ''.join(py2puml(domain_path, domain_module))
+
+    # the cached model renders the same contents at each call
+    assert ''.join(inspected_models.py2puml(domain_path, domain_module)) == expected_puml_content
+    assert ''.join(inspected_models.py2puml(domain_path, domain_module)) == expected_puml_content
+
+
+def test_assert_puml_is_file_content_with_inspected_models(inspected_models: InspectedModelsCache, tmp_path: Path):
+    domain_path, domain_module = 'tests/modules/withpkginitonly', 'tests.modules.withpkginitonly'
+    domain_diagram_file_path = tmp_path / f'{domain_module}.puml'
+    domain_diagram_file_path.write_text(''.join(py2puml(domain_path, domain_module)), encoding='utf8')
+
+    assert_puml_is_file_content(inspected_models.py2puml(domain_path, domain_module), domain_diagram_file_path)
+
+    domain_diagram_file_path.write_text('@startuml\n@enduml\n', encoding='utf8')
+    with raises(AssertionError, match='actual and expected contents have changed at line 2'):
+        assert_puml_is_file_content(inspected_models.py2puml(domain_path, domain_module), domain_diagram_file_path)
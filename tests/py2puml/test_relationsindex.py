@@ -0,0 +1,55 @@
+from typing import List
+
+from pyaas2puml.domain.umlrelation import RelType, UmlRelation
+from pyaas2puml.relationsindex import RelationsIndex, indexes_to_bitset
+
+
+def build_domain_relations() -> List[UmlRelation]:
+    return [
+        UmlRelation('domain.Referable', 'domain.Submodel', RelType.INHERITANCE),
+        UmlRelation('domain.Environment', 'domain.Submodel', RelType.COMPOSITION),
+        UmlRelation('domain.Submodel', 'domain.Reference', RelType.DEPENDENCY),
+        UmlRelation('domain.HasSemantics', 'domain.Submodel', RelType.INHERITANCE),
+        UmlRelation('domain.Submodel', 'domain.Submodel', RelType.REFERENCE, label='derivedFrom:ref'),
+    ]
+
+
+def test_indexes_to_bitset():
+    assert indexes_to_bitset([]) == 0
+    assert indexes_to_bitset([0, 2, 5]) == 0b100101
+
+
+def test_relations_index_bitsets():
+    relations_index = RelationsIndex(build_domain_relations())
+
+    assert relations_index.get_sources_bitset(['domain.Submodel']) == 0b10100
+    assert relations_index.get_targets_bitset(['domain.Submodel']) == 0b11011
+    assert relations_index.get_sources_bitset(['domain.Referable', 'domain.Environment']) == 0b00011
+    assert relations_index.get_targets_bitset(['domain.Missing']) == 0
+    assert relations_index.inheritances_bitset == 0b01001
+
+
+def test_iter_relations_in_the_order_of_the_domain_relations():
+    domain_relations = build_domain_relations()
+    relations_index = RelationsIndex(domain_relations)
+
+    assert list(relations_index.iter_relations(0)) == []
+    assert list(relations_index.iter_relations(0b11001)) == [
+        domain_relations[0],
+        domain_relations[3],
+        domain_relations[4],
+    ]
+
+
+def test_select_the_relations_between_items():
+    domain_relations = build_domain_relations()
+    relations_index = RelationsIndex(domain_relations)
+    kept_fqns = ['domain.Submodel', 'domain.Referable', 'domain.Reference']
+
+    kept_relations_bitset = relations_index.get_sources_bitset(kept_fqns)
+    kept_relations_bitset &= relations_index.get_targets_bitset(kept_fqns)
+    assert list(relations_index.iter_relations(kept_relations_bitset)) == [
+        relation
+        for relation in domain_relations
+        if relation.source_fqn in kept_fqns and relation.target_fqn in kept_fqns
+    ]
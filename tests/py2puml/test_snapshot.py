@@ -0,0 +1,123 @@
+from dataclasses import replace
+from pathlib import Path
+from shutil import copytree
+from typing import Dict, List
+
+from pytest import MonkeyPatch
+
+from pyaas2puml.domain.umlclass import UmlClass
+from pyaas2puml.domain.umlitem import UmlItem
+from pyaas2puml.domain.umlrelation import UmlRelation
+from pyaas2puml.inspection.inspectpackage import inspect_package
+from pyaas2puml.pyaas2puml import AasPumlGenerator
+from pyaas2puml.snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    SnapshotHeader,
+    build_snapshot_header,
+    hash_domain_sources,
+    load_snapshot,
+    save_snapshot,
+)
+
+from tests.py2puml.test_pyaas2puml import AAS_DOMAIN_MODULE, AAS_DOMAIN_PATH, SUBMODEL_FQN
+
+
+def test_hash_domain_sources_changes_with_the_domain_sources(tmp_path: Path):
+    domain_path = tmp_path / 'withaasmeta'
+    copytree(AAS_DOMAIN_PATH, domain_path)
+    sources_hash = hash_domain_sources(domain_path)
+    assert hash_domain_sources(domain_path) == sources_hash
+
+    v1_module_path = domain_path / 'v1.py'
+    v1_module_path.write_text(v1_module_path.read_text(encoding='utf8') + '\n# modified\n', encoding='utf8')
+    assert hash_domain_sources(domain_path) != sources_hash
+
+
+def test_load_snapshot_returns_the_saved_model_without_the_class_types(tmp_path: Path):
+    snapshot_path = tmp_path / 'model.snapshot'
+    header = build_snapshot_header('test', AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v1'])
+    assert header.format_version == SNAPSHOT_FORMAT_VERSION
+    assert header.domain_submodules == ('v1',)
+
+    domain_items_by_fqn: Dict[str, UmlItem] = {}
+    domain_relations: List[UmlRelation] = []
+    inspect_package(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, domain_items_by_fqn, domain_relations, ['v1'])
+    save_snapshot(snapshot_path, header, domain_items_by_fqn, domain_relations)
+    assert domain_items_by_fqn[SUBMODEL_FQN].class_type is not None, 'the saved model must be left unchanged'
+
+    snapshot_items_by_fqn, snapshot_relations = load_snapshot(snapshot_path, header)
+    assert list(snapshot_items_by_fqn) == list(domain_items_by_fqn)
+    assert snapshot_relations == domain_relations
+    for fqn, snapshot_item in snapshot_items_by_fqn.items():
+        domain_item = domain_items_by_fqn[fqn]
+        if isinstance(domain_item, UmlClass):
+            assert snapshot_item.class_type is None
+            assert snapshot_item.attributes == domain_item.attributes
+            assert snapshot_item.is_abstract == domain_item.is_abstract
+        else:
+            assert snapshot_item == domain_item
+
+
+def test_load_snapshot_ignores_missing_and_outdated_snapshots(tmp_path: Path):
+    snapshot_path = tmp_path / 'model.snapshot'
+    header = SnapshotHeader(SNAPSHOT_FORMAT_VERSION, 'test', AAS_DOMAIN_MODULE, None, 'sources-hash')
+    assert load_snapshot(snapshot_path, header) is None
+
+    save_snapshot(snapshot_path, header, {}, [])
+    assert load_snapshot(snapshot_path, header) == ({}, [])
+    assert load_snapshot(snapshot_path, replace(header, format_version=SNAPSHOT_FORMAT_VERSION + 1)) is None
+    assert load_snapshot(snapshot_path, replace(header, model_kind='other')) is None
+    assert load_snapshot(snapshot_path, replace(header, sources_hash='other-sources-hash')) is None
+
+    snapshot_path.write_bytes(b'not a snapshot')
+    assert load_snapshot(snapshot_path, header) is None
+
+
+def test_inspect_package_loads_the_up_to_date_snapshot(tmp_path: Path, monkeypatch: MonkeyPatch):
+    snapshot_path = tmp_path / 'model.snapshot'
+    inspected_items_by_fqn: Dict[str, UmlItem] = {}
+    inspected_relations: List[UmlRelation] = []
+    inspect_package(
+        AAS_DOMAIN_PATH,
+        AAS_DOMAIN_MODULE,
+        inspected_items_by_fqn,
+        inspected_relations,
+        ['v1'],
+        snapshot_path=snapshot_path,
+    )
+    assert snapshot_path.is_file()
+
+    def fail_iter_package(*args, **kwargs):
+        raise AssertionError('the domain must not be inspected when the snapshot is up-to-date')
+
+    monkeypatch.setattr('pyaas2puml.inspection.inspectpackage.iter_package', fail_iter_package)
+    snapshot_items_by_fqn: Dict[str, UmlItem] = {}
+    snapshot_relations: List[UmlRelation] = []
+    inspect_package(
+        AAS_DOMAIN_PATH,
+        AAS_DOMAIN_MODULE,
+        snapshot_items_by_fqn,
+        snapshot_relations,
+        ['v1'],
+        snapshot_path=snapshot_path,
+    )
+    assert list(snapshot_items_by_fqn) == list(inspected_items_by_fqn)
+    assert snapshot_relations == inspected_relations
+
+
+def test_generator_renders_the_same_diagrams_from_the_snapshot(tmp_path: Path, monkeypatch: MonkeyPatch):
+    snapshot_path = tmp_path / 'model.snapshot'
+    inspecting_generator = AasPumlGenerator(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v1'], snapshot_path=snapshot_path)
+    assert snapshot_path.is_file()
+
+    def fail_inspect_package(self):
+        raise AssertionError('the domain must not be inspected when the snapshot is up-to-date')
+
+    monkeypatch.setattr(AasPumlGenerator, '_inspect_package', fail_inspect_package)
+    snapshot_generator = AasPumlGenerator(AAS_DOMAIN_PATH, AAS_DOMAIN_MODULE, ['v1'], snapshot_path=snapshot_path)
+
+    assert snapshot_generator.generate_puml() == inspecting_generator.generate_puml()
+    submodel_fqns = [fqn for fqn in snapshot_generator.domain_items if fqn.endswith('.Submodel')]
+    assert snapshot_generator.generate_puml(
+        submodel_fqns, to_include_members_from_parents=True
+    ) == inspecting_generator.generate_puml(submodel_fqns, to_include_members_from_parents=True)
@@ -0,0 +1,36 @@
+from pytest import mark
+
+from pyaas2puml.utils import camel_to_kebab, plural_attribute_to_singular, snake_to_camel, snake_to_kebab
+
+
+@mark.parametrize(
+    ['snake_str', 'expected_camel_str'],
+    [
+        ('Asset_administration_shell', 'AssetAdministrationShell'),
+        ('aas_core_meta.v3_1.Specific_asset_ID', 'aasCoreMeta.v3_1.SpecificAssetId'),
+        ('Data_type_def_XSD', 'DataTypeDefXsd'),
+        ('Data_specification_IEC_61360', 'DataSpecificationIec61360'),
+        ('AAS_submodel_elements', 'AasSubmodelElements'),
+        ('semantic_ID', 'semanticId'),
+        ('Reference', 'Reference'),
+        ('', ''),
+    ],
+)
+def test_snake_to_camel(snake_str: str, expected_camel_str: str):
+    assert snake_to_camel(snake_str) == expected_camel_str
+
+
+@mark.parametrize(
+    ['text', 'expected_singular_text'],
+    [('keys', 'key'), ('submodelElements', 'submodelElement'), ('is', 'is'), ('value', 'value')],
+)
+def test_plural_attribute_to_singular(text: str, expected_singular_text: str):
+    assert plural_attribute_to_singular(text) == expected_singular_text
+
+
+def test_snake_to_kebab():
+    assert snake_to_kebab('aas_core_meta') == 'aas-core-meta'
+
+
+def test_camel_to_kebab():
+    assert camel_to_kebab('AssetAdministrationShell') == 'asset-administration-shell'